@@ -20,11 +20,15 @@ import awkward._do
 import awkward._slicing
 import awkward._broadcasting
 import awkward._reducers
+import awkward._nplikes.numpy_sorting
+import awkward._carry
 import awkward._util
 import awkward._errors
 import awkward._lookup
 import awkward._ext  # strictly for unpickling from Awkward 1
 import awkward._namedaxis
+import awkward._parallel
+import awkward._profiling
 
 # third-party connectors
 import awkward._connect.numpy
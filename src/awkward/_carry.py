@@ -0,0 +1,184 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+"""
+Lazy carries of RecordArrays: when they are compacted, and how many there were.
+
+Selecting records (`RecordArray._carry` with `allow_lazy`) does not select the
+values of any field; it wraps the RecordArray in an IndexedArray. Selecting from
+that IndexedArray composes the indexes, so the IndexedArrays do not nest, but
+every use of a field applies the composed index to it again
+(`IndexedArray.project`), and all of the unselected records are kept.
+
+If a selection keeps at most `selectivity` of the records that it selects from,
+it is compacted instead: the result is a RecordArray of the selected records
+whose buffers are VirtualArrays, so each field is only selected when it is first
+used, and then kept. Compacting a field that has not been used yet composes its
+index with the new one (once for all of the fields that share it), rather than
+chaining the selections. See #ak.lazy_carries.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import awkward as ak
+from awkward._nplikes.virtual import VirtualArray
+from awkward._parameters import parameters_union
+
+# Compact a lazy carry that keeps at most this fraction of the records (0 never
+# compacts; 1 always does)
+selectivity = 0.0
+
+# Events counted while any ak.lazy_carries object is observing them
+counts = {
+    # RecordArrays wrapped in an IndexedArray by a selection
+    "lazy": 0,
+    # selections from an IndexedArray of records, which compose the indexes
+    "composed": 0,
+    # selections that were compacted into a RecordArray
+    "compacted": 0,
+    # IndexedArrays whose index was applied to their content
+    "resolved": 0,
+    # buffers of compacted RecordArrays that were selected when first used
+    "buffers": 0,
+}
+_lock = threading.Lock()
+# Number of ak.lazy_carries objects that are observing the counts; if none are,
+# counting (and its lock) is skipped
+_observers = 0
+
+
+def observe(start: bool) -> None:
+    global _observers
+    with _lock:
+        _observers += 1 if start else -1
+
+
+def count(name: str) -> None:
+    if _observers == 0:
+        return
+    with _lock:
+        counts[name] += 1
+
+
+def should_compact(index, content) -> bool:
+    return (
+        selectivity > 0
+        and content.backend.nplike.known_data
+        and index.length <= selectivity * content.length
+    )
+
+
+def compact(record, index, parameters=None):
+    """
+    Returns the records of `record` at `index` (which must be non-negative and in
+    bounds) as a RecordArray whose buffers are selected when they are first used.
+    """
+    count("compacted")
+    return _compact(record, index, parameters, {})
+
+
+def _compact(record, index, parameters, composed):
+    return ak.contents.RecordArray(
+        [
+            _select_on_use(record.content(i), index, composed)
+            for i in range(len(record.fields))
+        ],
+        record._fields,
+        index.length,
+        parameters=parameters_union(record._parameters, parameters),
+        backend=record.backend,
+    )
+
+
+def _select_on_use(content, index, composed):
+    if isinstance(content, ak.contents.NumpyArray):
+        nplike = content.backend.nplike
+        return ak.contents.NumpyArray(
+            _selection(content.data, index, nplike, composed),
+            parameters=content._parameters,
+            backend=content.backend,
+        )
+
+    elif isinstance(content, (ak.contents.ListOffsetArray, ak.contents.ListArray)):
+        nplike = content.backend.index_nplike
+        starts, stops = content.starts, content.stops
+        return ak.contents.ListArray(
+            type(starts)(
+                _selection(starts.data, index, nplike, composed), nplike=nplike
+            ),
+            type(stops)(_selection(stops.data, index, nplike, composed), nplike=nplike),
+            content.content,
+            parameters=content._parameters,
+        )
+
+    elif isinstance(content, ak.contents.RecordArray):
+        return _compact(content, index, None, composed)
+
+    else:
+        return content._carry(index, True)
+
+
+def _selection(data, index, nplike, composed):
+    unselected = data.unselected() if isinstance(data, Selection) else None
+    if unselected is not None:
+        # Select from the original buffer with the composition of the indexes
+        # (composed once for each distinct index)
+        base, previous = unselected
+        key = id(previous)
+        if key not in composed:
+            composed[key] = (previous, previous[index.data])
+        index = composed[key][1]
+        data = base
+    return Selection(data, index, nplike)
+
+
+class Selection(VirtualArray):
+    """
+    The VirtualArray of `base[index]`, for a field of a compacted RecordArray.
+    """
+
+    def __init__(self, base, index, nplike):
+        def generate():
+            count("buffers")
+            return nplike.asarray(base)[nplike.asarray(index.data)]
+
+        super().__init__(nplike, (index.length, *base.shape[1:]), base.dtype, generate)
+        self._base = base
+        self._index = index
+
+    @property
+    def base(self):
+        return self._base
+
+    @property
+    def index(self):
+        return self._index
+
+    def __getitem__(self, where):
+        if (
+            isinstance(where, slice)
+            and where.step in (None, 1)
+            and where.indices(self._shape[0])[:2] == (0, self._shape[0])
+        ):
+            # All of it: the same selection, so that compacting it again can
+            # compose its index
+            return self
+        else:
+            return super().__getitem__(where)
+
+    def unselected(self):
+        """
+        Returns `(base, index)` if the selection has not been made yet, or None.
+        """
+        with self._lock:
+            if self._array is None:
+                return self._base, self._index
+            else:
+                return None
+
+    def _materialize(self):
+        # (called with the lock held, so no other thread is still selecting)
+        array = super()._materialize()
+        # The selection is made, so the base and the index are no longer needed
+        self._base = self._index = None
+        return array
@@ -0,0 +1,202 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+"""
+Lossless compression of the buffers of #ak.to_buffers.
+
+An encoded buffer is a bytes object: a magic string, the size of a JSON header,
+the header (codec name, filters, dtype, and size of the raw data), and the
+compressed data. Whether the buffers of a container are encoded is not guessed
+from their contents; it is passed to #ak.from_buffers as its `compression`. Before compression, integer buffers whose
+values never decrease (such as list offsets) are delta-encoded, and the bytes of
+all multi-byte values are shuffled (grouped by their significance), which makes
+them much more compressible.
+"""
+
+from __future__ import annotations
+
+import bz2
+import json
+import lzma
+import struct
+import zlib
+from dataclasses import dataclass
+
+from awkward._nplikes.numpy import Numpy
+from awkward._nplikes.numpy_like import NumpyMetadata
+from awkward._typing import Any, Callable
+
+np = NumpyMetadata.instance()
+numpy = Numpy.instance()
+
+_magic = b"\x00akcodec"
+_header_size = struct.Struct("<I")
+
+
+@dataclass(frozen=True)
+class Codec:
+    name: str
+    compress: Callable[[bytes, int | None], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _zlib_compress(data, level):
+    return zlib.compress(data, -1 if level is None else level)
+
+
+def _lzma_compress(data, level):
+    return lzma.compress(data, preset=level)
+
+
+def _bz2_compress(data, level):
+    return bz2.compress(data, 9 if level is None else level)
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ModuleNotFoundError as err:
+        raise ImportError(
+            """to use the "zstd" codec, you must install zstandard:
+
+    pip install zstandard
+
+or
+
+    conda install -c conda-forge zstandard
+"""
+        ) from err
+    return zstandard
+
+
+def _zstd_compress(data, level):
+    zstandard = _import_zstandard()
+    return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+
+
+def _zstd_decompress(data):
+    return _import_zstandard().ZstdDecompressor().decompress(data)
+
+
+def _import_lz4_frame():
+    try:
+        import lz4.frame
+    except ModuleNotFoundError as err:
+        raise ImportError(
+            """to use the "lz4" codec, you must install lz4:
+
+    pip install lz4
+
+or
+
+    conda install -c conda-forge lz4
+"""
+        ) from err
+    return lz4.frame
+
+
+def _lz4_compress(data, level):
+    return _import_lz4_frame().compress(
+        data, compression_level=0 if level is None else level
+    )
+
+
+def _lz4_decompress(data):
+    return _import_lz4_frame().decompress(data)
+
+
+codecs: dict[str, Codec] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    """
+    Makes `codec` available by name to #ak.to_buffers (for encoding) and
+    #ak.from_buffers (for decoding).
+    """
+    codecs[codec.name] = codec
+
+
+register_codec(Codec("zlib", _zlib_compress, zlib.decompress))
+register_codec(Codec("lzma", _lzma_compress, lzma.decompress))
+register_codec(Codec("bz2", _bz2_compress, bz2.decompress))
+register_codec(Codec("zstd", _zstd_compress, _zstd_decompress))
+register_codec(Codec("lz4", _lz4_compress, _lz4_decompress))
+
+
+def get_codec(name: str) -> Codec:
+    try:
+        return codecs[name]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"unrecognized compression codec {name!r}; "
+            f"must be one of {', '.join(map(repr, codecs))}"
+        ) from None
+
+
+def encode(array: Any, codec: Codec, level: int | None = None) -> bytes:
+    array = numpy.ascontiguousarray(array).reshape(-1)
+    dtype = array.dtype
+
+    filters = []
+    if (
+        dtype.kind in "iu"
+        and len(array) > 1
+        and bool(numpy.all(array[1:] >= array[:-1]))
+    ):
+        # The first difference is the first value; integer overflow wraps
+        # around and is undone by the cumulative sum when decoding.
+        delta = numpy.empty(len(array), dtype=dtype)
+        delta[0] = array[0]
+        delta[1:] = array[1:] - array[:-1]
+        array = delta
+        filters.append("delta")
+    if dtype.itemsize > 1:
+        array = array.view(np.uint8).reshape(-1, dtype.itemsize).T
+        filters.append("shuffle")
+
+    raw = numpy.ascontiguousarray(array).tobytes()
+    header = json.dumps(
+        {
+            "codec": codec.name,
+            "filters": filters,
+            "dtype": dtype.str,
+            "nbytes": len(raw),
+        }
+    ).encode("utf-8")
+    return b"".join(
+        [_magic, _header_size.pack(len(header)), header, codec.compress(raw, level)]
+    )
+
+
+def decode(buffer: Any, codec: Codec) -> memoryview:
+    buffer = memoryview(buffer).cast("B")
+    start = len(_magic) + _header_size.size
+    if len(buffer) < start or bytes(buffer[: len(_magic)]) != _magic:
+        raise ValueError(
+            f"buffer was not compressed by ak.to_buffers(..., compression={codec.name!r})"
+        )
+    (size,) = _header_size.unpack(buffer[len(_magic) : start])
+    header = json.loads(bytes(buffer[start : start + size]).decode("utf-8"))
+    if header["codec"] != codec.name:
+        raise ValueError(
+            f"buffer was compressed with {header['codec']!r}, not {codec.name!r}"
+        )
+
+    raw = codec.decompress(buffer[start + size :])
+    if len(raw) != header["nbytes"]:
+        raise ValueError(
+            f"decompressed buffer has {len(raw)} bytes, but {header['nbytes']} were encoded"
+        )
+
+    dtype = np.dtype(header["dtype"])
+    array = numpy.frombuffer(raw, dtype=np.uint8)
+    if "shuffle" in header["filters"]:
+        array = array.reshape(dtype.itemsize, -1).T
+    array = numpy.ascontiguousarray(array).view(dtype)
+    if "delta" in header["filters"]:
+        # accumulating in `dtype` wraps around as the encoded differences did
+        array = numpy.cumsum(array, maybe_out=numpy.empty(len(array), dtype=dtype))
+    array = numpy.ascontiguousarray(array).reshape(-1)
+    if len(array) == 0:
+        return memoryview(b"")
+    else:
+        return memoryview(array).cast("B")
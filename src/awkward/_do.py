@@ -317,6 +317,7 @@ def argsort(
     axis: int = -1,
     ascending: bool = True,
     stable: bool = False,
+    kind: str | None = None,
 ) -> Content:
     negaxis = -axis
     branch, depth = layout.branch_depth
@@ -351,11 +352,16 @@ def argsort(
         1,
         ascending,
         stable,
+        kind,
     )
 
 
 def sort(
-    layout: Content, axis: int = -1, ascending: bool = True, stable: bool = False
+    layout: Content,
+    axis: int = -1,
+    ascending: bool = True,
+    stable: bool = False,
+    kind: str | None = None,
 ) -> Content:
     negaxis = -axis
     branch, depth = layout.branch_depth
@@ -382,7 +388,7 @@ def sort(
 
     starts = ak.index.Index64.zeros(1, nplike=layout.backend.index_nplike)
     parents = ak.index.Index64.zeros(layout.length, nplike=layout.backend.index_nplike)
-    return layout._sort_next(negaxis, starts, parents, 1, ascending, stable)
+    return layout._sort_next(negaxis, starts, parents, 1, ascending, stable, kind)
 
 
 def touch_data(layout: Content, recursive: bool = True):
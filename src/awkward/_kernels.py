@@ -12,6 +12,7 @@ from awkward._nplikes.jax import Jax
 from awkward._nplikes.numpy import Numpy
 from awkward._nplikes.numpy_like import NumpyMetadata
 from awkward._nplikes.typetracer import try_touch_data
+from awkward._nplikes.virtual import VirtualArray
 from awkward._typing import Protocol, TypeAlias
 
 KernelKeyType: TypeAlias = tuple  # Tuple[str, Unpack[Tuple[metadata.dtype, ...]]]
@@ -68,6 +69,9 @@ class NumpyKernel(BaseKernel):
     @classmethod
     def _cast(cls, x, t):
         if issubclass(t, ctypes._Pointer):
+            # Kernels need the values of virtual arrays
+            if isinstance(x, VirtualArray):
+                x = x.materialize()
             # Do we have a NumPy-owned array?
             if numpy.is_own_array(x):
                 assert numpy.is_c_contiguous(x), "kernel expects contiguous array"
@@ -85,13 +89,27 @@ class NumpyKernel(BaseKernel):
         else:
             return x
 
-    def __call__(self, *args) -> None:
-        assert len(args) == len(self._impl.argtypes)
-
+    def _call(self, args):
         return self._impl(
             *(self._cast(x, t) for x, t in zip(args, self._impl.argtypes))
         )
 
+    def _dispatch(self, args):
+        # Some kernels can be split into independent calls on ranges of lists
+        tasks = ak._parallel.split(self._key[0], args)
+        if tasks is not None:
+            return ak._parallel.run(self._call, tasks)
+
+        return self._call(args)
+
+    def __call__(self, *args) -> None:
+        assert len(args) == len(self._impl.argtypes)
+
+        if ak._profiling.recorders:
+            return ak._profiling.timed(self._key, args, lambda: self._dispatch(args))
+
+        return self._dispatch(args)
+
 
 class JaxKernel(NumpyKernel):
     def __call__(self, *args) -> None:
@@ -136,6 +154,13 @@ class CupyKernel(BaseKernel):
             return x
 
     def __call__(self, *args) -> None:
+        if ak._profiling.recorders:
+            # Kernels are launched asynchronously, so this is the time to launch
+            return ak._profiling.timed(self._key, args, lambda: self._launch(args))
+
+        return self._launch(args)
+
+    def _launch(self, args):
         import awkward._connect.cuda as ak_cuda
 
         cupy = ak_cuda.import_cupy("Awkward Arrays with CUDA")
@@ -7,6 +7,7 @@ import awkward._nplikes.jax
 import awkward._nplikes.numpy
 import awkward._nplikes.typetracer
 from awkward._nplikes.dispatch import nplike_of_obj
+from awkward._nplikes.virtual import VirtualArray
 from awkward._typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,6 +18,10 @@ from awkward._nplikes.array_like import ArrayLike
 def to_nplike(
     array: ArrayLike, nplike: NumpyLike, *, from_nplike: NumpyLike | None = None
 ) -> ArrayLike:
+    # Arrays that leave a layout (or its backend) are no longer lazy
+    if isinstance(array, VirtualArray):
+        array = array.materialize()
+
     if from_nplike is None:
         from_nplike = nplike_of_obj(array, default=None)
         if from_nplike is None:
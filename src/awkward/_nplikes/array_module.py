@@ -16,6 +16,7 @@ from awkward._nplikes.numpy_like import (
 )
 from awkward._nplikes.placeholder import PlaceholderArray
 from awkward._nplikes.shape import ShapeItem, unknown_length
+from awkward._nplikes.virtual import VirtualArray
 from awkward._typing import TYPE_CHECKING, Any, DType, Final, Literal, TypeVar, cast
 
 if TYPE_CHECKING:
@@ -57,7 +58,12 @@ class ArrayModuleNumpyLike(NumpyLike[ArrayLikeT]):
         if isinstance(obj, PlaceholderArray):
             assert obj.dtype == dtype or dtype is None
             return obj
-        elif copy:
+        elif isinstance(obj, VirtualArray):
+            if not copy and (dtype is None or obj.dtype == dtype):
+                return obj
+            obj = obj.materialize()
+
+        if copy:
             return self._module.array(obj, dtype=dtype, copy=True)
         elif copy is None:
             return self._module.asarray(obj, dtype=dtype)
@@ -72,7 +78,7 @@ class ArrayModuleNumpyLike(NumpyLike[ArrayLikeT]):
     def ascontiguousarray(
         self, x: ArrayLikeT | PlaceholderArray
     ) -> ArrayLikeT | PlaceholderArray:
-        if isinstance(x, PlaceholderArray):
+        if isinstance(x, (PlaceholderArray, VirtualArray)):
             return x
         else:
             return self._module.ascontiguousarray(x)
@@ -82,6 +88,8 @@ class ArrayModuleNumpyLike(NumpyLike[ArrayLikeT]):
     ) -> ArrayLikeT:
         if isinstance(buffer, PlaceholderArray):
             raise TypeError("placeholder arrays are not supported in `frombuffer`")
+        elif isinstance(buffer, VirtualArray):
+            buffer = buffer.materialize()
         return self._module.frombuffer(buffer, dtype=dtype, count=count)
 
     def from_dlpack(self, x: Any) -> ArrayLikeT:
@@ -123,7 +131,7 @@ class ArrayModuleNumpyLike(NumpyLike[ArrayLikeT]):
     def zeros_like(
         self, x: ArrayLikeT | PlaceholderArray, *, dtype: DTypeLike | None = None
     ) -> ArrayLikeT:
-        if isinstance(x, PlaceholderArray):
+        if isinstance(x, (PlaceholderArray, VirtualArray)):
             return self.zeros(x.shape, dtype=dtype or x.dtype)
         else:
             return self._module.zeros_like(x, dtype=dtype)
@@ -131,7 +139,7 @@ class ArrayModuleNumpyLike(NumpyLike[ArrayLikeT]):
     def ones_like(
         self, x: ArrayLikeT | PlaceholderArray, *, dtype: DTypeLike | None = None
     ) -> ArrayLikeT:
-        if isinstance(x, PlaceholderArray):
+        if isinstance(x, (PlaceholderArray, VirtualArray)):
             return self.ones(x.shape, dtype=dtype or x.dtype)
         else:
             return self._module.ones_like(x, dtype=dtype)
@@ -143,7 +151,7 @@ class ArrayModuleNumpyLike(NumpyLike[ArrayLikeT]):
         *,
         dtype: DTypeLike | None = None,
     ) -> ArrayLikeT:
-        if isinstance(x, PlaceholderArray):
+        if isinstance(x, (PlaceholderArray, VirtualArray)):
             return self.full(x.shape, fill_value, dtype=dtype or x.dtype)
         else:
             return self._module.full_like(
@@ -307,6 +315,16 @@ class ArrayModuleNumpyLike(NumpyLike[ArrayLikeT]):
         if isinstance(x, PlaceholderArray):
             next_shape = self._compute_compatible_shape(shape, x.shape)
             return PlaceholderArray(self, next_shape, x.dtype, x._field_path)
+        elif isinstance(x, VirtualArray):
+            if not copy and not x.is_materialized:
+                return x._derive(
+                    lambda existing_shape: self._compute_compatible_shape(
+                        shape, existing_shape
+                    ),
+                    lambda: self.reshape(x.materialize(), shape, copy=copy),
+                    x.dtype,
+                )
+            x = x.materialize()
 
         if copy is None:
             return self._module.reshape(x, shape)
@@ -502,7 +520,9 @@ class ArrayModuleNumpyLike(NumpyLike[ArrayLikeT]):
         return self._module.broadcast_to(x, shape)
 
     def strides(self, x: ArrayLikeT | PlaceholderArray) -> tuple[ShapeItem, ...]:
-        if isinstance(x, PlaceholderArray):
+        if isinstance(x, VirtualArray):
+            return x.strides
+        elif isinstance(x, PlaceholderArray):
             # Assume contiguous
             strides: tuple[ShapeItem, ...] = (x.dtype.itemsize,)
             for item in x.shape[-1:0:-1]:
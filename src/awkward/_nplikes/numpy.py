@@ -8,13 +8,22 @@ from awkward._nplikes.array_module import ArrayModuleNumpyLike
 from awkward._nplikes.dispatch import register_nplike
 from awkward._nplikes.numpy_like import NumpyMetadata
 from awkward._nplikes.placeholder import PlaceholderArray
+from awkward._nplikes.shape import ShapeItem
+from awkward._nplikes.virtual import VirtualArray
 from awkward._typing import TYPE_CHECKING, Final, Literal
 
 if TYPE_CHECKING:
-    from numpy.typing import NDArray
+    from collections.abc import Callable
+
+    from numpy.typing import DTypeLike, NDArray
 
 np = NumpyMetadata.instance()
 
+# While an ak.profile is recording, awkward._profiling sets this to a function
+# that is called with each buffer made by the array-creation functions below and
+# the name of the function that made it
+on_allocation: Callable[[NDArray, str], None] | None = None
+
 
 @register_nplike
 class Numpy(ArrayModuleNumpyLike["NDArray"]):
@@ -48,7 +57,7 @@ class Numpy(ArrayModuleNumpyLike["NDArray"]):
         return issubclass(type_, numpy.ndarray)
 
     def is_c_contiguous(self, x: NDArray | PlaceholderArray) -> bool:
-        if isinstance(x, PlaceholderArray):
+        if isinstance(x, (PlaceholderArray, VirtualArray)):
             return True
         else:
             return x.flags["C_CONTIGUOUS"]  # type: ignore[attr-defined]
@@ -73,3 +82,111 @@ class Numpy(ArrayModuleNumpyLike["NDArray"]):
     ):
         assert not isinstance(x, PlaceholderArray)
         return numpy.unpackbits(x, axis=axis, count=count, bitorder=bitorder)  # type: ignore[arg-type]
+
+    ############################ array creation, tracked by ak.profile
+
+    def asarray(
+        self,
+        obj,
+        *,
+        dtype: DTypeLike | None = None,
+        copy: bool | None = None,
+    ) -> NDArray | PlaceholderArray:
+        out = super().asarray(obj, dtype=dtype, copy=copy)
+        if (allocated := on_allocation) is not None and out is not obj:
+            allocated(out, "asarray")
+        return out
+
+    def ascontiguousarray(
+        self, x: NDArray | PlaceholderArray
+    ) -> NDArray | PlaceholderArray:
+        out = super().ascontiguousarray(x)
+        if (allocated := on_allocation) is not None and out is not x:
+            allocated(out, "ascontiguousarray")
+        return out
+
+    def zeros(
+        self,
+        shape: ShapeItem | tuple[ShapeItem, ...],
+        *,
+        dtype: DTypeLike | None = None,
+    ) -> NDArray:
+        out = super().zeros(shape, dtype=dtype)
+        if (allocated := on_allocation) is not None:
+            allocated(out, "zeros")
+        return out
+
+    def ones(
+        self,
+        shape: ShapeItem | tuple[ShapeItem, ...],
+        *,
+        dtype: DTypeLike | None = None,
+    ) -> NDArray:
+        out = super().ones(shape, dtype=dtype)
+        if (allocated := on_allocation) is not None:
+            allocated(out, "ones")
+        return out
+
+    def empty(
+        self,
+        shape: ShapeItem | tuple[ShapeItem, ...],
+        *,
+        dtype: DTypeLike | None = None,
+    ) -> NDArray:
+        out = super().empty(shape, dtype=dtype)
+        if (allocated := on_allocation) is not None:
+            allocated(out, "empty")
+        return out
+
+    def full(
+        self,
+        shape: ShapeItem | tuple[ShapeItem, ...],
+        fill_value,
+        *,
+        dtype: DTypeLike | None = None,
+    ) -> NDArray:
+        out = super().full(shape, fill_value, dtype=dtype)
+        if (allocated := on_allocation) is not None:
+            allocated(out, "full")
+        return out
+
+    def zeros_like(
+        self, x: NDArray | PlaceholderArray, *, dtype: DTypeLike | None = None
+    ) -> NDArray:
+        out = super().zeros_like(x, dtype=dtype)
+        if (allocated := on_allocation) is not None:
+            allocated(out, "zeros_like")
+        return out
+
+    def ones_like(
+        self, x: NDArray | PlaceholderArray, *, dtype: DTypeLike | None = None
+    ) -> NDArray:
+        out = super().ones_like(x, dtype=dtype)
+        if (allocated := on_allocation) is not None:
+            allocated(out, "ones_like")
+        return out
+
+    def full_like(
+        self,
+        x: NDArray | PlaceholderArray,
+        fill_value,
+        *,
+        dtype: DTypeLike | None = None,
+    ) -> NDArray:
+        out = super().full_like(x, fill_value, dtype=dtype)
+        if (allocated := on_allocation) is not None:
+            allocated(out, "full_like")
+        return out
+
+    def arange(
+        self,
+        start: float | int,
+        stop: float | int | None = None,
+        step: float | int = 1,
+        *,
+        dtype: DTypeLike | None = None,
+    ) -> NDArray:
+        out = super().arange(start, stop, step, dtype=dtype)
+        if (allocated := on_allocation) is not None:
+            allocated(out, "arange")
+        return out
@@ -0,0 +1,202 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+"""
+Sorting lists of numbers with NumPy, outside of the kernels: a radix sort for
+`ak.sort(..., kind="radix")` and `ak.argsort(..., kind="radix")`, and a partial
+selection of the first `k` values of each list for #ak.top_k and #ak.argtop_k.
+"""
+
+from __future__ import annotations
+
+import numpy
+
+from awkward._nplikes.numpy_like import NumpyMetadata
+
+np = NumpyMetadata.instance()
+
+# Number of bits of the key that each pass orders by: NumPy's stable sort of
+# 16-bit integers is itself a (single-pass) radix sort
+_digit_bits = 16
+
+# Number of values that top_k_argsort copies out of the lists at a time (unless
+# a single list is longer), which bounds its temporary arrays
+_top_k_block_size = 2**16
+
+
+def is_radix_sortable(dtype: np.dtype) -> bool:
+    return np.dtype(dtype).kind in "biumM"
+
+
+def radix_argsort(
+    values: numpy.ndarray,
+    offsets: numpy.ndarray,
+    ascending: bool,
+    local: bool,
+) -> numpy.ndarray:
+    """
+    Returns the positions that stably sort each list
+    `values[offsets[i]:offsets[i + 1]]` (for `offsets` that start at zero), as
+    positions in `values` or, if `local`, in each list (as `awkward_argsort` does).
+
+    The key of each value is its list number followed by its distance from the
+    smallest value, and the keys are sorted with a least-significant-digit radix
+    sort in passes of 16 bits. The time is proportional to the number of values
+    and the number of bits in the keys, so this is faster than a comparison sort
+    for long lists of integers in a small range, not for many short lists.
+    """
+    if values.dtype.kind in "mM":
+        values = values.view(np.int64)
+    offsets = numpy.asarray(offsets, dtype=np.int64)
+    counts = offsets[1:] - offsets[:-1]
+    if len(values) == 0:
+        return numpy.empty(0, dtype=np.int64)
+
+    # Non-negative distances from the smallest (or, if descending, largest) value
+    if values.dtype == np.bool_:
+        keys = values.astype(np.uint64)
+    elif values.dtype.kind == "i":
+        keys = (values.astype(np.int64) - int(values.min())).astype(np.uint64)
+    else:
+        keys = values.astype(np.uint64) - np.uint64(values.min())
+    if not ascending:
+        keys = keys.max() - keys
+    value_bits = int(keys.max()).bit_length()
+    list_bits = (len(counts) - 1).bit_length()
+    lists = numpy.repeat(numpy.arange(len(counts), dtype=np.uint64), counts)
+
+    if value_bits + list_bits <= 64:
+        keys |= lists << np.uint64(value_bits)
+        passes = [(keys, value_bits + list_bits)]
+    else:
+        passes = [(keys, value_bits), (lists, list_bits)]
+
+    perm = None
+    for key, nbits in passes:
+        for shift in range(0, nbits, _digit_bits):
+            digits = (key >> np.uint64(shift)).astype(np.uint16)
+            if perm is None:
+                perm = numpy.argsort(digits, kind="stable")
+            else:
+                perm = perm[numpy.argsort(digits[perm], kind="stable")]
+    if perm is None:
+        # All keys are zero: one list, in which all values are equal
+        perm = numpy.arange(len(values), dtype=np.int64)
+
+    perm = perm.astype(np.int64, copy=False)
+    if local:
+        perm -= numpy.repeat(offsets[:-1], counts)
+    return perm
+
+
+def is_top_k_selectable(dtype: np.dtype) -> bool:
+    return np.dtype(dtype).kind in "biufmM"
+
+
+def top_k_argsort(
+    values: numpy.ndarray,
+    starts: numpy.ndarray,
+    stops: numpy.ndarray,
+    k: int,
+    ascending: bool,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Returns the offsets and (local) positions of the first `k` values of each
+    list `values[starts[i]:stops[i]]` in the order of a stable `awkward_argsort`,
+    which puts NaN first. The result is the same as `argsort(...)[:, :k]`.
+
+    Lists of the same length are selected together, as rows of 2-d blocks of at
+    most `_top_k_block_size` values (or one row). Rows that are longer than `k`
+    are not sorted: the `k`-th value of each row is found with `numpy.partition`,
+    and only the values that precede it are sorted.
+    """
+    if values.dtype.kind in "mM":
+        values = values.view(np.int64)
+    elif values.dtype == np.bool_:
+        values = values.view(np.uint8)
+    starts = numpy.asarray(starts, dtype=np.int64)
+    lengths = numpy.asarray(stops, dtype=np.int64) - starts
+    outoffsets = numpy.zeros(len(lengths) + 1, dtype=np.int64)
+    numpy.cumsum(numpy.minimum(lengths, k), out=outoffsets[1:])
+    out = numpy.empty(outoffsets[-1], dtype=np.int64)
+
+    # Group the lists by length
+    if len(lengths) != 0 and lengths.max() < 2**16:
+        # (NumPy sorts 16-bit integers with a radix sort)
+        order = numpy.argsort(lengths.astype(np.uint16), kind="stable")
+    else:
+        order = numpy.argsort(lengths, kind="stable")
+    sorted_lengths = lengths[order]
+    bounds = numpy.nonzero(sorted_lengths[1:] != sorted_lengths[:-1])[0] + 1
+    bounds = numpy.concatenate([[0], bounds, [len(lengths)]]).tolist()
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        length = int(sorted_lengths[start])
+        if length == 0 or k == 0:
+            continue
+        step = max(1, _top_k_block_size // length)
+        for block_start in range(start, stop, step):
+            rows = order[block_start : min(block_start + step, stop)]
+            block = values[starts[rows, numpy.newaxis] + numpy.arange(length)]
+            selected = _select_first(block, min(k, length), ascending)
+            out[outoffsets[rows, numpy.newaxis] + numpy.arange(selected.shape[1])] = (
+                selected
+            )
+
+    return outoffsets, out
+
+
+def _select_first(block, k, ascending):
+    # Columns of the first `k` values of each row of `block`, in order
+    length = block.shape[1]
+    nan = None
+    if block.dtype.kind == "f":
+        key = block if ascending else -block
+        isnan = numpy.isnan(block)
+        if isnan.any():
+            nan = isnan
+    else:
+        # bitwise-not reverses the order of signed and unsigned integers alike
+        key = block if ascending else ~block
+
+    if k < length:
+        # Keep the values up to the `k`-th of each row (putting NaN before all
+        # others) and sort only those
+        if nan is not None:
+            key = numpy.where(nan, -numpy.inf, key)
+        kth = numpy.partition(key, k - 1, axis=1)[:, k - 1 : k]
+        chosen = key <= kth
+        excess = numpy.nonzero(numpy.count_nonzero(chosen, axis=1) > k)[0]
+        if len(excess) != 0:
+            # Values that are equal to the `k`-th are kept by position, NaN first
+            chosen[excess] = _first_of_ties(
+                key[excess],
+                kth[excess],
+                k,
+                None if nan is None else nan[excess],
+            )
+        columns = numpy.nonzero(chosen)[1].reshape(-1, k)
+        key = numpy.take_along_axis(key, columns, axis=1)
+        if nan is not None:
+            nan = numpy.take_along_axis(nan, columns, axis=1)
+    else:
+        columns = numpy.broadcast_to(numpy.arange(length), block.shape)
+
+    if nan is None:
+        order = numpy.argsort(key, axis=1, kind="stable")
+    else:
+        order = numpy.lexsort((numpy.where(nan, 0, key), ~nan), axis=1)
+    return numpy.take_along_axis(columns, order, axis=1)
+
+
+def _first_of_ties(key, kth, k, nan):
+    chosen = key < kth
+    need = k - numpy.count_nonzero(chosen, axis=1)[:, numpy.newaxis]
+    tied = key == kth
+    if nan is None:
+        chosen |= tied & (numpy.cumsum(tied, axis=1) <= need)
+    else:
+        tied_nan = tied & nan
+        tied_other = tied & ~nan
+        rank_nan = numpy.cumsum(tied_nan, axis=1)
+        rank_other = numpy.cumsum(tied_other, axis=1) + rank_nan[:, -1:]
+        chosen |= tied_nan & (rank_nan <= need)
+        chosen |= tied_other & (rank_other <= need)
+    return chosen
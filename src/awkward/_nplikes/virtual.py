@@ -0,0 +1,416 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from functools import reduce
+from operator import mul
+
+from awkward._nplikes.array_like import ArrayLike
+from awkward._nplikes.numpy_like import NumpyLike, NumpyMetadata
+from awkward._nplikes.shape import ShapeItem, unknown_length
+from awkward._typing import TYPE_CHECKING, Any, Callable, DType, Self
+
+np = NumpyMetadata.instance()
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike
+
+
+class VirtualArray(ArrayLike):
+    """
+    A one-shot, lazily-generated array buffer.
+
+    Unlike #PlaceholderArray, a VirtualArray *can* be used in computations: the
+    first operation that needs its values calls `generator()` (exactly once) and
+    every subsequent operation reuses the materialized array. Metadata (`dtype`,
+    `ndim`, and the `shape` if it is known) never triggers materialization.
+
+    If some items of `shape` are `unknown_length`, they are resolved by calling
+    `shape_generator()` the first time the shape is requested, or by
+    materializing the array if no `shape_generator` was given.
+
+    If a `cache` (MutableMapping) is given, the materialized array is stored in
+    `cache[cache_key]` instead of in the VirtualArray, so that the cache decides
+    how long it is kept; after it is evicted, `generator()` is called again. A
+    VirtualArray with a `cache` but no `cache_key` never keeps its array.
+    """
+
+    def __init__(
+        self,
+        nplike: NumpyLike,
+        shape: tuple[ShapeItem, ...],
+        dtype: DType,
+        generator: Callable[[], Any],
+        shape_generator: Callable[[], tuple[int, ...]] | None = None,
+        field_path: tuple[str, ...] = (),
+        cache: MutableMapping | None = None,
+        cache_key: str | None = None,
+    ):
+        self._nplike = nplike
+        self._shape = shape
+        self._dtype = np.dtype(dtype)
+        self._generator = generator
+        self._shape_generator = shape_generator
+        self._field_path = field_path
+        self._cache = cache
+        self._cache_key = cache_key
+        self._array = None
+        # so that threads that need the array at the same time generate it once
+        self._lock = threading.Lock()
+
+    @property
+    def field_path(self) -> str:
+        return ".".join(self._field_path)
+
+    @property
+    def nplike(self) -> NumpyLike:
+        return self._nplike
+
+    @property
+    def is_materialized(self) -> bool:
+        if self._array is not None:
+            return True
+        elif self._cache is not None and self._cache_key is not None:
+            return self._cache_key in self._cache
+        else:
+            return False
+
+    def materialize(self):
+        if self._array is not None:
+            return self._array
+
+        with self._lock:
+            return self._materialize()
+
+    def _materialize(self):
+        if self._array is not None:
+            return self._array
+
+        if self._cache is not None and self._cache_key is not None:
+            array = self._cache.get(self._cache_key)
+            if array is not None:
+                return array
+
+        array = self._nplike.asarray(self._generator())
+        if array.dtype != self._dtype:
+            raise TypeError(
+                f"generated array has dtype {array.dtype}, but the virtual array "
+                f"was declared with dtype {self._dtype}"
+            )
+        if len(array.shape) != len(self._shape) or any(
+            expected is not unknown_length and expected != actual
+            for expected, actual in zip(self._shape, array.shape)
+        ):
+            raise TypeError(
+                f"generated array has shape {array.shape}, but the virtual array "
+                f"was declared with shape {self._shape}"
+            )
+        array = self._nplike.ascontiguousarray(array)
+        self._shape = tuple(array.shape)
+        self._shape_generator = None
+
+        if self._cache is None:
+            self._array = array
+            # The generator may hold references to large objects; drop it.
+            self._generator = None
+        elif self._cache_key is not None:
+            self._cache[self._cache_key] = array
+        return array
+
+    @property
+    def dtype(self) -> DType:
+        return self._dtype
+
+    @property
+    def shape(self) -> tuple[ShapeItem, ...]:
+        if any(item is unknown_length for item in self._shape):
+            if self._shape_generator is None:
+                self.materialize()
+            else:
+                shape = tuple(self._shape_generator())
+                if len(shape) != len(self._shape):
+                    raise TypeError(
+                        f"shape_generator returned {shape}, but the virtual array "
+                        f"was declared with {len(self._shape)} dimensions"
+                    )
+                self._shape = shape
+                self._shape_generator = None
+        return self._shape
+
+    @property
+    def ndim(self) -> int:
+        return len(self._shape)
+
+    @property
+    def size(self) -> ShapeItem:
+        return reduce(mul, self.shape, 1)
+
+    @property
+    def nbytes(self) -> ShapeItem:
+        if self._array is None:
+            return 0
+        else:
+            return self._array.nbytes
+
+    @property
+    def strides(self) -> tuple[ShapeItem, ...]:
+        out: tuple[ShapeItem, ...] = (self._dtype.itemsize,)
+        for item in reversed(self.shape[1:]):
+            out = (item * out[0], *out)
+        return out
+
+    @property
+    def T(self):
+        return self.materialize().T
+
+    def _derive(
+        self,
+        shape_of: Callable[[tuple[ShapeItem, ...]], tuple[ShapeItem, ...]],
+        generator: Callable[[], Any],
+        dtype: DType,
+    ) -> Self:
+        # Build a new (unmaterialized) virtual array from this one without
+        # resolving this array's shape, if it is not yet known.
+        shape = shape_of(self._shape)
+        if any(item is unknown_length for item in shape):
+            shape_generator = lambda: shape_of(self.shape)
+        else:
+            shape_generator = None
+        # If this array's values are not kept (they're in a cache), neither
+        # are those of the derived array: it is generated again when needed.
+        # (Subclasses derive plain VirtualArrays.)
+        return VirtualArray(
+            self._nplike,
+            shape,
+            dtype,
+            generator,
+            shape_generator,
+            self._field_path,
+            self._cache,
+        )
+
+    def view(self, dtype: DTypeLike) -> Self:
+        dtype = np.dtype(dtype)
+        if self._array is not None:
+            return self._array.view(dtype)
+
+        def shape_of(shape):
+            if len(shape) == 0 or shape[-1] is unknown_length:
+                return shape
+            last, remainder = divmod(shape[-1] * self._dtype.itemsize, dtype.itemsize)
+            if remainder != 0:
+                raise ValueError(
+                    "new size of array with larger dtype must be a "
+                    "divisor of the total size in bytes (of the last axis of the array)"
+                )
+            return (*shape[:-1], last)
+
+        return self._derive(shape_of, lambda: self.materialize().view(dtype), dtype)
+
+    def __getitem__(self, index):
+        if (
+            self._array is None
+            and isinstance(index, slice)
+            and index.step in (None, 1)
+            and len(self._shape) >= 1
+        ):
+
+            def shape_of(shape):
+                if shape[0] is unknown_length:
+                    return shape
+                return (len(range(*index.indices(shape[0]))), *shape[1:])
+
+            return self._derive(
+                shape_of, lambda: self.materialize()[index], self._dtype
+            )
+        else:
+            return self.materialize()[index]
+
+    @property
+    def inner_shape(self) -> tuple[ShapeItem, ...]:
+        # Like TypeTracerArray, expose the inner shape without touching the
+        # (possibly unknown) length.
+        inner_shape = self._shape[1:]
+        if any(item is unknown_length for item in inner_shape):
+            return self.shape[1:]
+        else:
+            return inner_shape
+
+    def __setitem__(self, key, value):
+        self.materialize()[key] = value
+
+    def __bool__(self) -> bool:
+        return bool(self.materialize())
+
+    def __int__(self) -> int:
+        return int(self.materialize())
+
+    def __index__(self) -> int:
+        return self.materialize().__index__()
+
+    def __len__(self) -> int:
+        return int(self.shape[0])
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.materialize()
+        if dtype is not None and np.dtype(dtype) != array.dtype:
+            return array.astype(dtype)
+        elif copy:
+            return array.copy()
+        else:
+            return array
+
+    def __getattr__(self, name: str):
+        # Other array attributes (e.g. `ctypes`, `flags`, `tolist`, ...) are
+        # forwarded to the materialized array; probing for anything else must
+        # not materialize it.
+        if name.startswith("_") or not hasattr(self._nplike.ndarray, name):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        return getattr(self.materialize(), name)
+
+    def __repr__(self):
+        if self._array is None:
+            return f"<{type(self).__name__} (not materialized) shape={self._shape} dtype={self._dtype}>"
+        else:
+            return f"<{type(self).__name__} {self._array!r}>"
+
+    def __reduce__(self):
+        # Pickling a virtual array is equivalent to pickling its values
+        return self.materialize().__reduce__()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.materialize(), memo)
+
+    def __add__(self, other):
+        return self.materialize() + other
+
+    def __radd__(self, other):
+        return other + self.materialize()
+
+    def __sub__(self, other):
+        return self.materialize() - other
+
+    def __rsub__(self, other):
+        return other - self.materialize()
+
+    def __mul__(self, other):
+        return self.materialize() * other
+
+    def __rmul__(self, other):
+        return other * self.materialize()
+
+    def __truediv__(self, other):
+        return self.materialize() / other
+
+    def __floordiv__(self, other):
+        return self.materialize() // other
+
+    def __mod__(self, other):
+        return self.materialize() % other
+
+    def __neg__(self):
+        return -self.materialize()
+
+    def __and__(self, other):
+        return self.materialize() & other
+
+    def __or__(self, other):
+        return self.materialize() | other
+
+    def __xor__(self, other):
+        return self.materialize() ^ other
+
+    def __invert__(self):
+        return ~self.materialize()
+
+    def __eq__(self, other):
+        return self.materialize() == other
+
+    def __ne__(self, other):
+        return self.materialize() != other
+
+    def __ge__(self, other):
+        return self.materialize() >= other
+
+    def __gt__(self, other):
+        return self.materialize() > other
+
+    def __le__(self, other):
+        return self.materialize() <= other
+
+    def __lt__(self, other):
+        return self.materialize() < other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        return self.materialize().__dlpack_device__()
+
+    def __dlpack__(self, stream: Any = None) -> Any:
+        return self.materialize().__dlpack__(stream=stream)
+
+
+class LRUBufferCache(MutableMapping):
+    """
+    A MutableMapping of arrays that keeps at most `max_bytes` of them (by
+    `nbytes`), evicting the least recently used first. The most recently added
+    array is always kept, even if it alone exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._data: OrderedDict[str, Any] = OrderedDict()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._data:
+            del self[key]
+        self._data[key] = value
+        self._nbytes += value.nbytes
+        while self._nbytes > self._max_bytes and len(self._data) > 1:
+            _, evicted = self._data.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+
+    def __delitem__(self, key):
+        self._nbytes -= self._data.pop(key).nbytes
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {len(self)} arrays, {self._nbytes}/{self._max_bytes} bytes>"
+
+
+def materialize_if_virtual(*arrays: Any) -> tuple[Any, ...]:
+    """
+    Replace any #VirtualArray in `arrays` by its materialized values.
+    """
+    return tuple(x.materialize() if isinstance(x, VirtualArray) else x for x in arrays)
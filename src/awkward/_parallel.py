@@ -0,0 +1,322 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+"""
+Opt-in thread-parallel execution of CPU kernels.
+
+The CPU kernels are single-threaded loops, called through ctypes, which releases
+the GIL. For some of the kernels that do the most work (segmented reductions,
+sorts, broadcasting lists, and carries), this module knows how to split the
+arguments of a call into several calls on disjoint ranges of lists (or of
+values), which are independent of each other and can run on a thread pool.
+`NumpyKernel.__call__` consults `split` when more than one thread is enabled
+(see #ak.kernel_threads).
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+from collections.abc import Callable, Sequence
+
+from awkward._nplikes.array_like import ArrayLike
+from awkward._nplikes.numpy import Numpy
+from awkward._nplikes.virtual import VirtualArray
+from awkward._typing import Any
+
+numpy = Numpy.instance()
+
+# A task is the arguments of one call of a kernel and a function to call (with no
+# arguments) after it succeeds, if its output needs to be adjusted
+Task = tuple[Sequence[Any], "Callable[[], None] | None"]
+
+# Calls are only split into chunks of at least this many items (values or lists)
+min_chunk_length = 2**16
+
+_num_threads = 1
+_lock = threading.Lock()
+_executor = None
+
+
+def get_num_threads() -> int:
+    return _num_threads
+
+
+def set_num_threads(num_threads: int) -> int:
+    """
+    Sets the number of threads that kernels may use and returns the previous value.
+    """
+    global _num_threads, _executor
+    with _lock:
+        previous, _num_threads = _num_threads, num_threads
+        if num_threads != previous:
+            # The old pool's threads exit when it is garbage collected, after any
+            # calls that are still using it
+            _executor = None
+    return previous
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                _num_threads, thread_name_prefix="awkward-kernel"
+            )
+        return _executor
+
+
+def map_tasks(function: Callable[..., Any], tasks: Sequence[Any]) -> list[Any]:
+    """
+    Calls `function` on each of `tasks` in the thread pool (or in this thread, if
+    there is only one) and returns the results in order.
+    """
+    if len(tasks) <= 1 or _num_threads <= 1:
+        return [function(task) for task in tasks]
+    futures = [_get_executor().submit(function, task) for task in tasks]
+    return [future.result() for future in futures]
+
+
+def num_chunks(length: int) -> int:
+    """
+    Number of chunks to split `length` items into, or 1 if the work should not be
+    split (it is too small, or parallel execution is disabled).
+    """
+    return max(1, min(_num_threads, length // min_chunk_length))
+
+
+def balanced_bounds(cumulative: ArrayLike, nchunks: int) -> ArrayLike:
+    """
+    Given the non-decreasing `cumulative` number of items up to each of `n + 1`
+    positions (such as offsets), returns the indexes `0 = b[0] < ... < b[-1] = n`
+    of the positions that split the items into `nchunks` groups of about the
+    same size.
+    """
+    n = len(cumulative) - 1
+    first, last = cumulative[0], cumulative[-1]
+    targets = first + (last - first) * numpy.arange(1, nchunks) // nchunks
+    inner = numpy.searchsorted(cumulative, targets, side="left")
+    return numpy.unique_values(numpy.concat([[0], inner[inner < n], [n]]))
+
+
+def _materialize(x):
+    return x.materialize() if isinstance(x, VirtualArray) else x
+
+
+def _is_sorted(x) -> bool:
+    return len(x) < 2 or bool(numpy.all(x[1:] >= x[:-1]))
+
+
+def _split_reduce(args, *, position: bool, has_data: bool) -> list[Task] | None:
+    # awkward_reduce_*(toptr, [fromptr,] parents, lenparents, outlength, *rest):
+    # each value `i` is reduced into `toptr[parents[i]]`. If `parents` is sorted
+    # (as it is in most reductions), ranges of values that do not share a parent
+    # write to disjoint ranges of `toptr`.
+    toptr = _materialize(args[0])
+    i = 2 if has_data else 1
+    fromptr = _materialize(args[1]) if has_data else None
+    lenparents, outlength, rest = int(args[i + 1]), int(args[i + 2]), args[i + 3 :]
+    nchunks = num_chunks(lenparents)
+    if nchunks == 1:
+        return None
+    parents = _materialize(args[i])[:lenparents]
+    if not _is_sorted(parents):
+        return None
+
+    # Move each split point back to the first value with the same parent
+    targets = parents[lenparents * numpy.arange(1, nchunks) // nchunks]
+    inner = numpy.searchsorted(parents, targets, side="left")
+    bounds = numpy.unique_values(numpy.concat([[0], inner, [lenparents]]))
+    outbounds = [0, *(int(parents[x]) for x in bounds[1:-1]), outlength]
+
+    tasks = []
+    for j in range(len(bounds) - 1):
+        start, stop = int(bounds[j]), int(bounds[j + 1])
+        outstart, outstop = outbounds[j], outbounds[j + 1]
+        out = toptr[outstart:outstop]
+        local_parents = parents[start:stop]
+        if outstart != 0:
+            local_parents = local_parents - outstart
+        task_args = [out]
+        if has_data:
+            task_args.append(fromptr[start:stop])
+        task_args.extend([local_parents, stop - start, outstop - outstart, *rest])
+
+        if position and start != 0:
+            # argmin/argmax return positions in the values that they are given
+            def adjust(out=out, start=start):
+                out[out >= 0] += start
+        else:
+            adjust = None
+        tasks.append((task_args, adjust))
+    return tasks
+
+
+def _split_sort(args, *, argsort: bool) -> list[Task] | None:
+    # awkward_sort(toptr, fromptr, length, offsets, offsetslength, parentslength,
+    #              ascending, stable)
+    # awkward_argsort(toptr, fromptr, length, offsets, offsetslength, ascending,
+    #                 stable)
+    # sort each list independently; argsort's positions are relative to each list.
+    toptr, fromptr = _materialize(args[0]), _materialize(args[1])
+    length, offsetslength = int(args[2]), int(args[4])
+    rest = args[5:] if argsort else args[6:]
+    nchunks = num_chunks(length)
+    if nchunks == 1:
+        return None
+    offsets = _materialize(args[3])[:offsetslength]
+    if (
+        offsetslength < 2
+        or offsets[0] != 0
+        or offsets[-1] != length
+        or (not argsort and int(args[5]) != length)
+        or not _is_sorted(offsets)
+    ):
+        return None
+
+    bounds = balanced_bounds(offsets, nchunks)
+    tasks = []
+    for j in range(len(bounds) - 1):
+        first, last = int(bounds[j]), int(bounds[j + 1])
+        start, stop = int(offsets[first]), int(offsets[last])
+        local_offsets = offsets[first : last + 1] - start
+        task_args = [
+            toptr[start:stop],
+            fromptr[start:stop],
+            stop - start,
+            local_offsets,
+            last - first + 1,
+        ]
+        if not argsort:
+            task_args.append(stop - start)
+        task_args.extend(rest)
+        tasks.append((task_args, None))
+    return tasks
+
+
+def _split_broadcast_tooffsets(args) -> list[Task] | None:
+    # awkward_ListArray_broadcast_tooffsets(tocarry, fromoffsets, offsetslength,
+    #                                       fromstarts, fromstops, lencontent)
+    # list `i` fills `tocarry[fromoffsets[i] - fromoffsets[0]:...]`.
+    tocarry = _materialize(args[0])
+    offsetslength = int(args[2])
+    offsets = _materialize(args[1])[:offsetslength]
+    if offsetslength < 2:
+        return None
+    nchunks = num_chunks(int(offsets[-1] - offsets[0]))
+    if nchunks == 1 or not _is_sorted(offsets):
+        # out-of-order offsets are an error that the kernel reports
+        return None
+    fromstarts, fromstops = _materialize(args[3]), _materialize(args[4])
+
+    bounds = balanced_bounds(offsets, nchunks)
+    tasks = []
+    for j in range(len(bounds) - 1):
+        first, last = int(bounds[j]), int(bounds[j + 1])
+        start = int(offsets[first] - offsets[0])
+        stop = int(offsets[last] - offsets[0])
+        task_args = [
+            tocarry[start:stop],
+            offsets[first : last + 1],
+            last - first + 1,
+            fromstarts[first:last],
+            fromstops[first:last],
+            args[5],
+        ]
+        tasks.append((task_args, None))
+    return tasks
+
+
+def _split_regular_carry(args) -> list[Task] | None:
+    # awkward_RegularArray_getitem_carry(tocarry, fromcarry, lencarry, size)
+    tocarry, fromcarry = _materialize(args[0]), _materialize(args[1])
+    lencarry, size = int(args[2]), int(args[3])
+    nchunks = num_chunks(lencarry * size)
+    if nchunks == 1:
+        return None
+    bounds = lencarry * numpy.arange(nchunks + 1) // nchunks
+    return [
+        (
+            [
+                tocarry[start * size : stop * size],
+                fromcarry[start:stop],
+                stop - start,
+                size,
+            ],
+            None,
+        )
+        for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+    ]
+
+
+def _split_indexed_nextcarry(args) -> list[Task] | None:
+    # awkward_IndexedArray_getitem_nextcarry(tocarry, fromindex, lenindex,
+    #                                        lencontent)
+    # (it fails on the first missing value, so each `tocarry[i]` comes from
+    # `fromindex[i]`)
+    tocarry, fromindex = _materialize(args[0]), _materialize(args[1])
+    lenindex = int(args[2])
+    nchunks = num_chunks(lenindex)
+    if nchunks == 1:
+        return None
+    bounds = lenindex * numpy.arange(nchunks + 1) // nchunks
+    return [
+        ([tocarry[start:stop], fromindex[start:stop], stop - start, args[3]], None)
+        for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+    ]
+
+
+def _reduce(position=False, has_data=True):
+    return lambda args: _split_reduce(args, position=position, has_data=has_data)
+
+
+_splitters: dict[str, Callable[[Sequence[Any]], list[Task] | None]] = {
+    "awkward_reduce_count_64": _reduce(has_data=False),
+    "awkward_reduce_countnonzero": _reduce(),
+    "awkward_reduce_sum": _reduce(),
+    "awkward_reduce_sum_bool": _reduce(),
+    "awkward_reduce_sum_int32_bool_64": _reduce(),
+    "awkward_reduce_sum_int64_bool_64": _reduce(),
+    "awkward_reduce_prod": _reduce(),
+    "awkward_reduce_prod_bool": _reduce(),
+    "awkward_reduce_min": _reduce(),
+    "awkward_reduce_max": _reduce(),
+    "awkward_reduce_argmin": _reduce(position=True),
+    "awkward_reduce_argmax": _reduce(position=True),
+    "awkward_sort": lambda args: _split_sort(args, argsort=False),
+    "awkward_argsort": lambda args: _split_sort(args, argsort=True),
+    "awkward_ListArray_broadcast_tooffsets": _split_broadcast_tooffsets,
+    "awkward_RegularArray_getitem_carry": _split_regular_carry,
+    "awkward_IndexedArray_getitem_nextcarry": _split_indexed_nextcarry,
+}
+
+
+def split(name: str, args: Sequence[Any]) -> list[Task] | None:
+    """
+    Returns the independent calls that are equivalent to calling kernel `name`
+    with `args`, or None if it should be called as usual.
+    """
+    if _num_threads <= 1:
+        return None
+    splitter = _splitters.get(name)
+    if splitter is None:
+        return None
+    return splitter(args)
+
+
+def run(call: Callable[[Sequence[Any]], Any], tasks: Sequence[Task]) -> Any:
+    """
+    Calls a kernel (through `call`) for each of `tasks` in the thread pool and
+    returns the first error, or the result of the last call if all succeed.
+    """
+
+    def run_task(task):
+        args, adjust = task
+        error = call(args)
+        if (error is None or error.str is None) and adjust is not None:
+            adjust()
+        return error
+
+    errors = map_tasks(run_task, tasks)
+    for error in errors:
+        if error is not None and error.str is not None:
+            return error
+    return errors[-1]
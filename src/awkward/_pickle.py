@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import pickle
 import sys
 import threading
 import warnings
@@ -20,6 +21,7 @@ else:
 
 if TYPE_CHECKING:
     from awkward._nplikes.shape import ShapeItem
+    from awkward.contents import Content
     from awkward.highlevel import Array, Record
 
 
@@ -95,6 +97,35 @@ def custom_reduce(obj, protocol: int) -> tuple | NotImplemented:
         return plugin(obj, protocol)
 
 
+def to_pickle_buffers(
+    layout: Content, protocol: int
+) -> tuple[dict, ShapeItem, Mapping[str, Any]]:
+    """
+    Decomposes a packed `layout` into the form (as a dict), length, and
+    container that the `unpickle_*_schema_1` functions expect.
+
+    For pickle protocol 5 or later, each buffer is wrapped in a pickle.PickleBuffer,
+    so that picklers with a `buffer_callback` (such as those of multiprocessing,
+    Dask, and Ray) can transfer it out-of-band, without copying it into the stream.
+    """
+    from awkward.operations.ak_to_buffers import _impl
+
+    form, length, container = _impl(
+        layout,
+        None,
+        "{form_key}-{attribute}",
+        "node{id}",
+        0,
+        None,
+        "<",
+    )
+
+    if protocol >= 5:
+        container = {k: pickle.PickleBuffer(v) for k, v in container.items()}
+
+    return form.to_dict(), length, container
+
+
 def unpickle_array_schema_1(
     form_dict: dict,
     length: ShapeItem,
@@ -0,0 +1,233 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+"""
+Records of the kernels called and the buffers allocated while an #ak.profile is
+active.
+
+`NumpyKernel.__call__` (and so `JaxKernel.__call__`) and `CupyKernel.__call__`
+check `recorders` before each call; if it is not empty, they time the call with
+`timed`, which appends a `KernelCall` to every active `Recorder`. Likewise, the
+array-creation functions of the `Numpy` nplike (`empty`, `zeros`, `asarray`, ...,
+which allocate the buffers of every `Index` and `NumpyArray` that they make) pass
+new buffers to its `on_allocation` slot, which is `allocated` while a profile is
+active and None otherwise, and `NumpyArray._carry` checks `recorders` and calls
+`allocated`, which appends an `Allocation`. When no profile is active, the only
+cost is that check.
+
+Each buffer is counted as live until it is garbage collected, and each
+allocation is attributed to the high-level operation (the primary ErrorContext)
+that was being performed in its thread. The `OperationMemory` of an operation
+tracks the most bytes allocated by that operation that were live at once.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+
+import awkward._nplikes.numpy
+from awkward._errors import ErrorContext, OperationErrorContext, SlicingErrorContext
+from awkward._nplikes.numpy_like import NumpyMetadata
+from awkward._typing import Any, NamedTuple
+
+np = NumpyMetadata.instance()
+
+
+class KernelCall(NamedTuple):
+    # name of the kernel, such as "awkward_ListOffsetArray_flatten_offsets"
+    name: str
+    # dtypes of the kernel's specialization (the rest of its key)
+    dtypes: tuple[str, ...]
+    # lengths of the arrays passed to the kernel, in order
+    lengths: tuple[int, ...]
+    # bytes in the arrays passed to the kernel (its inputs and the outputs that
+    # the caller allocated for it)
+    nbytes: int
+    # time.perf_counter_ns() at the start of the call
+    start: int
+    # wall time of the call in nanoseconds
+    duration: int
+    # threading.get_ident() of the thread that called the kernel
+    thread: int
+    # the high-level operation being performed, such as "ak.sum", if any
+    operation: str | None
+
+
+class Allocation(NamedTuple):
+    # the function that allocated the buffer, such as "empty" or "NumpyArray._carry"
+    function: str
+    dtype: str
+    shape: tuple[int, ...]
+    nbytes: int
+    # time.perf_counter_ns() when it was allocated
+    start: int
+    # threading.get_ident() of the thread that allocated it
+    thread: int
+    # the high-level operation being performed, such as "ak.cartesian", if any
+    operation: str | None
+    # bytes of all of the tracked buffers that were live after it was allocated
+    live: int
+
+
+class OperationMemory:
+    """
+    The buffers allocated by one call of a high-level operation.
+    """
+
+    __slots__ = ("allocated", "baseline", "buffers", "name", "peak", "thread")
+
+    def __init__(self, name: str | None, thread: int, baseline: int):
+        self.name = name
+        self.thread = thread
+        # number of buffers and their total bytes
+        self.buffers = 0
+        self.allocated = 0
+        # live bytes before its first allocation
+        self.baseline = baseline
+        # the most live bytes above the baseline after any of its allocations
+        self.peak = 0
+
+    def __repr__(self):
+        return f"<OperationMemory {self.name}: {self.buffers} buffers, {self.allocated} bytes, peak {self.peak}>"
+
+
+class Recorder:
+    def __init__(self):
+        self.calls: list[KernelCall] = []
+        self.allocations: list[Allocation] = []
+        self.operations: list[OperationMemory] = []
+        # (time.perf_counter_ns(), live bytes) after each allocation and free
+        self.memory: list[tuple[int, int]] = []
+
+
+# Recorders that are recording (one for each active #ak.profile)
+recorders: list[Recorder] = []
+# Reentrant, because a buffer can be freed (by the garbage collector) while the
+# lock is held
+_lock = threading.RLock()
+
+# Bytes of the tracked buffers, by id, while they are live, and their total
+_tracked: dict[int, int] = {}
+_live = 0
+# OperationMemory of each operation that has allocated a tracked buffer
+_operations: weakref.WeakKeyDictionary[ErrorContext, OperationMemory] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def start(recorder: Recorder) -> None:
+    with _lock:
+        recorders.append(recorder)
+        awkward._nplikes.numpy.on_allocation = allocated
+
+
+def stop(recorder: Recorder) -> None:
+    with _lock:
+        for i, x in enumerate(recorders):
+            if x is recorder:
+                del recorders[i]
+                break
+        if not recorders:
+            awkward._nplikes.numpy.on_allocation = None
+
+
+def timed(key: tuple, args, call) -> Any:
+    """
+    Returns `call()`, recording it as a call of the kernel with `key` and `args`.
+    """
+    operation = _operation_name(ErrorContext.primary())
+    begin = time.perf_counter_ns()
+    try:
+        return call()
+    finally:
+        end = time.perf_counter_ns()
+        arrays = [x for x in args if _is_array(x)]
+        entry = KernelCall(
+            key[0],
+            tuple(str(np.dtype(x)) for x in key[1:]),
+            tuple(int(x.size) for x in arrays),
+            sum(int(x.size) * x.dtype.itemsize for x in arrays),
+            begin,
+            end - begin,
+            threading.get_ident(),
+            operation,
+        )
+        with _lock:
+            for recorder in recorders:
+                recorder.calls.append(entry)
+
+
+def allocated(array, function: str) -> None:
+    """
+    Records `array` as allocated by `function`, if it is a NumPy array that owns
+    its buffer and is not already tracked.
+    """
+    global _live
+
+    if not (
+        isinstance(array, np.ndarray)
+        and array.base is None
+        and id(array) not in _tracked
+    ):
+        return
+
+    now = time.perf_counter_ns()
+    thread = threading.get_ident()
+    context = ErrorContext.primary()
+    nbytes = int(array.nbytes)
+    with _lock:
+        _tracked[id(array)] = nbytes
+        weakref.finalize(array, _freed, id(array)).atexit = False
+        _live += nbytes
+
+        if context is None:
+            operation = None
+        else:
+            operation = _operations.get(context)
+            if operation is None:
+                operation = _operations[context] = OperationMemory(
+                    _operation_name(context), thread, _live - nbytes
+                )
+                for recorder in recorders:
+                    recorder.operations.append(operation)
+            operation.buffers += 1
+            operation.allocated += nbytes
+            operation.peak = max(operation.peak, _live - operation.baseline)
+
+        entry = Allocation(
+            function,
+            str(array.dtype),
+            tuple(int(x) for x in array.shape),
+            nbytes,
+            now,
+            thread,
+            None if operation is None else operation.name,
+            _live,
+        )
+        for recorder in recorders:
+            recorder.allocations.append(entry)
+            recorder.memory.append((now, _live))
+
+
+def _freed(key: int) -> None:
+    global _live
+
+    now = time.perf_counter_ns()
+    with _lock:
+        _live -= _tracked.pop(key)
+        for recorder in recorders:
+            recorder.memory.append((now, _live))
+
+
+def _is_array(x) -> bool:
+    # NumPy, CuPy, and JAX arrays, VirtualArrays, but not scalars (or ctypes)
+    return hasattr(x, "dtype") and getattr(x, "ndim", 0) > 0 and hasattr(x, "size")
+
+
+def _operation_name(context) -> str | None:
+    if isinstance(context, OperationErrorContext):
+        return context.name
+    elif isinstance(context, SlicingErrorContext):
+        return "ak.Array.__getitem__"
+    else:
+        return None
@@ -77,6 +77,122 @@ class KernelReducer(Reducer):
         else:
             return given_dtype
 
+    # Maximum number of values (and hence of `parents`) per call to `apply`
+    # in `apply_offsets`
+    offsets_block_size = 2**22
+
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        """
+        Reduces each list of `array` delimited by `offsets` (an Index64 that
+        starts at zero), which is equivalent to `apply` with `parents` derived
+        from `offsets`, but without making a `parents` index for all of the values.
+
+        By default, `apply` is called on consecutive groups of lists with at most
+        `offsets_block_size` values (or one list, if it is longer), so that the
+        scratch space is bounded. Reducers that can work on segments directly (with
+        NumPy's `ufunc.reduceat`) override this.
+        """
+        index_nplike = array.backend.index_nplike
+        offsets = index_nplike.asarray(offsets.data)
+        outlength = len(offsets) - 1
+        total = int(offsets[-1])
+
+        # Indexes of the lists at which each group starts
+        targets = index_nplike.arange(
+            self.offsets_block_size, total, self.offsets_block_size, dtype=np.int64
+        )
+        bounds = index_nplike.searchsorted(offsets, targets, side="right") - 1
+        bounds = index_nplike.unique_values(
+            index_nplike.concat(
+                [
+                    index_nplike.asarray([0], dtype=np.int64),
+                    bounds,
+                    index_nplike.asarray([outlength], dtype=np.int64),
+                ]
+            )
+        )
+
+        results = []
+        for i in range(len(bounds) - 1):
+            first, last = int(bounds[i]), int(bounds[i + 1])
+            start, stop = int(offsets[first]), int(offsets[last])
+            local_offsets = ak.index.Index64(
+                offsets[first : last + 1] - start, nplike=index_nplike
+            )
+            parents = ak.index.Index64.empty(stop - start, index_nplike)
+            array.backend.maybe_kernel_error(
+                array.backend[
+                    "awkward_ListOffsetArray_reduce_local_nextparents_64",
+                    parents.dtype.type,
+                    local_offsets.dtype.type,
+                ](
+                    parents.data,
+                    local_offsets.data,
+                    last - first,
+                )
+            )
+            results.append(
+                self.apply(
+                    array[start:stop],
+                    parents,
+                    local_offsets[:-1],
+                    None,
+                    last - first,
+                ).data
+            )
+
+        if len(results) == 1:
+            (result,) = results
+        else:
+            result = array.backend.nplike.concat(results)
+        return ak.contents.NumpyArray(result, backend=array.backend)
+
+
+def _reduceat(
+    ufunc_name: str,
+    values: AnyType,
+    offsets: ak.index.Index,
+    identity: AnyType,
+    dtype: DTypeLike,
+) -> ak.contents.NumpyArray:
+    # Segmented reduction with numpy.ufunc.reduceat, which needs no more scratch
+    # space than the number of lists. reduceat does not produce the identity for
+    # empty segments, so only the starts of non-empty lists are passed to it.
+    module = numpy._module
+    offsets = module.asarray(offsets.data)
+    starts, stops = offsets[:-1], offsets[1:]
+    result = module.full(len(starts), identity, dtype=dtype)
+    nonempty = starts != stops
+    if module.any(nonempty):
+        ufunc = getattr(module, ufunc_name)
+        values = module.asarray(values)[: offsets[-1]]
+        starts = starts[nonempty]
+        nchunks = ak._parallel.num_chunks(len(values))
+        if nchunks == 1:
+            result[nonempty] = ufunc.reduceat(values, starts, dtype=dtype)
+        else:
+            # Ranges of lists are reduced in parallel (see ak.kernel_threads)
+            bounds = ak._parallel.balanced_bounds(
+                module.append(starts, len(values)), nchunks
+            )
+            out = module.empty(len(starts), dtype=dtype)
+
+            def reduce_range(j):
+                first, last = int(bounds[j]), int(bounds[j + 1])
+                start = int(starts[first])
+                stop = int(starts[last]) if last < len(starts) else len(values)
+                out[first:last] = ufunc.reduceat(
+                    values[start:stop], starts[first:last] - start, dtype=dtype
+                )
+
+            ak._parallel.map_tasks(reduce_range, range(len(bounds) - 1))
+            result[nonempty] = out
+    return ak.contents.NumpyArray(result)
+
 
 def apply_positional_corrections(
     reduced: ak.contents.NumpyArray,
@@ -277,6 +393,14 @@ class Count(KernelReducer):
         )
         return ak.contents.NumpyArray(result, backend=array.backend)
 
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        offsets = numpy.asarray(offsets.data)
+        return ak.contents.NumpyArray(offsets[1:] - offsets[:-1])
+
 
 class CountNonzero(KernelReducer):
     name: Final = "count_nonzero"
@@ -330,6 +454,14 @@ class CountNonzero(KernelReducer):
             )
         return ak.contents.NumpyArray(result, backend=array.backend)
 
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        values = numpy.asarray(array.data) != 0
+        return _reduceat("add", values, offsets, 0, np.int64)
+
 
 class Sum(KernelReducer):
     name: Final = "sum"
@@ -434,6 +566,17 @@ class Sum(KernelReducer):
                 backend=array.backend,
             )
 
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        if array.dtype.kind not in "biufc":
+            return super().apply_offsets(array, offsets)
+        return _reduceat(
+            "add", array.data, offsets, 0, self._promote_integer_rank(array.dtype)
+        )
+
 
 class Prod(KernelReducer):
     name: Final = "prod"
@@ -525,6 +668,22 @@ class Prod(KernelReducer):
                 backend=array.backend,
             )
 
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        if array.dtype == np.bool_:
+            result = _reduceat("logical_and", array.data, offsets, True, np.bool_)
+            return ak.contents.NumpyArray(
+                numpy.astype(result.data, dtype=self._promote_integer_rank(np.bool_))
+            )
+        elif array.dtype.kind not in "iufc":
+            return super().apply_offsets(array, offsets)
+        return _reduceat(
+            "multiply", array.data, offsets, 1, self._promote_integer_rank(array.dtype)
+        )
+
 
 class Any(KernelReducer):
     name: Final = "any"
@@ -578,6 +737,16 @@ class Any(KernelReducer):
             )
         return ak.contents.NumpyArray(result, backend=array.backend)
 
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        values = numpy.asarray(array.data)
+        if array.dtype != np.bool_:
+            values = values != 0
+        return _reduceat("logical_or", values, offsets, False, np.bool_)
+
 
 class All(KernelReducer):
     name: Final = "all"
@@ -631,6 +800,16 @@ class All(KernelReducer):
             )
         return ak.contents.NumpyArray(result, backend=array.backend)
 
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        values = numpy.asarray(array.data)
+        if array.dtype != np.bool_:
+            values = values != 0
+        return _reduceat("logical_and", values, offsets, True, np.bool_)
+
 
 class Min(KernelReducer):
     name: Final = "min"
@@ -739,6 +918,21 @@ class Min(KernelReducer):
                 result.view(array.dtype), backend=array.backend
             )
 
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        if array.dtype == np.bool_:
+            return _reduceat("logical_and", array.data, offsets, True, np.bool_)
+        elif array.dtype.kind not in "iuf":
+            return super().apply_offsets(array, offsets)
+        # Like the kernel, NaNs are skipped (fmin) and the identity (or `initial`)
+        # takes part in every list's minimum
+        identity = numpy.asarray(self._identity_for(array.dtype)).astype(array.dtype)
+        result = _reduceat("fmin", array.data, offsets, identity, array.dtype)
+        return ak.contents.NumpyArray(numpy._module.fmin(result.data, identity))
+
 
 class Max(KernelReducer):
     name: Final = "max"
@@ -846,3 +1040,128 @@ class Max(KernelReducer):
             return ak.contents.NumpyArray(
                 result.view(array.dtype), backend=array.backend
             )
+
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        if array.dtype == np.bool_:
+            return _reduceat("logical_or", array.data, offsets, False, np.bool_)
+        elif array.dtype.kind not in "iuf":
+            return super().apply_offsets(array, offsets)
+        # Like the kernel, NaNs are skipped (fmax) and the identity (or `initial`)
+        # takes part in every list's maximum
+        identity = numpy.asarray(self._identity_for(array.dtype)).astype(array.dtype)
+        result = _reduceat("fmax", array.data, offsets, identity, array.dtype)
+        return ak.contents.NumpyArray(numpy._module.fmax(result.data, identity))
+
+
+class SumOfSquares(KernelReducer):
+    name: Final = "sumsq"
+    preferred_dtype: Final = np.float64
+    needs_position: Final = False
+
+    def __init__(self):
+        self._sum = Sum()
+
+    @staticmethod
+    def _squared(array: ak.contents.NumpyArray) -> ak.contents.NumpyArray:
+        data = array.backend.nplike.asarray(array.data)
+        return ak.contents.NumpyArray(data * data, backend=array.backend)
+
+    def apply(
+        self,
+        array: ak.contents.NumpyArray,
+        parents: ak.index.Index,
+        starts: ak.index.Index,
+        shifts: ak.index.Index | None,
+        outlength: ShapeItem,
+    ) -> ak.contents.NumpyArray:
+        assert isinstance(array, ak.contents.NumpyArray)
+        return self._sum.apply(self._squared(array), parents, starts, shifts, outlength)
+
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.NumpyArray:
+        return self._sum.apply_offsets(self._squared(array), offsets)
+
+
+class ReduceMany(KernelReducer):
+    """
+    Applies several reducers to the same values in one traversal of a layout,
+    producing a RecordArray with a field for each. Each reducer's results are
+    masked (for empty lists) or not, independently of the others, so the layout
+    must be traversed with `mask=False`.
+    """
+
+    name: Final = "reduce_many"
+    preferred_dtype: Final = np.float64
+
+    def __init__(self, reducers: dict[str, tuple[Reducer, bool]]):
+        self._reducers = reducers
+
+    @property
+    def needs_position(self) -> bool:
+        return any(reducer.needs_position for reducer, _ in self._reducers.values())
+
+    def _record(self, contents, outmask, outlength):
+        contents = [
+            ak.contents.ByteMaskedArray(outmask, content, False, parameters=None)
+            if mask
+            else content
+            for content, (_, mask) in zip(contents, self._reducers.values())
+        ]
+        return ak.contents.RecordArray(
+            contents, list(self._reducers), outlength, parameters=None
+        )
+
+    def apply(
+        self,
+        array: ak.contents.NumpyArray,
+        parents: ak.index.Index,
+        starts: ak.index.Index,
+        shifts: ak.index.Index | None,
+        outlength: ShapeItem,
+    ) -> ak.contents.RecordArray:
+        assert isinstance(array, ak.contents.NumpyArray)
+        contents = [
+            reducer.apply(array, parents, starts, shifts, outlength)
+            for reducer, _ in self._reducers.values()
+        ]
+
+        outmask = ak.index.Index8.empty(outlength, array.backend.index_nplike)
+        assert parents.nplike is array.backend.index_nplike
+        array.backend.maybe_kernel_error(
+            array.backend[
+                "awkward_NumpyArray_reduce_mask_ByteMaskedArray_64",
+                outmask.dtype.type,
+                parents.dtype.type,
+            ](
+                outmask.data,
+                parents.data,
+                parents.length,
+                outlength,
+            )
+        )
+        return self._record(contents, outmask, outlength)
+
+    def apply_offsets(
+        self,
+        array: ak.contents.NumpyArray,
+        offsets: ak.index.Index,
+    ) -> ak.contents.RecordArray:
+        contents = [
+            reducer.apply_offsets(array, offsets)
+            for reducer, _ in self._reducers.values()
+        ]
+
+        index_nplike = array.backend.index_nplike
+        data = index_nplike.asarray(offsets.data)
+        outmask = ak.index.Index8(
+            index_nplike.astype(data[1:] == data[:-1], dtype=np.int8),
+            nplike=index_nplike,
+        )
+        return self._record(contents, outmask, offsets.length - 1)
@@ -804,15 +804,15 @@ class ByteMaskedArray(ByteMaskedMeta[Content], Content):
         )
 
     def _argsort_next(
-        self, negaxis, starts, shifts, parents, outlength, ascending, stable
+        self, negaxis, starts, shifts, parents, outlength, ascending, stable, kind
     ):
         return self.to_IndexedOptionArray64()._argsort_next(
-            negaxis, starts, shifts, parents, outlength, ascending, stable
+            negaxis, starts, shifts, parents, outlength, ascending, stable, kind
         )
 
-    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable):
+    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable, kind):
         return self.to_IndexedOptionArray64()._sort_next(
-            negaxis, starts, parents, outlength, ascending, stable
+            negaxis, starts, parents, outlength, ascending, stable, kind
         )
 
     def _combinations(self, n, replacement, recordlookup, parameters, axis, depth):
@@ -1182,14 +1182,13 @@ class ByteMaskedArray(ByteMaskedMeta[Content], Content):
         if out is not None:
             return out
 
-        mask = self.mask_as_bool(valid_when=True)
-        out = self._content._getitem_range(0, mask.size)._to_list(
+        missing = self.mask_as_bool(valid_when=False)
+        out = self._content._getitem_range(0, missing.size)._to_list(
             behavior, json_conversions
         )
 
-        for i, isvalid in enumerate(mask):
-            if not isvalid:
-                out[i] = None
+        for i in self._backend.index_nplike.nonzero(missing)[0].tolist():
+            out[i] = None
 
         return out
 
@@ -897,6 +897,7 @@ class Content(Meta):
         outlength: int,
         ascending: bool,
         stable: bool,
+        kind: str | None,
     ):
         raise NotImplementedError
 
@@ -908,6 +909,7 @@ class Content(Meta):
         outlength: int,
         ascending: bool,
         stable: bool,
+        kind: str | None,
     ):
         raise NotImplementedError
 
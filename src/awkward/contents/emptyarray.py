@@ -305,14 +305,14 @@ class EmptyArray(EmptyMeta, Content):
         return self
 
     def _argsort_next(
-        self, negaxis, starts, shifts, parents, outlength, ascending, stable
+        self, negaxis, starts, shifts, parents, outlength, ascending, stable, kind
     ):
         as_numpy = self.to_NumpyArray(np.float64)
         return as_numpy._argsort_next(
-            negaxis, starts, shifts, parents, outlength, ascending, stable
+            negaxis, starts, shifts, parents, outlength, ascending, stable, kind
         )
 
-    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable):
+    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable, kind):
         return self
 
     def _combinations(self, n, replacement, recordlookup, parameters, axis, depth):
@@ -339,6 +339,11 @@ class IndexedArray(IndexedMeta[Content], Content):
         except IndexError as err:
             raise ak._errors.index_error(self, carry.data, str(err)) from err
 
+        if self._content.is_record:
+            # A lazy carry of a RecordArray, carried again
+            if ak._carry.should_compact(nextindex, self._content):
+                return ak._carry.compact(self._content, nextindex, self._parameters)
+            ak._carry.count("composed")
         return IndexedArray(nextindex, self._content, parameters=self._parameters)
 
     def _getitem_next_jagged_generic(self, slicestarts, slicestops, slicecontent, tail):
@@ -469,6 +474,7 @@ class IndexedArray(IndexedMeta[Content], Content):
             return next.project()
 
         else:
+            ak._carry.count("resolved")
             nextcarry = ak.index.Index64.empty(self.length, self._backend.index_nplike)
             assert (
                 nextcarry.nplike is self._backend.index_nplike
@@ -920,16 +926,18 @@ class IndexedArray(IndexedMeta[Content], Content):
         raise NotImplementedError
 
     def _argsort_next(
-        self, negaxis, starts, shifts, parents, outlength, ascending, stable
+        self, negaxis, starts, shifts, parents, outlength, ascending, stable, kind
     ):
         next = self._content._carry(self._index, False)
         return next._argsort_next(
-            negaxis, starts, shifts, parents, outlength, ascending, stable
+            negaxis, starts, shifts, parents, outlength, ascending, stable, kind
         )
 
-    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable):
+    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable, kind):
         next = self._content._carry(self._index, False)
-        return next._sort_next(negaxis, starts, parents, outlength, ascending, stable)
+        return next._sort_next(
+            negaxis, starts, parents, outlength, ascending, stable, kind
+        )
 
     def _combinations(self, n, replacement, recordlookup, parameters, axis, depth):
         posaxis = maybe_posaxis(self, axis, depth)
@@ -1204,7 +1204,7 @@ class IndexedOptionArray(IndexedOptionMeta[Content], Content):
         return next, nextparents, numnull, outindex
 
     def _argsort_next(
-        self, negaxis, starts, shifts, parents, outlength, ascending, stable
+        self, negaxis, starts, shifts, parents, outlength, ascending, stable, kind
     ):
         assert (
             starts.nplike is self._backend.index_nplike
@@ -1222,7 +1222,7 @@ class IndexedOptionArray(IndexedOptionMeta[Content], Content):
             nextshifts = None
 
         out = next._argsort_next(
-            negaxis, starts, nextshifts, nextparents, outlength, ascending, stable
+            negaxis, starts, nextshifts, nextparents, outlength, ascending, stable, kind
         )
 
         # `next._argsort_next` is given the non-None values. We choose to
@@ -1333,7 +1333,7 @@ class IndexedOptionArray(IndexedOptionMeta[Content], Content):
         else:
             return out
 
-    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable):
+    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable, kind):
         assert (
             starts.nplike is self._backend.index_nplike
             and parents.nplike is self._backend.index_nplike
@@ -1343,7 +1343,7 @@ class IndexedOptionArray(IndexedOptionMeta[Content], Content):
         next, nextparents, numnull, outindex = self._rearrange_prepare_next(parents)
 
         out = next._sort_next(
-            negaxis, starts, nextparents, outlength, ascending, stable
+            negaxis, starts, nextparents, outlength, ascending, stable, kind
         )
 
         nextoutindex = ak.index.Index64.empty(
@@ -1755,13 +1755,9 @@ class IndexedOptionArray(IndexedOptionMeta[Content], Content):
         not_missing = index >= 0
         content = ak.to_backend(self._content, "cpu", highlevel=False)
         nextcontent = content._carry(ak.index.Index(index[not_missing]), False)
-        out = nextcontent._to_list(behavior, json_conversions)
+        content = iter(nextcontent._to_list(behavior, json_conversions))
 
-        for i, isvalid in enumerate(not_missing):
-            if not isvalid:
-                out.insert(i, None)
-
-        return out
+        return [next(content) if isvalid else None for isvalid in not_missing.tolist()]
 
     def _to_backend(self, backend: Backend) -> Self:
         content = self._content.to_backend(backend)
@@ -1046,6 +1046,7 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
         outlength,
         ascending,
         stable,
+        kind,
     ):
         branch, depth = self.branch_depth
 
@@ -1160,6 +1161,7 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
                 nextstarts.length,
                 ascending,
                 stable,
+                kind,
             )
 
             outcarry = Index64.empty(nextcarry.length, self._backend.index_nplike)
@@ -1184,6 +1186,10 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
             return ak.contents.ListOffsetArray(
                 out_offsets, out, parameters=self._parameters
             )
+        elif shifts is None and self._is_sortable_by_offsets():
+            # Innermost lists of numbers: sort each list between its offsets,
+            # rather than making a `nextparents` for every value
+            return self._sort_next_offsets(ascending, stable, kind, True)
         else:
             nextlen = self._backend.index_nplike.index_as_shape_item(
                 self._offsets[-1] - self._offsets[0]
@@ -1215,13 +1221,14 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
                 self._offsets.length - 1,
                 ascending,
                 stable,
+                kind,
             )
             outoffsets = self._compact_offsets64(True)
             return ak.contents.ListOffsetArray(
                 outoffsets, outcontent, parameters=self._parameters
             )
 
-    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable):
+    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable, kind):
         branch, depth = self.branch_depth
 
         index_nplike = self._backend.index_nplike
@@ -1295,6 +1302,7 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
                 maxnextparents + 1,
                 ascending,
                 stable,
+                kind,
             )
 
             outcarry = Index64.empty(nextcarry.length, index_nplike)
@@ -1316,6 +1324,10 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
                 outcontent._carry(outcarry, False),
                 parameters=self._parameters,
             )
+        elif self._is_sortable_by_offsets():
+            # Innermost lists of numbers: sort each list between its offsets,
+            # rather than making a `nextparents` for every value
+            return self._sort_next_offsets(ascending, stable, kind, False)
         else:
             nextlen = index_nplike.index_as_shape_item(
                 self._offsets[-1] - self._offsets[0]
@@ -1347,12 +1359,49 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
                 lenstarts,
                 ascending,
                 stable,
+                kind,
             )
             outoffsets = self._compact_offsets64(True)
             return ak.contents.ListOffsetArray(
                 outoffsets, outcontent, parameters=self._parameters
             )
 
+    def _is_sortable_by_offsets(self):
+        return (
+            isinstance(self._content, ak.contents.NumpyArray)
+            and self._content.data.ndim == 1
+            and isinstance(self._backend.nplike, Numpy)
+        )
+
+    def _sort_next_offsets(self, ascending, stable, kind, argsort):
+        # Equivalent to `NumpyArray._sort_next` or `NumpyArray._argsort_next` on
+        # the values of these lists, but with the sorting ranges taken from the
+        # offsets instead of being derived from a `parents` index
+        index_nplike = self._backend.index_nplike
+        start = self._offsets[0]
+        trimmed = self._content[start : self._offsets[-1]]
+        if not trimmed.is_contiguous:
+            trimmed = trimmed.to_contiguous()
+        offsets = ak.index.Index64(
+            index_nplike.astype(self._offsets.data - start, np.int64),
+            nplike=index_nplike,
+        )
+
+        if argsort:
+            nextcarry = trimmed._argsort_ranges(
+                offsets, offsets.length, ascending, stable, kind
+            )
+            outcontent = ak.contents.NumpyArray(
+                nextcarry.data, parameters=None, backend=self._backend
+            )
+        else:
+            outcontent = trimmed._sort_ranges(
+                offsets, offsets.length, ascending, stable, kind
+            )
+        return ak.contents.ListOffsetArray(
+            self._compact_offsets64(True), outcontent, parameters=self._parameters
+        )
+
     def _combinations(self, n, replacement, recordlookup, parameters, axis, depth):
         index_nplike = self._backend.index_nplike
 
@@ -1595,43 +1644,54 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
             return out
 
         else:
-            nextlen = index_nplike.index_as_shape_item(
-                self._offsets[-1] - self._offsets[0]
-            )
-            nextparents = Index64.empty(nextlen, index_nplike)
+            if (
+                isinstance(self._content, ak.contents.NumpyArray)
+                and self._content.data.ndim == 1
+                and shifts is None
+                and isinstance(self._backend.nplike, Numpy)
+                and isinstance(reducer, ak._reducers.KernelReducer)
+            ):
+                # Innermost lists of numbers: reduce each list between its
+                # offsets, rather than making a `nextparents` for every value
+                outcontent = self._reduce_next_offsets(reducer, mask, keepdims)
+            else:
+                nextlen = index_nplike.index_as_shape_item(
+                    self._offsets[-1] - self._offsets[0]
+                )
+                nextparents = Index64.empty(nextlen, index_nplike)
 
-            # n.b. awkward_ListOffsetArray_reduce_local_nextparents_64 always returns parents that are
-            # monotonically increasing (because it is local)
-            assert (
-                nextparents.nplike is index_nplike
-                and self._offsets.nplike is index_nplike
-            )
-            self._backend.maybe_kernel_error(
-                self._backend[
-                    "awkward_ListOffsetArray_reduce_local_nextparents_64",
-                    nextparents.dtype.type,
-                    self._offsets.dtype.type,
-                ](
-                    nextparents.data,
-                    self._offsets.data,
-                    globalstarts_length,
+                # n.b. awkward_ListOffsetArray_reduce_local_nextparents_64 always returns parents that are
+                # monotonically increasing (because it is local)
+                assert (
+                    nextparents.nplike is index_nplike
+                    and self._offsets.nplike is index_nplike
+                )
+                self._backend.maybe_kernel_error(
+                    self._backend[
+                        "awkward_ListOffsetArray_reduce_local_nextparents_64",
+                        nextparents.dtype.type,
+                        self._offsets.dtype.type,
+                    ](
+                        nextparents.data,
+                        self._offsets.data,
+                        globalstarts_length,
+                    )
                 )
-            )
 
-            trimmed = self._content[self.offsets[0] : self.offsets[-1]]
-            nextstarts = self.offsets[:-1]
+                trimmed = self._content[self.offsets[0] : self.offsets[-1]]
+                nextstarts = self.offsets[:-1]
 
-            outcontent = trimmed._reduce_next(
-                reducer,
-                negaxis,
-                nextstarts,
-                shifts,
-                nextparents,
-                globalstarts_length,
-                mask,
-                keepdims,
-                behavior,
-            )
+                outcontent = trimmed._reduce_next(
+                    reducer,
+                    negaxis,
+                    nextstarts,
+                    shifts,
+                    nextparents,
+                    globalstarts_length,
+                    mask,
+                    keepdims,
+                    behavior,
+                )
 
             outoffsets = Index64.empty(outlength + 1, index_nplike)
             assert outoffsets.nplike is index_nplike and parents.nplike is index_nplike
@@ -1664,6 +1724,31 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
 
             return ak.contents.ListOffsetArray(outoffsets, outcontent, parameters=None)
 
+    def _reduce_next_offsets(self, reducer, mask, keepdims):
+        # Equivalent to `NumpyArray._reduce_next` on the values of these lists with
+        # `parents` derived from the offsets (which start at zero), but the scratch
+        # space is proportional to the number of lists, not the number of values.
+        trimmed = self._content[: self._offsets[-1]]
+        if not trimmed.is_contiguous:
+            trimmed = trimmed.to_contiguous()
+
+        out = reducer.apply_offsets(trimmed, self._offsets)
+
+        if mask:
+            offsets = self._backend.index_nplike.asarray(self._offsets.data)
+            outmask = ak.index.Index8(
+                self._backend.index_nplike.astype(
+                    offsets[1:] == offsets[:-1], dtype=np.int8
+                ),
+                nplike=self._backend.index_nplike,
+            )
+            out = ak.contents.ByteMaskedArray(outmask, out, False, parameters=None)
+
+        if keepdims:
+            out = ak.contents.RegularArray(out, 1, trimmed.length, parameters=None)
+
+        return out
+
     def _rearrange_prepare_next(self, outlength, parents):
         index_nplike = self._backend.index_nplike
         nextlen = index_nplike.index_as_shape_item(self._offsets[-1] - self._offsets[0])
@@ -2271,7 +2356,13 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
             raise AssertionError(result)
 
     def to_packed(self, recursive: bool = True) -> Self:
-        next = self.to_ListOffsetArray64(True)
+        # Already-packed offsets are kept as they are, rather than copied
+        if self._offsets.dtype == np.dtype(np.int64) and (
+            self._backend.index_nplike.known_data and self._offsets[0] == 0
+        ):
+            next = self
+        else:
+            next = self.to_ListOffsetArray64(True)
         next_content = next._content[: next._offsets[-1]]
         return ListOffsetArray(
             next._offsets,
@@ -2299,30 +2390,31 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
 
         nextcontent = self._content._getitem_range(mini, maxi)
 
+        # slicing Python objects by Python ints is much faster than by NumPy ints
+        bounds = zip(starts_data.tolist(), stops_data.tolist())
+
         if self.parameter("__array__") == "bytestring":
             convert_bytes = (
                 None if json_conversions is None else json_conversions["convert_bytes"]
             )
-            data = nextcontent.data
-            out = [None] * starts.length
+            data = ak._util.tobytes(nextcontent.data)
             if convert_bytes is None:
-                for i in range(starts.length):
-                    out[i] = ak._util.tobytes(data[starts_data[i] : stops_data[i]])
+                return [data[start:stop] for start, stop in bounds]
             else:
-                for i in range(starts.length):
-                    out[i] = convert_bytes(
-                        ak._util.tobytes(data[starts_data[i] : stops_data[i]])
-                    )
-            return out
+                return [convert_bytes(data[start:stop]) for start, stop in bounds]
 
         elif self.parameter("__array__") == "string":
             data = nextcontent.data
-            out = [None] * starts.length
-            for i in range(starts.length):
-                out[i] = ak._util.tobytes(data[starts_data[i] : stops_data[i]]).decode(
-                    errors="surrogateescape"
-                )
-            return out
+            if numpy.all(data < 128):
+                # ASCII characters are one byte each, so the offsets are the same
+                text = ak._util.tobytes(data).decode()
+                return [text[start:stop] for start, stop in bounds]
+            else:
+                data = ak._util.tobytes(data)
+                return [
+                    data[start:stop].decode(errors="surrogateescape")
+                    for start, stop in bounds
+                ]
 
         else:
             out = self._to_list_custom(behavior, json_conversions)
@@ -2330,11 +2422,7 @@ class ListOffsetArray(ListOffsetMeta[Content], Content):
                 return out
 
             content = nextcontent._to_list(behavior, json_conversions)
-            out = [None] * starts.length
-
-            for i in range(starts.length):
-                out[i] = content[starts_data[i] : stops_data[i]]
-            return out
+            return [content[start:stop] for start, stop in bounds]
 
     def _to_backend(self, backend: Backend) -> Self:
         content = self._content.to_backend(backend)
@@ -122,13 +122,13 @@ class NumpyArray(NumpyMeta, Content):
         if not isinstance(backend.nplike, Jax):
             ak.types.numpytype.dtype_to_primitive(self._data.dtype)
 
-        if len(self._data.shape) == 0:
+        if self._data.ndim == 0:
             raise TypeError(
                 f"{type(self).__name__} 'data' must be an array, not a scalar: {data!r}"
             )
 
         if parameters is not None and parameters.get("__array__") in ("char", "byte"):
-            if data.dtype != np.dtype(np.uint8) or len(data.shape) != 1:
+            if data.dtype != np.dtype(np.uint8) or data.ndim != 1:
                 raise ValueError(
                     "{} is a {}, so its 'data' must be 1-dimensional and uint8, not {}".format(
                         type(self).__name__, parameters["__array__"], repr(data)
@@ -355,6 +355,8 @@ class NumpyArray(NumpyMeta, Content):
             nextdata = self._data[carry.data]
         except IndexError as err:
             raise ak._errors.index_error(self, carry.data, str(err)) from err
+        if ak._profiling.recorders:
+            ak._profiling.allocated(nextdata, "NumpyArray._carry")
         return NumpyArray(nextdata, parameters=self._parameters, backend=self._backend)
 
     def _getitem_next_jagged(
@@ -894,15 +896,15 @@ class NumpyArray(NumpyMeta, Content):
             )
 
     def _argsort_next(
-        self, negaxis, starts, shifts, parents, outlength, ascending, stable
+        self, negaxis, starts, shifts, parents, outlength, ascending, stable, kind
     ):
         if len(self.shape) != 1:
             return self.to_RegularArray()._argsort_next(
-                negaxis, starts, shifts, parents, outlength, ascending, stable
+                negaxis, starts, shifts, parents, outlength, ascending, stable, kind
             )
         elif not self.is_contiguous:
             return self.to_contiguous()._argsort_next(
-                negaxis, starts, shifts, parents, outlength, ascending, stable
+                negaxis, starts, shifts, parents, outlength, ascending, stable, kind
             )
         else:
             parents_length = parents.length
@@ -944,31 +946,8 @@ class NumpyArray(NumpyMeta, Content):
                 )
             )
 
-            dtype = (
-                np.dtype(np.int64)
-                if self._data.dtype.kind.upper() == "M"
-                else self._data.dtype
-            )
-            nextcarry = ak.index.Index64.empty(self.length, self._backend.index_nplike)
-            assert (
-                nextcarry.nplike is self._backend.index_nplike
-                and offsets.nplike is self._backend.index_nplike
-            )
-            self._backend.maybe_kernel_error(
-                self._backend[
-                    "awkward_argsort",
-                    nextcarry.dtype.type,
-                    dtype.type,
-                    offsets.dtype.type,
-                ](
-                    nextcarry.data,
-                    self._data,
-                    self.length,
-                    offsets.data,
-                    offsets_length,
-                    ascending,
-                    stable,
-                )
+            nextcarry = self._argsort_ranges(
+                offsets, offsets_length, ascending, stable, kind
             )
 
             if shifts is not None:
@@ -1000,14 +979,14 @@ class NumpyArray(NumpyMeta, Content):
             out = NumpyArray(nextcarry.data, parameters=None, backend=self._backend)
             return out
 
-    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable):
+    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable, kind):
         if len(self.shape) != 1:
             return self.to_RegularArray()._sort_next(
-                negaxis, starts, parents, outlength, ascending, stable
+                negaxis, starts, parents, outlength, ascending, stable, kind
             )
         elif not self.is_contiguous:
             return self.to_contiguous()._sort_next(
-                negaxis, starts, parents, outlength, ascending, stable
+                negaxis, starts, parents, outlength, ascending, stable, kind
             )
 
         else:
@@ -1051,6 +1030,60 @@ class NumpyArray(NumpyMeta, Content):
                 )
             )
 
+            return self._sort_ranges(offsets, offsets_length, ascending, stable, kind)
+
+    def _argsort_ranges(self, offsets, offsets_length, ascending, stable, kind):
+        # Positions that sort each `self._data[offsets[i]:offsets[i + 1]]`,
+        # relative to the start of each range
+        if self._is_radix_sortable(kind):
+            return ak.index.Index64(
+                ak._nplikes.numpy_sorting.radix_argsort(
+                    self._backend.nplike.asarray(self._data),
+                    offsets.data,
+                    ascending,
+                    True,
+                ),
+                nplike=self._backend.index_nplike,
+            )
+
+        dtype = (
+            np.dtype(np.int64)
+            if self._data.dtype.kind.upper() == "M"
+            else self._data.dtype
+        )
+        nextcarry = ak.index.Index64.empty(self.length, self._backend.index_nplike)
+        assert (
+            nextcarry.nplike is self._backend.index_nplike
+            and offsets.nplike is self._backend.index_nplike
+        )
+        self._backend.maybe_kernel_error(
+            self._backend[
+                "awkward_argsort",
+                nextcarry.dtype.type,
+                dtype.type,
+                offsets.dtype.type,
+            ](
+                nextcarry.data,
+                self._data,
+                self.length,
+                offsets.data,
+                offsets_length,
+                ascending,
+                stable,
+            )
+        )
+        return nextcarry
+
+    def _sort_ranges(self, offsets, offsets_length, ascending, stable, kind):
+        # Sorts each `self._data[offsets[i]:offsets[i + 1]]`
+        if self._is_radix_sortable(kind):
+            data = self._backend.nplike.asarray(self._data)
+            out = data[
+                ak._nplikes.numpy_sorting.radix_argsort(
+                    data, offsets.data, ascending, False
+                )
+            ]
+        else:
             dtype = (
                 np.dtype(np.int64)
                 if self._data.dtype.kind.upper() == "M"
@@ -1070,16 +1103,23 @@ class NumpyArray(NumpyMeta, Content):
                     self.shape[0],
                     offsets.data,
                     offsets_length,
-                    parents_length,
+                    self.shape[0],
                     ascending,
                     stable,
                 )
             )
-            return ak.contents.NumpyArray(
-                self._backend.nplike.asarray(out, dtype=self.dtype),
-                parameters=None,
-                backend=self._backend,
-            )
+        return ak.contents.NumpyArray(
+            self._backend.nplike.asarray(out, dtype=self.dtype),
+            parameters=None,
+            backend=self._backend,
+        )
+
+    def _is_radix_sortable(self, kind):
+        return (
+            kind == "radix"
+            and isinstance(self._backend.nplike, Numpy)
+            and ak._nplikes.numpy_sorting.is_radix_sortable(self.dtype)
+        )
 
     def _combinations(self, n, replacement, recordlookup, parameters, axis, depth):
         posaxis = maybe_posaxis(self, axis, depth)
@@ -512,6 +512,9 @@ class RecordArray(RecordMeta[Content], Content):
                     raise ak._errors.index_error(self, where)
 
             nextindex = ak.index.Index64(where, nplike=self._backend.index_nplike)
+            if ak._carry.should_compact(nextindex, self):
+                return ak._carry.compact(self, nextindex)
+            ak._carry.count("lazy")
             return ak.contents.IndexedArray(nextindex, self, parameters=None)
 
         else:
@@ -832,11 +835,11 @@ class RecordArray(RecordMeta[Content], Content):
         raise NotImplementedError
 
     def _argsort_next(
-        self, negaxis, starts, shifts, parents, outlength, ascending, stable
+        self, negaxis, starts, shifts, parents, outlength, ascending, stable, kind
     ):
         raise NotImplementedError
 
-    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable):
+    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable, kind):
         if len(self.fields) == 0:
             return ak.contents.NumpyArray(
                 self._backend.nplike.instance().empty(0, dtype=np.int64),
@@ -848,7 +851,7 @@ class RecordArray(RecordMeta[Content], Content):
         for content in self._contents:
             contents.append(
                 content._sort_next(
-                    negaxis, starts, parents, outlength, ascending, stable
+                    negaxis, starts, parents, outlength, ascending, stable, kind
                 )
             )
         return RecordArray(
@@ -1266,22 +1269,21 @@ class RecordArray(RecordMeta[Content], Content):
         if out is not None:
             return out
 
-        if self.is_tuple and json_conversions is None:
+        if len(self._contents) == 0:
+            # zip would stop at zero items, not at the length of the record
+            items = [()] * self._length
+        else:
             contents = [x._to_list(behavior, json_conversions) for x in self._contents]
-            out = [None] * self._length
-            for i in range(self._length):
-                out[i] = tuple(x[i] for x in contents)
-            return out
+            items = zip(*[x[: self._length] for x in contents])
+
+        if self.is_tuple and json_conversions is None:
+            return list(items)
 
         else:
             fields = self._fields
             if fields is None:
                 fields = [str(i) for i in range(len(self._contents))]
-            contents = [x._to_list(behavior, json_conversions) for x in self._contents]
-            out = [None] * self._length
-            for i in range(self._length):
-                out[i] = dict(zip(fields, [x[i] for x in contents]))
-            return out
+            return [dict(zip(fields, item)) for item in items]
 
     def _to_backend(self, backend: Backend) -> Self:
         contents = [content.to_backend(backend) for content in self._contents]
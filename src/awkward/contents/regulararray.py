@@ -848,11 +848,11 @@ class RegularArray(RegularMeta[Content], Content):
         return out
 
     def _argsort_next(
-        self, negaxis, starts, shifts, parents, outlength, ascending, stable
+        self, negaxis, starts, shifts, parents, outlength, ascending, stable, kind
     ):
         next = self.to_ListOffsetArray64(True)
         out = next._argsort_next(
-            negaxis, starts, shifts, parents, outlength, ascending, stable
+            negaxis, starts, shifts, parents, outlength, ascending, stable, kind
         )
 
         if isinstance(out, ak.contents.RegularArray):
@@ -866,9 +866,9 @@ class RegularArray(RegularMeta[Content], Content):
 
         return out
 
-    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable):
+    def _sort_next(self, negaxis, starts, parents, outlength, ascending, stable, kind):
         out = self.to_ListOffsetArray64(True)._sort_next(
-            negaxis, starts, parents, outlength, ascending, stable
+            negaxis, starts, parents, outlength, ascending, stable, kind
         )
 
         # FIXME
@@ -1468,38 +1468,27 @@ class RegularArray(RegularMeta[Content], Content):
         if not self._backend.nplike.known_data:
             raise TypeError("cannot convert typetracer arrays to Python lists")
 
+        length, size = self._length, self._size
+
         if self.parameter("__array__") == "bytestring":
             convert_bytes = (
                 None if json_conversions is None else json_conversions["convert_bytes"]
             )
             content = ak._util.tobytes(self._content.data)
-            length, size = self._length, self._size
-            out = [None] * length
             if convert_bytes is None:
-                for i in range(length):
-                    out[i] = content[(i) * size : (i + 1) * size]
+                return [content[i * size : (i + 1) * size] for i in range(length)]
             else:
-                for i in range(length):
-                    out[i] = convert_bytes(content[(i) * size : (i + 1) * size])
-            return out
+                return [
+                    convert_bytes(content[i * size : (i + 1) * size])
+                    for i in range(length)
+                ]
 
         elif self.parameter("__array__") == "string":
-            data = self._content.data
-            if hasattr(data, "tobytes"):
-
-                def tostring(x):
-                    return x.tobytes().decode(errors="surrogateescape")
-
-            else:
-
-                def tostring(x):
-                    return x.tostring().decode(errors="surrogateescape")
-
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = tostring(data[(i) * size : (i + 1) * size])
-            return out
+            content = ak._util.tobytes(self._content.data)
+            return [
+                content[i * size : (i + 1) * size].decode(errors="surrogateescape")
+                for i in range(length)
+            ]
 
         else:
             out = self._to_list_custom(behavior, json_conversions)
@@ -1507,11 +1496,7 @@ class RegularArray(RegularMeta[Content], Content):
                 return out
 
             content = self._content._to_list(behavior, json_conversions)
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = content[(i) * size : (i + 1) * size]
-            return out
+            return [content[i * size : (i + 1) * size] for i in range(length)]
 
     def _to_backend(self, backend: Backend) -> Self:
         content = self._content.to_backend(backend)
@@ -10,7 +10,6 @@ import inspect
 import io
 import itertools
 import keyword
-import pickle
 import re
 import weakref
 from collections.abc import Iterable, Mapping, Sequence, Sized
@@ -39,6 +38,7 @@ from awkward._nplikes.numpy_like import NumpyMetadata
 from awkward._operators import NDArrayOperatorsMixin
 from awkward._pickle import (
     custom_reduce,
+    to_pickle_buffers,
     unpickle_array_schema_1,
     unpickle_record_schema_1,
 )
@@ -1661,16 +1661,7 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
             return result
 
         packed_layout = ak.operations.to_packed(self._layout, highlevel=False)
-        form, length, container = ak.operations.to_buffers(
-            packed_layout,
-            buffer_key="{form_key}-{attribute}",
-            form_key="node{id}",
-            byteorder="<",
-        )
-
-        # For pickle >= 5, we can avoid copying the buffers
-        if protocol >= 5:
-            container = {k: pickle.PickleBuffer(v) for k, v in container.items()}
+        form_dict, length, container = to_pickle_buffers(packed_layout, protocol)
 
         if self._behavior is ak.behavior:
             behavior = None
@@ -1683,7 +1674,7 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
             attrs = without_transient_attrs(self._attrs)
 
         return unpickle_array_schema_1, (
-            form.to_dict(),
+            form_dict,
             length,
             container,
             behavior,
@@ -2488,16 +2479,7 @@ class Record(NDArrayOperatorsMixin):
             return result
 
         packed_layout = ak.operations.to_packed(self._layout, highlevel=False)
-        form, length, container = ak.operations.to_buffers(
-            packed_layout.array,
-            buffer_key="{form_key}-{attribute}",
-            form_key="node{id}",
-            byteorder="<",
-        )
-
-        # For pickle >= 5, we can avoid copying the buffers
-        if protocol >= 5:
-            container = {k: pickle.PickleBuffer(v) for k, v in container.items()}
+        form_dict, length, container = to_pickle_buffers(packed_layout.array, protocol)
 
         if self._behavior is ak.behavior:
             behavior = None
@@ -2510,7 +2492,7 @@ class Record(NDArrayOperatorsMixin):
             attrs = without_transient_attrs(self._attrs)
 
         return unpickle_record_schema_1, (
-            form.to_dict(),
+            form_dict,
             length,
             container,
             behavior,
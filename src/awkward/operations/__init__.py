@@ -12,6 +12,7 @@ from awkward.operations.ak_argcombinations import *
 from awkward.operations.ak_argmax import *
 from awkward.operations.ak_argmin import *
 from awkward.operations.ak_argsort import *
+from awkward.operations.ak_argtop_k import *
 from awkward.operations.ak_array_equal import *
 from awkward.operations.ak_backend import *
 from awkward.operations.ak_broadcast_arrays import *
@@ -35,6 +36,7 @@ from awkward.operations.ak_from_arrow import *
 from awkward.operations.ak_from_arrow_schema import *
 from awkward.operations.ak_from_avro_file import *
 from awkward.operations.ak_from_buffers import *
+from awkward.operations.ak_from_buffers_file import *
 from awkward.operations.ak_from_categorical import *
 from awkward.operations.ak_from_cupy import *
 from awkward.operations.ak_from_dlpack import *
@@ -44,9 +46,11 @@ from awkward.operations.ak_from_jax import *
 from awkward.operations.ak_from_json import *
 from awkward.operations.ak_from_numpy import *
 from awkward.operations.ak_from_parquet import *
+from awkward.operations.ak_from_parquet_iter import *
 from awkward.operations.ak_from_raggedtensor import *
 from awkward.operations.ak_from_rdataframe import *
 from awkward.operations.ak_from_regular import *
+from awkward.operations.ak_from_shared_memory import *
 from awkward.operations.ak_from_tensorflow import *
 from awkward.operations.ak_from_torch import *
 from awkward.operations.ak_full_like import *
@@ -56,8 +60,13 @@ from awkward.operations.ak_is_none import *
 from awkward.operations.ak_is_tuple import *
 from awkward.operations.ak_is_valid import *
 from awkward.operations.ak_isclose import *
+from awkward.operations.ak_iter_cartesian import *
+from awkward.operations.ak_iter_combinations import *
+from awkward.operations.ak_kernel_threads import *
+from awkward.operations.ak_lazy_carries import *
 from awkward.operations.ak_linear_fit import *
 from awkward.operations.ak_local_index import *
+from awkward.operations.ak_map_partitions import *
 from awkward.operations.ak_mask import *
 from awkward.operations.ak_max import *
 from awkward.operations.ak_mean import *
@@ -73,9 +82,11 @@ from awkward.operations.ak_ones_like import *
 from awkward.operations.ak_pad_none import *
 from awkward.operations.ak_parameters import *
 from awkward.operations.ak_prod import *
+from awkward.operations.ak_profile import *
 from awkward.operations.ak_ptp import *
 from awkward.operations.ak_ravel import *
 from awkward.operations.ak_real import *
+from awkward.operations.ak_reduce_many import *
 from awkward.operations.ak_round import *
 from awkward.operations.ak_run_lengths import *
 from awkward.operations.ak_singletons import *
@@ -88,6 +99,7 @@ from awkward.operations.ak_to_arrow import *
 from awkward.operations.ak_to_arrow_table import *
 from awkward.operations.ak_to_backend import *
 from awkward.operations.ak_to_buffers import *
+from awkward.operations.ak_to_buffers_file import *
 from awkward.operations.ak_to_cudf import *
 from awkward.operations.ak_to_cupy import *
 from awkward.operations.ak_to_dataframe import *
@@ -104,8 +116,10 @@ from awkward.operations.ak_to_parquet_row_groups import *
 from awkward.operations.ak_to_raggedtensor import *
 from awkward.operations.ak_to_rdataframe import *
 from awkward.operations.ak_to_regular import *
+from awkward.operations.ak_to_shared_memory import *
 from awkward.operations.ak_to_tensorflow import *
 from awkward.operations.ak_to_torch import *
+from awkward.operations.ak_top_k import *
 from awkward.operations.ak_transform import *
 from awkward.operations.ak_type import *
 from awkward.operations.ak_unflatten import *
@@ -25,6 +25,7 @@ def argsort(
     *,
     ascending=True,
     stable=True,
+    kind=None,
     highlevel=True,
     behavior=None,
     attrs=None,
@@ -41,6 +42,10 @@ def argsort(
             is from largest to smallest.
         stable (bool): If True, use a stable sorting algorithm; if False,
             use a sorting algorithm that is not guaranteed to be stable.
+        kind (None or `"radix"`): If `"radix"`, sort lists of integers (including
+            booleans and datetimes) with a radix sort, which is stable and takes
+            time proportional to the number of values, rather than a comparison
+            sort. Other types are sorted as usual.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.contents.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -70,10 +75,13 @@ def argsort(
     yield (array,)
 
     # Implementation
-    return _impl(array, axis, ascending, stable, highlevel, behavior, attrs)
+    return _impl(array, axis, ascending, stable, kind, highlevel, behavior, attrs)
 
 
-def _impl(array, axis, ascending, stable, highlevel, behavior, attrs):
+def _impl(array, axis, ascending, stable, kind, highlevel, behavior, attrs):
+    if kind not in (None, "radix"):
+        raise ValueError(f"'kind' must be None or 'radix', not {kind!r}")
+
     with HighLevelContext(behavior=behavior, attrs=attrs) as ctx:
         layout = ctx.unwrap(array, allow_record=False, primitive_policy="error")
 
@@ -84,7 +92,7 @@ def _impl(array, axis, ascending, stable, highlevel, behavior, attrs):
 
     axis = regularize_axis(axis, none_allowed=False)
 
-    out = ak._do.argsort(layout, axis, ascending, stable)
+    out = ak._do.argsort(layout, axis, ascending, stable, kind)
 
     return ctx.wrap(
         out,
@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+
+__all__ = ("argtop_k",)
+
+
+@high_level_function()
+def argtop_k(
+    array,
+    k,
+    axis=-1,
+    *,
+    ascending=False,
+    pad=False,
+    highlevel=True,
+    behavior=None,
+    attrs=None,
+):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        k (int): The number of values to select from each list.
+        axis (int): The dimension at which this operation is applied. The
+            outermost dimension is `0`, followed by `1`, etc., and negative
+            values count backward from the innermost: `-1` is the innermost
+            dimension, `-2` is the next level up, etc.
+        ascending (bool): If True, select the `k` smallest values of each list;
+            if False, select the `k` largest.
+        pad (bool): If True, lists with fewer than `k` values are padded with
+            None, so that the output lists have regular lengths of exactly `k`
+            (as with #ak.pad_none and `clip=True`); otherwise, each output list
+            has at most `k` values.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.contents.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+        attrs (None or dict): Custom attributes for the output array, if
+            high-level.
+
+    Returns an array of integer indexes of the `k` largest (or, if `ascending`,
+    smallest) values of each list, in order. This is the same as
+
+        ak.argsort(array, axis=axis, ascending=ascending, stable=True)[..., :k]
+
+    (in which `...` stands for the dimensions up to `axis`), including the
+    order of equal values and NaN, which is first in both directions.
+
+    For example,
+
+        >>> array = ak.Array([[7.7, 5.5, 9.9, 1.1], [], [2.2], [8.8, 2.2]])
+        >>> ak.argtop_k(array, 2)
+        <Array [[2, 0], [], [0], [0, 1]] type='4 * var * int64'>
+        >>> array[ak.argtop_k(array, 2)]
+        <Array [[9.9, 7.7], [], [2.2], [8.8, 2.2]] type='4 * var * float64'>
+
+    Lists of numbers that are long compared with `k` are not sorted: the `k`-th
+    value of each list is found by a partial selection and only the values
+    before it are sorted. Short lists are sorted, as in #ak.argsort.
+
+    See also #ak.top_k.
+    """
+    # Dispatch
+    yield (array,)
+
+    # Implementation
+    return _impl(array, k, axis, ascending, pad, highlevel, behavior, attrs)
+
+
+def _impl(array, k, axis, ascending, pad, highlevel, behavior, attrs):
+    return ak.operations.ak_top_k._impl(
+        array, k, axis, ascending, pad, True, highlevel, behavior, attrs
+    )
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import math
+from functools import cache
 
 import awkward as ak
+import awkward._codecs
 from awkward._backends.dispatch import regularize_backend
 from awkward._dispatch import high_level_function
 from awkward._layout import wrap_layout
@@ -13,6 +15,7 @@ from awkward._nplikes.numpy import Numpy
 from awkward._nplikes.numpy_like import NumpyLike, NumpyMetadata
 from awkward._nplikes.placeholder import PlaceholderArray
 from awkward._nplikes.shape import ShapeItem, unknown_length
+from awkward._nplikes.virtual import LRUBufferCache, VirtualArray
 from awkward._regularize import is_integer
 from awkward.forms.form import index_to_dtype, regularize_buffer_key
 
@@ -32,6 +35,8 @@ def from_buffers(
     backend="cpu",
     byteorder="<",
     allow_noncanonical_form=False,
+    cache=None,
+    compression=None,
     highlevel=True,
     behavior=None,
     attrs=None,
@@ -45,6 +50,8 @@ def from_buffers(
         container (Mapping, such as dict): The str \u2192 Python buffers that
             represent the decomposed Awkward Array. This `container` is only
             assumed to have a `__getitem__` method that accepts strings as keys.
+            Its values may also be zero-argument callables that return the
+            buffers, to load them lazily (see below).
         buffer_key (str or callable): Python format string containing
             `"{form_key}"` and/or `"{attribute}"` or a function that takes these
             as keyword arguments and returns a string to use as a key for a buffer
@@ -59,6 +66,16 @@ def from_buffers(
         allow_noncanonical_form (bool): If True, non-canonical forms will be
             simplified to produce arrays with canonical layouts; otherwise,
             an exception will be thrown for such forms.
+        cache (None, int, or MutableMapping): Where to keep the buffers that
+            are generated by callables in the `container`. If None, each buffer
+            is generated at most once and kept by the array. If an int, buffers
+            are kept in a least-recently-used cache of at most this many bytes.
+            Otherwise, buffers are stored in this mapping, with buffer keys as
+            keys (so the mapping may be shared among arrays with the same
+            `container`).
+        compression (None, `"zlib"`, `"lzma"`, `"bz2"`, `"zstd"`, `"lz4"`): The
+            codec that the buffers were compressed with by #ak.to_buffers, or
+            None if they are not compressed.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.contents.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -84,6 +101,25 @@ def from_buffers(
     a view over their existing data will be used, where possible.
 
     The `buffer_key` should be the same as the one used in #ak.to_buffers.
+    So should the `compression`: buffers that were compressed by #ak.to_buffers
+    are decompressed (when they are needed, if they are loaded lazily).
+
+    If a value of the `container` is callable, it is called (without arguments)
+    only when its buffer is needed, e.g. by a kernel, a NumPy function, or
+    conversion to a list. The `container` may therefore be a loader object whose
+    `__getitem__` returns functions that fetch buffers from a file or object
+    store, so that only the buffers an analysis uses are ever read:
+
+        >>> form, length, container = ak.to_buffers(original)
+        >>> lazy = ak.from_buffers(
+        ...     form, length, {key: (lambda v=v: v) for key, v in container.items()}
+        ... )
+
+    Buffers that determine the lengths of nested nodes (for instance, the
+    offsets of a list whose items are records) are loaded when the array is
+    constructed; all others are loaded when they are first used. With a bounded
+    `cache`, a buffer can be evicted and loaded again later, so the callables
+    need to be able to produce their buffer more than once.
 
     When `allow_noncanonical_form` is set to True, this function readily accepts
     non-simplified forms, i.e. forms which will be simplified by Awkward Array
@@ -111,6 +147,8 @@ def from_buffers(
         behavior,
         attrs,
         allow_noncanonical_form,
+        cache,
+        compression,
     )
 
 
@@ -125,9 +163,21 @@ def _impl(
     behavior,
     attrs,
     simplify,
+    cache=None,
+    compression=None,
 ):
     backend = regularize_backend(backend)
 
+    if compression is not None:
+        container = _DecompressingContainer(
+            container, ak._codecs.get_codec(compression)
+        )
+
+    if cache is not None:
+        if is_integer(cache):
+            cache = LRUBufferCache(cache)
+        container = _CachingContainer(container, cache)
+
     if isinstance(form, str):
         if ak.types.numpytype.is_primitive(form):
             form = ak.forms.NumpyForm(form)
@@ -154,6 +204,60 @@ def _impl(
     return wrap_layout(out, highlevel=highlevel, attrs=attrs, behavior=behavior)
 
 
+class _DecompressingContainer:
+    # Decompresses buffers from ak.to_buffers(..., compression=...); callable
+    # buffers only when they are called
+    def __init__(self, container, codec):
+        self._container = container
+        self._codec = codec
+
+    def __getitem__(self, key):
+        buffer = self._container[key]
+        if isinstance(buffer, PlaceholderArray):
+            return buffer
+        elif callable(buffer):
+            return lambda: ak._codecs.decode(buffer(), self._codec)
+        else:
+            return ak._codecs.decode(buffer, self._codec)
+
+
+class _CachingContainer:
+    # Tells _from_buffer which cache and key to use for each callable buffer
+    def __init__(self, container, cache):
+        self._container = container
+        self._cache = cache
+
+    def __getitem__(self, key):
+        buffer = self._container[key]
+        if callable(buffer):
+            return _CachedGenerator(buffer, self._cache, key)
+        else:
+            return buffer
+
+
+class _CachedGenerator:
+    def __init__(self, generator, cache, key):
+        self.generator = generator
+        self.cache = cache
+        self.key = key
+
+    def __call__(self):
+        return self.generator()
+
+
+def _resolve(length) -> ShapeItem:
+    # Lengths that depend on not-yet-materialized buffers are passed around as
+    # zero-argument callables, so that they are only computed on demand.
+    if callable(length):
+        return length()
+    else:
+        return length
+
+
+def _is_lazy(array) -> bool:
+    return isinstance(array, VirtualArray) and not array.is_materialized
+
+
 def _from_buffer(
     nplike: NumpyLike,
     buffer,
@@ -162,6 +266,34 @@ def _from_buffer(
     byteorder: str,
     field_path: tuple,
 ) -> ArrayLike:
+    # Callables in the container produce their buffer on demand: wrap them in
+    # a VirtualArray that only calls them (and interprets the result) when the
+    # values are needed by a kernel or some other operation.
+    if callable(buffer) and count is not unknown_length:
+        if callable(count):
+            shape = (unknown_length,)
+            shape_generator = lambda: (_resolve(count),)
+        else:
+            shape = (count,)
+            shape_generator = None
+        if isinstance(buffer, _CachedGenerator):
+            buffer_cache, cache_key = buffer.cache, buffer.key
+        else:
+            buffer_cache, cache_key = None, None
+        return VirtualArray(
+            nplike,
+            shape,
+            dtype,
+            lambda: _from_buffer(
+                nplike, buffer(), dtype, _resolve(count), byteorder, field_path
+            ),
+            shape_generator,
+            field_path,
+            buffer_cache,
+            cache_key,
+        )
+    count = _resolve(count)
+
     # Unknown-length information implies that we didn't load shape-buffers (offsets, etc)
     # for the parent of this node. Thus, this node and its children *must* only
     # contain placeholders
@@ -174,7 +306,9 @@ def _from_buffer(
     # of #ak.from_buffers, or we can just introduce the known lengths where possible
     elif isinstance(buffer, PlaceholderArray) and buffer.size is unknown_length:
         return PlaceholderArray(nplike, (count,), dtype, field_path)
-    elif isinstance(buffer, PlaceholderArray) or nplike.is_own_array(buffer):
+    elif isinstance(buffer, (PlaceholderArray, VirtualArray)) or nplike.is_own_array(
+        buffer
+    ):
         # Require 1D buffers
         array = nplike.reshape(buffer.view(dtype), shape=(-1,), copy=False)
 
@@ -192,6 +326,21 @@ def _from_buffer(
 def _reconstitute(
     form, length, container, getkey, backend, byteorder, simplify, field_path
 ):
+    # Only some nodes can be built without knowing their length; all others
+    # need the lengths of (possibly virtual) parent buffers now.
+    if callable(length) and not isinstance(
+        form,
+        (
+            ak.forms.NumpyForm,
+            ak.forms.UnmaskedForm,
+            ak.forms.IndexedOptionForm,
+            ak.forms.IndexedForm,
+            ak.forms.ListForm,
+            ak.forms.ListOffsetForm,
+        ),
+    ):
+        length = _resolve(length)
+
     if isinstance(form, ak.forms.EmptyForm):
         if length != 0:
             raise ValueError(f"EmptyForm node, but the expected length is {length}")
@@ -200,7 +349,10 @@ def _reconstitute(
     elif isinstance(form, ak.forms.NumpyForm):
         dtype = ak.types.numpytype.primitive_to_dtype(form.primitive)
         raw_array = container[getkey(form, "data")]
-        real_length = length * math.prod(form.inner_shape)
+        if callable(length):
+            real_length = cache(lambda: length() * math.prod(form.inner_shape))
+        else:
+            real_length = length * math.prod(form.inner_shape)
         data = _from_buffer(
             backend.nplike,
             raw_array,
@@ -210,7 +362,9 @@ def _reconstitute(
             field_path=field_path,
         )
         if form.inner_shape != ():
-            data = backend.nplike.reshape(data, (length, *form.inner_shape))
+            data = backend.nplike.reshape(
+                data, (-1 if callable(length) else length, *form.inner_shape)
+            )
 
         return ak.contents.NumpyArray(
             data, parameters=form._parameters, backend=backend
@@ -313,10 +467,12 @@ def _reconstitute(
         )
         if isinstance(index, PlaceholderArray):
             next_length = unknown_length
-        else:
-            next_length = (
-                0 if len(index) == 0 else max(0, backend.index_nplike.max(index) + 1)
+        elif _is_lazy(index):
+            next_length = cache(
+                lambda: _indexed_option_next_length(backend, index.materialize())
             )
+        else:
+            next_length = _indexed_option_next_length(backend, index)
         content = _reconstitute(
             form.content,
             next_length,
@@ -349,14 +505,12 @@ def _reconstitute(
         )
         if isinstance(index, PlaceholderArray):
             next_length = unknown_length
-        else:
-            next_length = (
-                0
-                if len(index) == 0
-                else backend.index_nplike.index_as_shape_item(
-                    backend.index_nplike.max(index) + 1
-                )
+        elif _is_lazy(index):
+            next_length = cache(
+                lambda: _indexed_next_length(backend, index.materialize())
             )
+        else:
+            next_length = _indexed_next_length(backend, index)
         content = _reconstitute(
             form.content,
             next_length,
@@ -398,11 +552,14 @@ def _reconstitute(
         )
         if isinstance(stops, PlaceholderArray):
             next_length = unknown_length
-        else:
-            reduced_stops = stops[starts != stops]
-            next_length = (
-                0 if len(starts) == 0 else backend.index_nplike.max(reduced_stops)
+        elif _is_lazy(starts) or _is_lazy(stops):
+            next_length = cache(
+                lambda: _list_next_length(
+                    backend, starts.materialize(), stops.materialize()
+                )
             )
+        else:
+            next_length = _list_next_length(backend, starts, stops)
         content = _reconstitute(
             form.content,
             next_length,
@@ -426,15 +583,17 @@ def _reconstitute(
             backend.index_nplike,
             raw_array,
             dtype=index_to_dtype[form.offsets],
-            count=length + 1,
+            count=cache(lambda: length() + 1) if callable(length) else length + 1,
             byteorder=byteorder,
             field_path=field_path,
         )
 
         if isinstance(offsets, PlaceholderArray):
             next_length = unknown_length
+        elif _is_lazy(offsets):
+            next_length = cache(lambda: _list_offset_next_length(offsets.materialize()))
         else:
-            next_length = 0 if len(offsets) == 1 else offsets[-1]
+            next_length = _list_offset_next_length(offsets)
         content = _reconstitute(
             form.content,
             next_length,
@@ -546,3 +705,26 @@ def _reconstitute(
 
     else:
         raise AssertionError("unexpected form node type: " + str(type(form)))
+
+
+def _indexed_option_next_length(backend, index) -> ShapeItem:
+    return 0 if len(index) == 0 else max(0, backend.index_nplike.max(index) + 1)
+
+
+def _indexed_next_length(backend, index) -> ShapeItem:
+    return (
+        0
+        if len(index) == 0
+        else backend.index_nplike.index_as_shape_item(
+            backend.index_nplike.max(index) + 1
+        )
+    )
+
+
+def _list_next_length(backend, starts, stops) -> ShapeItem:
+    reduced_stops = stops[starts != stops]
+    return 0 if len(starts) == 0 else backend.index_nplike.max(reduced_stops)
+
+
+def _list_offset_next_length(offsets) -> ShapeItem:
+    return 0 if len(offsets) == 1 else offsets[-1]
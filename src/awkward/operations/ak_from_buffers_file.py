@@ -0,0 +1,97 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import json
+import mmap as mmap_module
+from os import PathLike, fsdecode
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+from awkward._nplikes.numpy_like import NumpyMetadata
+
+__all__ = ("from_buffers_file",)
+
+np = NumpyMetadata.instance()
+
+
+@high_level_function()
+def from_buffers_file(
+    source,
+    *,
+    mmap=True,
+    highlevel=True,
+    behavior=None,
+    attrs=None,
+):
+    """
+    Args:
+        source (path-like): Name of a file written by #ak.to_buffers_file.
+        mmap (bool): If True, the file is memory-mapped and the array's buffers
+            are views of the mapped file; otherwise, the whole file is read into
+            memory.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.contents.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+        attrs (None or dict): Custom attributes for the output array, if
+            high-level.
+
+    Reads an Awkward Array from a file written by #ak.to_buffers_file.
+
+    With `mmap=True` (the default), no data are copied: the buffers are read-only
+    NumPy arrays backed by the operating system's page cache, so opening a file
+    takes about the same time regardless of its size, and parts of the file are
+    only read from disk when they are accessed. Only the buffers that determine
+    the lengths of nested nodes (the last offset of each list, the indexes of
+    option and indexed types) are accessed when the array is constructed.
+
+    The mapping stays open as long as any array (or buffer) that views it exists.
+
+    See also #ak.to_buffers_file, #ak.from_buffers.
+    """
+    return _impl(source, mmap, highlevel, behavior, attrs)
+
+
+def _impl(source, mmap, highlevel, behavior, attrs):
+    if not isinstance(source, (str, bytes, PathLike)):
+        raise TypeError(
+            f"'source' must be a filename string or path-like object, not {type(source).__name__}"
+        )
+
+    with open(fsdecode(source), "rb") as file:
+        if mmap:
+            data = memoryview(
+                mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ)
+            )
+        else:
+            data = memoryview(file.read())
+
+    magic = ak.operations.ak_to_buffers_file._magic
+    header_size = ak.operations.ak_to_buffers_file._header_size
+    if data[: len(magic)] != magic:
+        raise ValueError(f"{source!r} is not a file written by ak.to_buffers_file")
+
+    start = len(magic) + header_size.size
+    (size,) = header_size.unpack(data[len(magic) : start])
+    header = json.loads(bytes(data[start : start + size]).decode("utf-8"))
+    data = data[ak.operations.ak_to_buffers_file._aligned(start + size) :]
+
+    container = {
+        key: data[offset : offset + nbytes]
+        for key, (offset, nbytes) in header["buffers"].items()
+    }
+    return ak.operations.ak_from_buffers._impl(
+        ak.forms.from_dict(header["form"]),
+        header["length"],
+        container,
+        "{form_key}-{attribute}",
+        "cpu",
+        header["byteorder"],
+        highlevel,
+        behavior,
+        attrs,
+        False,
+        None,
+        header.get("compression"),
+    )
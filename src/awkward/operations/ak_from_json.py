@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
+import mmap
 import pathlib
 from collections.abc import Iterable, Sized
-from contextlib import nullcontext
+from contextlib import contextmanager, nullcontext
 from io import BytesIO
 from urllib.parse import urlparse
 
@@ -31,6 +33,7 @@ def from_json(
     *,
     line_delimited=False,
     schema=None,
+    form=None,
     nan_string=None,
     posinf_string=None,
     neginf_string=None,
@@ -38,6 +41,7 @@ def from_json(
     buffersize=65536,
     initial=1024,
     resize=8,
+    max_workers=None,
     highlevel=True,
     behavior=None,
     attrs=None,
@@ -60,6 +64,11 @@ def from_json(
             is discovered while parsing. If a JSONSchema
             ([json-schema.org](https://json-schema.org/)), that schema is used to
             parse the JSON more quickly by skipping type-discovery.
+        form (None, #ak.forms.Form, or str/dict equivalent): If not None, the
+            data are parsed into an array of this Form (such as the `form` of an
+            array that was read before) as quickly as with a `schema`, skipping
+            type-discovery. The JSON must be an array of items of this Form or
+            (with `line_delimited=True`) a sequence of such items.
         nan_string (None or str): If not None, strings with this value will be
             interpreted as floating-point NaN values.
         posinf_string (None or str): If not None, strings with this value will
@@ -74,6 +83,11 @@ def from_json(
         initial (int): Initial size (in bytes) of buffers used by the `ak::ArrayBuilder`.
         resize (float): Resize multiplier for buffers used by the `ak::ArrayBuilder`;
             should be strictly greater than 1.
+        max_workers (None or int): If an integer greater than 1 and
+            `line_delimited=True`, the `source` is split at newlines into
+            chunks that are parsed concurrently by a pool of this many threads,
+            and the results are concatenated in order. If None, the `source`
+            is parsed in one pass.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.contents.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -89,8 +103,8 @@ def from_json(
     * Reading from in-memory str/bytes, on-disk or over-network file, or an
       arbitrary Python object with a `read(num_bytes)` method.
     * Reading a single JSON document or a sequence of line-delimited documents.
-    * Unknown schema (slow and general) or with a provided JSONSchema (fast, but
-      not all possible cases are supported).
+    * Unknown schema (slow and general) or with a provided JSONSchema or
+      #ak.forms.Form (fast, but not all possible cases are supported).
     * Conversion of strings representing not-a-number, plus and minus infinity
       into the appropriate floating-point numbers.
     * Conversion of records with a real and imaginary part into complex numbers.
@@ -183,9 +197,17 @@ def from_json(
     Note that JSON interpreted with `line_delimited` doesn't actually need delimiters
     between JSON documents or an absence of delimiters within each document. Parsing
     with `line_delimited=True` continues to the end of a JSON document and starts
-    again with the next JSON document. It may be necessary to require actual delimiters
-    between and never within JSON documents to split a large source for
-    parallel-processing, but that consideration is beyond this function.
+    again with the next JSON document.
+
+    Parsing JSON releases the Python GIL, so a large line-delimited `source` can be
+    read at the speed of many cores with `max_workers`. This requires actual
+    `"\\n"` delimiters between and never within JSON documents, since the `source`
+    is split at newlines. A local file is memory-mapped; any other `source` is read
+    into memory before it is split. Without a `schema`, the type of each chunk is
+    discovered separately and the chunks are merged as by #ak.concatenate, so the
+    result has the same values as parsing in one pass. Records are given all of the
+    fields that they have in any chunk (as None where they are missing), as they
+    are in one pass.
 
     If a JSONSchema is provided, the schema describes the structure of the JSON
     document, regardless of whether there's only one of them (may be an #ak.Record)
@@ -247,6 +269,33 @@ def from_json(
       and any properties in the data not described by `"properties"` will not
       appear in the output.
 
+    Forms
+    =====
+
+    If the type of the data is already known as an #ak.forms.Form, for instance
+    from an array that was read from similar JSON before, it can be passed as the
+    `form`, rather than translating it into a JSONSchema:
+
+        >>> array = ak.from_json('[{"x": 1.1, "y": [1]}, {"x": 2.2, "y": [1, 2]}]')
+        >>> ak.from_json('[{"x": 3.3, "y": [1, 2, 3]}]', form=array.layout.form)
+        <Array [{x: 3.3, y: [1, ...]}] type='1 * {x: float64, y: var * int64}'>
+
+    The result has the type of the `form`, including its parameters, numeric types
+    (numbers are parsed as 64-bit and then converted), regular dimensions, and
+    missing values, though its nodes may be different:
+
+    * Variable-length lists are #ak.contents.ListOffsetArray with 64-bit offsets.
+    * Missing values are #ak.contents.ByteMaskedArray for numbers, strings, and
+      variable-length lists and #ak.contents.IndexedOptionArray for records and
+      regular lists.
+    * #ak.contents.IndexedArray nodes are read as their contents, and an
+      #ak.contents.EmptyArray may only be reached by empty lists.
+    * Objects are read into records (or tuples, with fields `"0"`, `"1"`, etc.),
+      and object keys that are not fields of the `form` are ignored.
+
+    Forms with #ak.contents.UnionArray nodes, complex numbers, dates, or times
+    are not supported.
+
     Substitutions for non-finite and complex numbers
     ================================================
 
@@ -331,7 +380,33 @@ def from_json(
 
     See also #ak.to_json.
     """
-    if schema is None:
+    if max_workers is not None and not (is_integer(max_workers) and max_workers > 0):
+        raise ValueError(
+            f"max_workers must be None or a positive integer, not {max_workers!r}"
+        )
+
+    if schema is not None and form is not None:
+        raise ValueError("only one of 'schema' and 'form' can be given")
+
+    if form is not None:
+        return _yes_form(
+            source,
+            line_delimited,
+            form,
+            nan_string,
+            posinf_string,
+            neginf_string,
+            complex_record_fields,
+            buffersize,
+            initial,
+            resize,
+            max_workers,
+            highlevel,
+            behavior,
+            attrs,
+        )
+
+    elif schema is None:
         return _no_schema(
             source,
             line_delimited,
@@ -342,6 +417,7 @@ def from_json(
             buffersize,
             initial,
             resize,
+            max_workers,
             highlevel,
             behavior,
             attrs,
@@ -359,6 +435,7 @@ def from_json(
             buffersize,
             initial,
             resize,
+            max_workers,
             highlevel,
             behavior,
             attrs,
@@ -434,16 +511,17 @@ def _no_schema(
     buffersize,
     initial,
     resize,
+    max_workers,
     highlevel,
     behavior,
     attrs,
 ):
     ctx = HighLevelContext(behavior=behavior, attrs=attrs).finalize()
-    builder = _ext.ArrayBuilder(initial=initial, resize=resize)
 
     read_one = not line_delimited
 
-    with _get_reader(source) as obj:
+    def parse(obj):
+        builder = _ext.ArrayBuilder(initial=initial, resize=resize)
         try:
             _ext.fromjsonobj(
                 obj,
@@ -457,12 +535,13 @@ def _no_schema(
         except Exception as err:
             raise ValueError(str(err)) from None
 
-    formstr, length, buffers = builder.to_buffers()
-    form = ak.forms.from_json(formstr)
-    layout = ak.operations.from_buffers(
-        form, length, buffers, byteorder=ak._util.native_byteorder, highlevel=False
-    )
+        formstr, length, buffers = builder.to_buffers()
+        form = ak.forms.from_json(formstr)
+        return ak.operations.from_buffers(
+            form, length, buffers, byteorder=ak._util.native_byteorder, highlevel=False
+        )
 
+    layout = _parse(source, parse, line_delimited, max_workers)
     layout = _record_to_complex(layout, complex_record_fields)
 
     if read_one:
@@ -482,6 +561,7 @@ def _yes_schema(
     buffersize,
     initial,
     resize,
+    max_workers,
     highlevel,
     behavior,
     attrs,
@@ -512,28 +592,146 @@ def _yes_schema(
             "only 'array' and 'object' types supported at the JSONSchema root"
         )
 
+    return _yes_assembly(
+        source,
+        line_delimited,
+        form,
+        container,
+        instructions,
+        {},
+        is_record,
+        nan_string,
+        posinf_string,
+        neginf_string,
+        complex_record_fields,
+        buffersize,
+        initial,
+        resize,
+        max_workers,
+        highlevel,
+        behavior,
+        attrs,
+    )
+
+
+def _yes_form(
+    source,
+    line_delimited,
+    form,
+    nan_string,
+    posinf_string,
+    neginf_string,
+    complex_record_fields,
+    buffersize,
+    initial,
+    resize,
+    max_workers,
+    highlevel,
+    behavior,
+    attrs,
+):
+    if isinstance(form, str):
+        if ak.types.numpytype.is_primitive(form):
+            form = ak.forms.NumpyForm(form)
+        else:
+            form = ak.forms.from_json(form)
+    elif isinstance(form, dict):
+        form = ak.forms.from_dict(form)
+
+    if not isinstance(form, ak.forms.Form):
+        raise TypeError(
+            "'form' argument must be a Form or its Python dict/JSON string representation"
+        )
+
+    container = {}
+    instructions = []
+    dtypes = {}
+
+    if not line_delimited:
+        instructions.append(["TopLevelArray"])
+    form = _build_form_assembly(form, container, instructions, dtypes)
+
+    return _yes_assembly(
+        source,
+        line_delimited,
+        form,
+        container,
+        instructions,
+        dtypes,
+        False,
+        nan_string,
+        posinf_string,
+        neginf_string,
+        complex_record_fields,
+        buffersize,
+        initial,
+        resize,
+        max_workers,
+        highlevel,
+        behavior,
+        attrs,
+    )
+
+
+def _yes_assembly(
+    source,
+    line_delimited,
+    form,
+    container,
+    instructions,
+    dtypes,
+    is_record,
+    nan_string,
+    posinf_string,
+    neginf_string,
+    complex_record_fields,
+    buffersize,
+    initial,
+    resize,
+    max_workers,
+    highlevel,
+    behavior,
+    attrs,
+):
     read_one = not line_delimited
+    instructions = json.dumps(instructions)
 
-    with _get_reader(source) as obj:
+    def parse(obj):
+        # each parse fills its own buffers (the keys of 'container' are fixed)
+        buffers = dict(container)
         try:
             length = _ext.fromjsonobj_schema(
                 obj,
-                container,
+                buffers,
                 read_one,
                 buffersize,
                 nan_string,
                 posinf_string,
                 neginf_string,
-                json.dumps(instructions),
+                instructions,
                 initial,
                 resize,
             )
         except Exception as err:
             raise ValueError(str(err)) from None
 
-    layout = ak.operations.from_buffers(
-        form, length, container, byteorder=ak._util.native_byteorder, highlevel=False
-    )
+        # the parser only fills int64 and float64 numbers
+        for key, dtype in dtypes.items():
+            if dtype.kind in "iu" and len(buffers[key]) != 0:
+                info = np.iinfo(dtype)
+                low, high = int(buffers[key].min()), int(buffers[key].max())
+                if low < info.min or high > info.max:
+                    raise ValueError(
+                        f"JSON integer {low if low < info.min else high} "
+                        f"is out of range for {dtype}"
+                    )
+            buffers[key] = buffers[key].astype(dtype)
+
+        return ak.operations.from_buffers(
+            form, length, buffers, byteorder=ak._util.native_byteorder, highlevel=False
+        )
+
+    layout = _parse(source, parse, line_delimited, max_workers)
     layout = _record_to_complex(layout, complex_record_fields)
 
     if is_record and read_one:
@@ -542,6 +740,130 @@ def _yes_schema(
     return wrap_layout(layout, highlevel=highlevel, attrs=attrs, behavior=behavior)
 
 
+# Smallest number of bytes that is worth parsing as a separate chunk
+_min_chunk_nbytes = 2**20
+
+
+def _parse(source, parse, line_delimited, max_workers):
+    if not line_delimited or max_workers is None or max_workers == 1:
+        with _get_reader(source) as obj:
+            return parse(obj)
+
+    with _get_buffer(source) as data:
+        num_chunks = max(1, min(max_workers, len(data) // _min_chunk_nbytes))
+        bounds = [0]
+        for i in range(1, num_chunks):
+            # the chunks start after a newline, so that no document is split
+            newline = data.find(b"\n", max(bounds[-1], len(data) * i // num_chunks))
+            if newline == -1:
+                break
+            bounds.append(newline + 1)
+        bounds.append(len(data))
+
+        def read(i):
+            return parse(_RangeReader(data, bounds[i], bounds[i + 1]))
+
+        if len(bounds) == 2:
+            return read(0)
+
+        # executor.map returns the results in the order of the chunks
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            layouts = list(executor.map(read, range(len(bounds) - 1)))
+
+    # records that are missing keys that other chunks have get them as None, as
+    # they would if all documents were read together (not a union of records)
+    fields = {}
+    for layout in layouts:
+        _collect_fields(layout, (), fields)
+    layouts = [_add_missing_fields(layout, (), fields) for layout in layouts]
+
+    return ak.operations.ak_concatenate._impl(
+        layouts, axis=0, mergebool=False, highlevel=False, behavior=None, attrs=None
+    )
+
+
+def _collect_fields(layout, path, fields):
+    # the fields of all records at each path of field names, in order of appearance
+    if layout.is_record and not layout.is_tuple:
+        names = fields.setdefault(path, [])
+        for name, content in zip(layout.fields, layout.contents):
+            if name not in names:
+                names.append(name)
+            _collect_fields(content, (*path, name), fields)
+    elif layout.is_union:
+        for content in layout.contents:
+            _collect_fields(content, path, fields)
+    elif layout.is_list or layout.is_option or layout.is_indexed:
+        _collect_fields(layout.content, path, fields)
+
+
+def _add_missing_fields(layout, path, fields):
+    if layout.is_record and not layout.is_tuple:
+        contents = []
+        for name in fields[path]:
+            if name in layout.fields:
+                contents.append(
+                    _add_missing_fields(layout.content(name), (*path, name), fields)
+                )
+            else:
+                contents.append(
+                    ak.contents.IndexedOptionArray(
+                        ak.index.Index64(numpy.full(layout.length, -1, dtype=np.int64)),
+                        ak.contents.EmptyArray(),
+                    )
+                )
+        return ak.contents.RecordArray(
+            contents, fields[path], layout.length, parameters=layout.parameters
+        )
+    elif layout.is_union:
+        return layout.copy(
+            contents=[
+                _add_missing_fields(content, path, fields)
+                for content in layout.contents
+            ]
+        )
+    elif layout.is_list or layout.is_option or layout.is_indexed:
+        return layout.copy(content=_add_missing_fields(layout.content, path, fields))
+    else:
+        return layout
+
+
+@contextmanager
+def _get_buffer(source):
+    if isinstance(source, str):
+        source = source.encode("utf8", errors="surrogateescape")
+
+    if isinstance(source, bytes):
+        yield source
+
+    elif isinstance(source, pathlib.Path) and (
+        urlparse(str(source)).scheme == "" or urlparse(str(source)).netloc == ""
+    ):
+        with open(source, "rb") as file:
+            if source.stat().st_size == 0:
+                yield b""
+            else:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    yield data
+
+    else:
+        with _get_reader(source) as obj:
+            yield b"".join(iter(lambda: obj.read(_min_chunk_nbytes), b""))
+
+
+class _RangeReader:
+    # file-like object for one chunk of a buffer, which copies only what is read
+    def __init__(self, data, start, stop):
+        self.data = data
+        self.pos = start
+        self.stop = stop
+
+    def read(self, num_bytes):
+        start = self.pos
+        self.pos = min(start + num_bytes, self.stop)
+        return self.data[start : self.pos]
+
+
 def _build_assembly(schema, container, instructions):
     if not isinstance(schema, dict):
         raise TypeError(f"unrecognized JSONSchema: expected dict, got {schema!r}")
@@ -758,3 +1080,133 @@ def _build_assembly(schema, container, instructions):
 
     else:
         raise TypeError(f"unrecognized JSONSchema: {tpe!r}")
+
+
+def _build_form_assembly(form, container, instructions, dtypes):
+    if isinstance(form, ak.forms.IndexedForm):
+        return _build_form_assembly(form.content, container, instructions, dtypes)
+
+    elif form.is_option:
+        content = form.content
+        while isinstance(content, ak.forms.IndexedForm):
+            content = content.content
+
+        if content.is_option or content.is_union:
+            raise TypeError(f"cannot read JSON into a form with {content.type}")
+
+        # same choice of nodes as for a JSONSchema with "null" in its "type"
+        mask = f"node{len(container)}"
+        if (
+            content.is_record
+            or content.is_regular
+            or (isinstance(content, ak.forms.NumpyForm) and content.inner_shape != ())
+        ):
+            container[mask + "-index"] = None
+            instructions.append(["FillIndexedOptionArray", mask + "-index", "int64"])
+            out = _build_form_assembly(content, container, instructions, dtypes)
+            return ak.forms.IndexedOptionForm(
+                "i64", out, parameters=form.parameters, form_key=mask
+            )
+
+        else:
+            container[mask + "-mask"] = None
+            instructions.append(["FillByteMaskedArray", mask + "-mask", "int8"])
+            out = _build_form_assembly(content, container, instructions, dtypes)
+            return ak.forms.ByteMaskedForm(
+                "i8", out, valid_when=True, parameters=form.parameters, form_key=mask
+            )
+
+    elif isinstance(form, ak.forms.NumpyForm):
+        dtype = ak.types.numpytype.primitive_to_dtype(form.primitive)
+        if dtype == np.dtype(np.bool_):
+            instruction, buffer_dtype = "FillBoolean", "uint8"
+        elif issubclass(dtype.type, np.integer):
+            instruction, buffer_dtype = "FillInteger", "int64"
+        elif issubclass(dtype.type, np.floating):
+            instruction, buffer_dtype = "FillNumber", "float64"
+        else:
+            raise TypeError(f"cannot read JSON into a form with {form.type}")
+
+        for size in form.inner_shape:
+            instructions.append(["FixedLengthList", size])
+
+        node = f"node{len(container)}"
+        container[node + "-data"] = None
+        instructions.append([instruction, node + "-data", buffer_dtype])
+        if dtype != np.dtype(buffer_dtype) and instruction != "FillBoolean":
+            dtypes[node + "-data"] = dtype
+
+        return ak.forms.NumpyForm(
+            form.primitive,
+            form.inner_shape,
+            parameters=form.parameters,
+            form_key=node,
+        )
+
+    elif isinstance(form, ak.forms.EmptyForm):
+        # the number is never filled if the lists are all empty
+        node = f"node{len(container)}"
+        container[node + "-data"] = None
+        instructions.append(["FillNumber", node + "-data", "float64"])
+        return ak.forms.EmptyForm(parameters=form.parameters)
+
+    elif form.parameter("__array__") in {"string", "bytestring"}:
+        if form.is_regular:
+            raise TypeError(f"cannot read JSON into a form with {form.type}")
+
+        offsets = f"node{len(container)}"
+        container[offsets + "-offsets"] = None
+        node = f"node{len(container)}"
+        container[node + "-data"] = None
+        instructions.append(
+            ["FillString", offsets + "-offsets", "int64", node + "-data", "uint8"]
+        )
+        return ak.forms.ListOffsetForm(
+            "i64",
+            ak.forms.NumpyForm(
+                "uint8", parameters=form.content.parameters, form_key=node
+            ),
+            parameters=form.parameters,
+            form_key=offsets,
+        )
+
+    elif isinstance(form, ak.forms.RegularForm):
+        instructions.append(["FixedLengthList", form.size])
+        content = _build_form_assembly(form.content, container, instructions, dtypes)
+        return ak.forms.RegularForm(content, form.size, parameters=form.parameters)
+
+    elif form.is_list:
+        offsets = f"node{len(container)}"
+        container[offsets + "-offsets"] = None
+        instructions.append(["VarLengthList", offsets + "-offsets", "int64"])
+        content = _build_form_assembly(form.content, container, instructions, dtypes)
+        return ak.forms.ListOffsetForm(
+            "i64", content, parameters=form.parameters, form_key=offsets
+        )
+
+    elif form.is_record:
+        instructions.append(["KeyTableHeader", len(form.contents)])
+        startkeys = len(instructions)
+
+        for name in form.fields:
+            instructions.append(["KeyTableItem", name, None])
+
+        contents = []
+        for keyindex, content in enumerate(form.contents):
+            # set the "jump_to" instruction position in the KeyTable
+            instructions[startkeys + keyindex][2] = len(instructions)
+            contents.append(
+                _build_form_assembly(content, container, instructions, dtypes)
+            )
+
+        return ak.forms.RecordForm(
+            contents,
+            None if form.is_tuple else form.fields,
+            parameters=form.parameters,
+        )
+
+    elif form.is_union:
+        raise NotImplementedError("arbitrary unions of types are not yet supported")
+
+    else:
+        raise TypeError(f"cannot read JSON into a form with {form.type}")
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import threading
+
 import fsspec.parquet
 
 import awkward as ak
 import awkward._connect.pyarrow
+from awkward._backends.numpy import NumpyBackend
 from awkward._dispatch import high_level_function
 from awkward._layout import wrap_layout
+from awkward._nplikes.numpy_like import NumpyMetadata
 from awkward._regularize import is_integer
+from awkward.forms.form import index_to_dtype
+from awkward.types.numpytype import primitive_to_dtype
 
 __all__ = ("from_parquet",)
 
+np = NumpyMetadata.instance()
+
 
 @high_level_function()
 def from_parquet(
@@ -19,11 +28,14 @@ def from_parquet(
     *,
     columns=None,
     row_groups=None,
+    filters=None,
     storage_options=None,
     max_gap=64_000,
     max_block=256_000_000,
     footer_sample_size=1_000_000,
     generate_bitmasks=False,
+    max_workers=None,
+    lazy=False,
     highlevel=True,
     behavior=None,
     attrs=None,
@@ -40,6 +52,12 @@ def from_parquet(
         row_groups (None or set of int): Row groups to read; must be non-negative.
             Order is ignored: the output array is presented in the order specified by
             Parquet metadata. If None, all row groups/all rows are read.
+        filters (None, tuple, list of tuples, or list of lists of tuples): Conditions
+            like `("met", ">", 50)` that are checked against the minimum and maximum
+            values of each row group, as recorded in the Parquet metadata, to skip
+            row groups in which no row can pass. A list of conditions is their
+            logical-and and a list of lists is the logical-or of logical-ands.
+            See below.
         storage_options: Passed to `fsspec.parquet.open_parquet_file`.
         max_gap (int): Passed to `fsspec.parquet.open_parquet_file`.
         max_block (int): Passed to `fsspec.parquet.open_parquet_file`.
@@ -48,6 +66,13 @@ def from_parquet(
             metadata, `generate_bitmasks=True` creates empty bitmasks for nullable
             types that don't have bitmasks in the Arrow/Parquet data, so that the
             Form (BitMaskedForm vs UnmaskedForm) is predictable.
+        max_workers (None or int): If an integer greater than 1, the files and
+            row groups are read concurrently by a pool of this many threads, and
+            the result is the same (in the same order) as reading them one after
+            another. If None, they are read one after another.
+        lazy (bool): If True, only the metadata is read up front and each column
+            is read from the file(s) the first time its data are needed;
+            otherwise, all selected columns are read eagerly.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.contents.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -57,10 +82,35 @@ def from_parquet(
 
     Reads data from a local or remote Parquet file or collection of files.
 
-    The data are eagerly (not lazily) read and must fit into memory. Use `columns`
-    and/or `row_groups` to select and filter manageable subsets of the data, and
-    use #ak.metadata_from_parquet to find column names and the range of row groups
-    that a dataset has.
+    By default, the data are eagerly (not lazily) read and must fit into memory.
+    Use `columns` and/or `row_groups` to select and filter manageable subsets of
+    the data, and use #ak.metadata_from_parquet to find column names and the range
+    of row groups that a dataset has.
+
+    The `filters` are a way to skip row groups without reading any of their data:
+    each condition is a `(column, op, value)` tuple in which `column` is the
+    (dot-separated) name of a column that is not in a list, `op` is one of `"=="`,
+    `"!="`, `"<"`, `"<="`, `">"`, `">="`, `"in"`, and `"not in"`, and `value` is a
+    number or string (or a collection of them, for `"in"` and `"not in"`). These
+    conditions do not remove rows from the row groups that are read, so they still
+    need to be applied to the output array, but they can make a selective read
+    much faster if the data are sorted or clustered by the filtered column. Row
+    groups without statistics for a column are always read.
+
+    Decoding Parquet releases the Python GIL, so with `max_workers`, a dataset
+    of many files or row groups can be read at the speed of many cores. Each row
+    group is then read separately, so the maximum memory use is higher than
+    reading one file at a time.
+
+    With `lazy=True`, the array's buffers are stand-ins that read their Parquet
+    column (across all selected files and row groups) when a computation first
+    touches them, so only the columns that are actually used are ever read.
+    Constructing the array needs the list offsets of any list whose items are
+    records (or other nested types), which reads the first column of each of
+    those lists; lists of numbers and strings are entirely lazy. In lazy mode,
+    the Form is the one described by the Parquet metadata (see
+    #ak.metadata_from_parquet), except that missing values inside lists are
+    represented by an #ak.contents.IndexedOptionArray.
 
     See also #ak.to_parquet, #ak.metadata_from_parquet.
     """
@@ -71,6 +121,36 @@ def from_parquet(
         row_groups,
         columns,
     )
+    if filters is not None:
+        actual_paths, subrg, row_counts = _filter_row_groups(
+            actual_paths, subrg, meta, fs, filters
+        )
+    if max_workers is not None:
+        if not (is_integer(max_workers) and max_workers > 0):
+            raise ValueError(
+                f"max_workers must be None or a positive integer, not {max_workers!r}"
+            )
+        if max_workers > 1 and row_counts is not None:
+            # Split the work into row groups, so that it can be parallelized
+            # even if there are fewer files than workers
+            actual_paths, subrg = _split_row_groups(actual_paths, subrg, meta, fs)
+    if lazy:
+        return _load_lazy(
+            actual_paths,
+            parquet_columns,
+            subrg,
+            row_counts,
+            max_gap,
+            max_block,
+            footer_sample_size,
+            generate_bitmasks,
+            subform,
+            highlevel,
+            behavior,
+            fs,
+            attrs,
+            max_workers,
+        )
     return _load(
         actual_paths,
         parquet_columns if columns is not None else None,
@@ -84,6 +164,7 @@ def from_parquet(
         behavior,
         fs,
         attrs,
+        max_workers=max_workers,
     )
 
 
@@ -149,8 +230,9 @@ def metadata(
         for apath in scan_paths:
             with fs.open(apath, "rb") as f:
                 md = pyarrow_parquet.ParquetFile(f).metadata
-                # TODO: not nested directory structure yet
-                md.set_file_path(apath.rsplit("/", 1)[-1])
+                # the full path, so that files with the same name in different
+                # directories can be told apart
+                md.set_file_path(apath)
                 metadata.append_row_groups(md)
     if row_groups is not None:
         if any(_ >= metadata.num_row_groups for _ in row_groups):
@@ -171,10 +253,11 @@ def metadata(
             path_rgs.setdefault(fp, []).append(i)
             rgs_path[i] = fp
 
+        file_paths = dict(zip(_metadata_file_paths(all_paths, path_rgs), all_paths))
         actual_paths = []
         for select in row_groups:
             path = rgs_path[select]
-            path2 = next(_ for _ in all_paths if _.endswith(path))
+            path2 = file_paths[path]
             if path2 not in actual_paths:
                 actual_paths.append(path2)
                 subrg.append([path_rgs[path].index(select)])
@@ -210,23 +293,28 @@ def _load(
     fs,
     attrs,
     metadata=None,
+    max_workers=None,
 ):
-    arrays = []
-    for i, p in enumerate(actual_paths):
-        arrays.append(
-            _read_parquet_file(
-                p,
-                fs=fs,
-                parquet_columns=parquet_columns,
-                row_groups=subrg[i],
-                max_gap=max_gap,
-                max_block=max_block,
-                footer_sample_size=footer_sample_size,
-                generate_bitmasks=generate_bitmasks,
-                metadata=metadata,
-            )
+    def read(i):
+        return _read_parquet_file(
+            actual_paths[i],
+            fs=fs,
+            parquet_columns=parquet_columns,
+            row_groups=subrg[i],
+            max_gap=max_gap,
+            max_block=max_block,
+            footer_sample_size=footer_sample_size,
+            generate_bitmasks=generate_bitmasks,
+            metadata=metadata,
         )
 
+    if max_workers is None or max_workers == 1 or len(actual_paths) == 1:
+        arrays = [read(i) for i in range(len(actual_paths))]
+    else:
+        # executor.map returns the results in the order of actual_paths
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            arrays = list(executor.map(read, range(len(actual_paths))))
+
     assert len(arrays) != 0
     if len(arrays) == 1:
         return wrap_layout(
@@ -244,6 +332,494 @@ def _load(
         )
 
 
+def _load_lazy(
+    actual_paths,
+    parquet_columns,
+    subrg,
+    row_counts,
+    max_gap,
+    max_block,
+    footer_sample_size,
+    generate_bitmasks,
+    subform,
+    highlevel,
+    behavior,
+    fs,
+    attrs,
+    max_workers,
+):
+    loader = _ParquetColumnLoader(
+        actual_paths,
+        parquet_columns,
+        subrg,
+        max_gap,
+        max_block,
+        footer_sample_size,
+        generate_bitmasks,
+        subform,
+        fs,
+        max_workers,
+    )
+    return ak.operations.ak_from_buffers._impl(
+        loader.form,
+        sum(row_counts),
+        loader,
+        "{form_key}-{attribute}",
+        "cpu",
+        "<",
+        highlevel,
+        behavior,
+        attrs,
+        False,
+    )
+
+
+class _ParquetColumnLoader:
+    """
+    A container for #ak.from_buffers whose buffers are callables that read the
+    Parquet column they belong to on demand.
+
+    Each read fills the buffers of one leaf column (and those of the lists,
+    records, and options above it), which are kept until they are requested.
+    """
+
+    def __init__(
+        self,
+        actual_paths,
+        parquet_columns,
+        subrg,
+        max_gap,
+        max_block,
+        footer_sample_size,
+        generate_bitmasks,
+        subform,
+        fs,
+        max_workers,
+    ):
+        self._actual_paths = actual_paths
+        self._subrg = subrg
+        self._max_gap = max_gap
+        self._max_block = max_block
+        self._footer_sample_size = footer_sample_size
+        self._generate_bitmasks = generate_bitmasks
+        self._fs = fs
+        self._max_workers = max_workers
+
+        self.form = _lazy_form(subform, [0], False)
+
+        # Each leaf column is identified by its field path in `self.form`
+        # (None if the form is not a record) and its name(s) in the Parquet file
+        self._leaves = []
+        self._key_to_leaf = {}
+        if isinstance(self.form, ak.forms.RecordForm):
+            self._find_leaves(self.form, (), [])
+            if len(self._leaves) != len(parquet_columns):
+                raise AssertionError(
+                    f"found {len(self._leaves)} leaves in the Form, but Parquet has "
+                    f"{len(parquet_columns)} columns"
+                )
+            self._leaves = [
+                (field_path, [column])
+                for field_path, column in zip(self._leaves, parquet_columns)
+            ]
+        else:
+            # Without fields, there is nothing to select: read everything at once
+            self._leaves = [(None, None)]
+            self._find_leaves(self.form, None, [])
+
+        self._buffers = {}
+        self._requested = set()
+        self._lock = threading.Lock()
+
+    def _find_leaves(self, form, field_path, form_keys):
+        form_keys = [*form_keys, form.form_key]
+        if isinstance(form, ak.forms.RecordForm) and field_path is not None:
+            for field, content in zip(form.fields, form.contents):
+                self._find_leaves(content, (*field_path, field), form_keys)
+        elif isinstance(form, (ak.forms.NumpyForm, ak.forms.EmptyForm)) or (
+            form.parameter("__array__") in ("string", "bytestring")
+        ):
+            if field_path is not None:
+                self._leaves.append(field_path)
+            if form.is_list:
+                form_keys.append(form.content.form_key)
+            for form_key in form_keys:
+                self._key_to_leaf.setdefault(form_key, len(self._leaves) - 1)
+        elif isinstance(form, ak.forms.UnionForm):
+            raise NotImplementedError(
+                "lazily reading Parquet data with union types is not supported"
+            )
+        elif isinstance(form, ak.forms.RecordForm):
+            for content in form.contents:
+                self._find_leaves(content, field_path, form_keys)
+        else:
+            self._find_leaves(form.content, field_path, form_keys)
+
+    def __getitem__(self, buffer_key):
+        return lambda: self._get(buffer_key)
+
+    def _get(self, buffer_key):
+        # Buffers are read (and kept until requested) for a whole leaf at a
+        # time, so threads that request them must take turns
+        with self._lock:
+            if buffer_key not in self._buffers:
+                form_key, _ = buffer_key.rsplit("-", 1)
+                self._read_leaf(self._key_to_leaf[form_key])
+            self._requested.add(buffer_key)
+            return self._buffers.pop(buffer_key)
+
+    def _read_leaf(self, index):
+        field_path, columns = self._leaves[index]
+        if field_path is None:
+            form = self.form
+        else:
+            form = self.form.select_columns([list(field_path)])
+
+        layout = _load(
+            self._actual_paths,
+            columns,
+            self._subrg,
+            self._max_gap,
+            self._max_block,
+            self._footer_sample_size,
+            self._generate_bitmasks,
+            form,
+            False,
+            None,
+            self._fs,
+            None,
+            max_workers=self._max_workers,
+        )
+
+        buffers = {}
+        _coerce_to_form(layout, form)._to_buffers(
+            form,
+            lambda layout, form, attribute: f"{form.form_key}-{attribute}",
+            buffers,
+            NumpyBackend.instance(),
+            "<",
+        )
+        for key, buffer in buffers.items():
+            if key not in self._requested:
+                self._buffers[key] = buffer
+
+
+def _lazy_form(form, counter, in_list):
+    form_key = f"node{counter[0]}"
+    counter[0] += 1
+
+    if isinstance(form, (ak.forms.NumpyForm, ak.forms.EmptyForm)):
+        return form.copy(form_key=form_key)
+
+    elif isinstance(form, (ak.forms.RecordForm, ak.forms.UnionForm)):
+        return form.copy(
+            contents=[_lazy_form(x, counter, in_list) for x in form.contents],
+            form_key=form_key,
+        )
+
+    elif isinstance(form, (ak.forms.ListOffsetForm, ak.forms.ListForm)):
+        return form.copy(
+            content=_lazy_form(form.content, counter, True), form_key=form_key
+        )
+
+    # The length of a bit/byte-masked node must be known when it is constructed,
+    # but inside a list, that would require reading the list's offsets
+    elif in_list and isinstance(
+        form, (ak.forms.BitMaskedForm, ak.forms.ByteMaskedForm)
+    ):
+        return ak.forms.IndexedOptionForm(
+            "i64",
+            _lazy_form(form.content, counter, in_list),
+            parameters=form._parameters,
+            form_key=form_key,
+        )
+
+    else:
+        return form.copy(
+            content=_lazy_form(form.content, counter, in_list), form_key=form_key
+        )
+
+
+def _cast_index(index, index_type):
+    dtype = index_to_dtype[index_type]
+    if index.dtype == dtype:
+        return index
+    else:
+        nplike = index.nplike
+        return ak.index.Index(nplike.astype(index.data, dtype), nplike=nplike)
+
+
+def _coerce_to_form(layout, form):
+    # Layouts read from Parquet can differ from the (lazy) Form in how options
+    # and lists are represented, e.g. after concatenating files or when only
+    # some fields of a record are read. Convert them to exactly `form`.
+    if form.is_option:
+        if not layout.is_option:
+            layout = ak.contents.UnmaskedArray(layout)
+        if isinstance(form, ak.forms.IndexedOptionForm):
+            layout = layout.to_IndexedOptionArray64()
+            layout = layout.copy(index=_cast_index(layout.index, form.index))
+        elif isinstance(form, ak.forms.ByteMaskedForm):
+            layout = layout.to_ByteMaskedArray(form.valid_when)
+        elif isinstance(form, ak.forms.BitMaskedForm):
+            layout = layout.to_BitMaskedArray(form.valid_when, form.lsb_order)
+        elif not isinstance(layout, ak.contents.UnmaskedArray):
+            layout = ak.contents.UnmaskedArray(layout.project())
+        return layout.copy(
+            content=_coerce_to_form(layout.content, form.content),
+            parameters=form._parameters,
+        )
+
+    elif layout.is_option or (layout.is_indexed and not form.is_indexed):
+        # Not missing anything, according to the Form
+        return _coerce_to_form(layout.project(), form)
+
+    elif isinstance(form, ak.forms.IndexedForm):
+        if not layout.is_indexed:
+            index = ak.index.Index64(
+                layout.backend.index_nplike.arange(layout.length, dtype=np.int64)
+            )
+            layout = ak.contents.IndexedArray(index, layout)
+        return ak.contents.IndexedArray(
+            _cast_index(layout.index, form.index),
+            _coerce_to_form(layout.content, form.content),
+            parameters=form._parameters,
+        )
+
+    elif isinstance(form, ak.forms.NumpyForm):
+        if not layout.is_numpy:
+            layout = layout.to_NumpyArray(primitive_to_dtype(form.primitive))
+        nplike = layout.backend.nplike
+        data = layout.data
+        if data.dtype != primitive_to_dtype(form.primitive):
+            data = nplike.astype(data, primitive_to_dtype(form.primitive))
+        return ak.contents.NumpyArray(
+            nplike.ascontiguousarray(data),
+            parameters=form._parameters,
+            backend=layout.backend,
+        )
+
+    elif isinstance(form, ak.forms.RegularForm):
+        if layout.is_numpy:
+            layout = layout.to_RegularArray()
+        return layout.copy(
+            content=_coerce_to_form(layout.content, form.content),
+            parameters=form._parameters,
+        )
+
+    elif isinstance(form, (ak.forms.ListOffsetForm, ak.forms.ListForm)):
+        if not (
+            isinstance(layout, ak.contents.ListOffsetArray) and layout.offsets[0] == 0
+        ):
+            layout = layout.to_ListOffsetArray64(True)
+        content = _coerce_to_form(layout.content, form.content)
+        if isinstance(form, ak.forms.ListOffsetForm):
+            return ak.contents.ListOffsetArray(
+                _cast_index(layout.offsets, form.offsets),
+                content,
+                parameters=form._parameters,
+            )
+        else:
+            return ak.contents.ListArray(
+                _cast_index(layout.starts, form.starts),
+                _cast_index(layout.stops, form.stops),
+                content,
+                parameters=form._parameters,
+            )
+
+    elif isinstance(form, ak.forms.RecordForm):
+        return ak.contents.RecordArray(
+            [
+                _coerce_to_form(layout.content(i), content)
+                for i, content in enumerate(form.contents)
+            ]
+            if form.is_tuple
+            else [
+                _coerce_to_form(layout.content(field), content)
+                for field, content in zip(form.fields, form.contents)
+            ],
+            None if form.is_tuple else form.fields,
+            layout.length,
+            parameters=form._parameters,
+            backend=layout.backend,
+        )
+
+    elif isinstance(form, ak.forms.EmptyForm):
+        return layout
+
+    else:
+        raise NotImplementedError(
+            f"cannot lazily read a {type(form).__name__} from Parquet"
+        )
+
+
+def _metadata_row_groups(metadata):
+    # The combined metadata refer to files by file_path, which is the full path
+    # of a scanned file, relative to the directory of a _metadata file, or empty
+    # for the file that the schema came from; see `metadata`.
+    path_rgs = {}
+    for i in range(metadata.num_row_groups):
+        path_rgs.setdefault(metadata.row_group(i).column(0).file_path, []).append(i)
+    return path_rgs
+
+
+def _metadata_file_paths(actual_paths, path_rgs):
+    # A path matches a file_path that is equal to it or is a relative path that
+    # ends it (at a "/"); if several relative paths do, the longest is the one
+    # relative to the same directory. Only a single unmatched path can be the
+    # file with the empty file_path.
+    out = []
+    for path in actual_paths:
+        matches = [
+            x
+            for x in path_rgs
+            if x != "" and (path == x or path.endswith("/" + x.lstrip("/")))
+        ]
+        out.append(max(matches, key=len) if len(matches) != 0 else None)
+    unmatched = [i for i, x in enumerate(out) if x is None]
+    if len(unmatched) == 1 and "" in path_rgs:
+        out[unmatched[0]] = ""
+    return out
+
+
+def _row_groups_by_file(actual_paths, subrg, metadata, fs):
+    # Yields (path, row groups selected in the file, metadata of all row groups
+    # in the file); files that aren't in the metadata have their footers read.
+    path_rgs = _metadata_row_groups(metadata)
+    file_paths = _metadata_file_paths(actual_paths, path_rgs)
+
+    out = []
+    for path, file_path, file_row_groups in zip(actual_paths, file_paths, subrg):
+        if file_path is None:
+            pyarrow_parquet = awkward._connect.pyarrow.import_pyarrow_parquet(
+                "ak.from_parquet"
+            )
+            with fs.open(path, "rb") as file:
+                file_metadata = pyarrow_parquet.ParquetFile(file).metadata
+            row_group_metadata = [
+                file_metadata.row_group(i) for i in range(file_metadata.num_row_groups)
+            ]
+        else:
+            row_group_metadata = [metadata.row_group(i) for i in path_rgs[file_path]]
+        if file_row_groups is None:
+            file_row_groups = range(len(row_group_metadata))
+        out.append((path, list(file_row_groups), row_group_metadata))
+    return out
+
+
+_filter_ops = {
+    "==": lambda low, high, value: low <= value <= high,
+    "!=": lambda low, high, value: not (low == high == value),
+    "<": lambda low, high, value: low < value,
+    "<=": lambda low, high, value: low <= value,
+    ">": lambda low, high, value: high > value,
+    ">=": lambda low, high, value: high >= value,
+    "in": lambda low, high, values: any(low <= x <= high for x in values),
+    "not in": lambda low, high, values: not (low == high and low in values),
+}
+
+
+def _normalize_filters(filters):
+    if isinstance(filters, tuple):
+        filters = [[filters]]
+    elif all(isinstance(x, tuple) for x in filters):
+        filters = [filters]
+
+    out = []
+    for conjunction in filters:
+        out.append([])
+        for condition in conjunction:
+            if not (isinstance(condition, tuple) and len(condition) == 3):
+                raise TypeError(
+                    f"filters must be (column, op, value) tuples, not {condition!r}"
+                )
+            column, op, value = condition
+            if op not in _filter_ops:
+                raise ValueError(
+                    f"unrecognized filter operator {op!r}; "
+                    f"must be one of {', '.join(map(repr, _filter_ops))}"
+                )
+            if op in ("in", "not in"):
+                value = list(value)
+            out[-1].append((column, op, value))
+    return out
+
+
+def _may_pass(row_group, column_index, op, value):
+    statistics = row_group.column(column_index).statistics
+    if statistics is None:
+        return True
+    if statistics.has_null_count and statistics.null_count == row_group.num_rows:
+        # All values are missing, and missing values don't pass any comparison
+        return False
+    if not statistics.has_min_max:
+        return True
+    try:
+        return bool(_filter_ops[op](statistics.min, statistics.max, value))
+    except TypeError:
+        # Not comparable to the statistics (e.g. a timestamp); can't rule it out
+        return True
+
+
+def _filter_row_groups(actual_paths, subrg, metadata, fs, filters):
+    filters = _normalize_filters(filters)
+
+    column_indexes = {
+        metadata.schema.column(i).path: i
+        for i in range(metadata.num_columns)
+        if metadata.schema.column(i).max_repetition_level == 0
+    }
+    for conjunction in filters:
+        for column, _, _ in conjunction:
+            if column not in column_indexes:
+                raise ValueError(
+                    f"cannot filter on {column!r}: filters apply to columns that are "
+                    "not in lists, which are " + ", ".join(map(repr, column_indexes))
+                )
+
+    filtered_paths, filtered_subrg, row_counts = [], [], []
+    for path, file_row_groups, row_group_metadata in _row_groups_by_file(
+        actual_paths, subrg, metadata, fs
+    ):
+        selected = []
+        for index in file_row_groups:
+            row_group = row_group_metadata[index]
+            if any(
+                all(
+                    _may_pass(row_group, column_indexes[column], op, value)
+                    for column, op, value in conjunction
+                )
+                for conjunction in filters
+            ):
+                selected.append(index)
+                row_counts.append(row_group.num_rows)
+        if len(selected) != 0:
+            filtered_paths.append(path)
+            filtered_subrg.append(selected)
+
+    if len(filtered_paths) == 0:
+        # Read no row groups of the first file, to get an empty array with its schema
+        filtered_paths, filtered_subrg = actual_paths[:1], [[]]
+
+    return filtered_paths, filtered_subrg, row_counts
+
+
+def _split_row_groups(actual_paths, subrg, metadata, fs):
+    paths, row_groups = [], []
+    for path, file_row_groups, _ in _row_groups_by_file(
+        actual_paths, subrg, metadata, fs
+    ):
+        if len(file_row_groups) == 0:
+            # Still read no row groups of the file, for its schema (None would
+            # be all of its row groups)
+            paths.append(path)
+            row_groups.append([])
+        for row_group in file_row_groups:
+            paths.append(path)
+            row_groups.append([row_group])
+    return paths, row_groups
+
+
 def _open_file(
     path, fs, columns, row_groups, max_gap, max_block, footer_sample_size, metadata
 ):
@@ -295,6 +871,10 @@ def _read_parquet_file(
         else:
             arrow_table = parquetfile.read_row_groups(row_groups, parquet_columns)
 
+    return _arrow_table_to_layout(arrow_table, generate_bitmasks)
+
+
+def _arrow_table_to_layout(arrow_table, generate_bitmasks):
     arrow_table = ak._connect.pyarrow.convert_native_arrow_table_to_awkward(arrow_table)
     return ak.operations.ak_from_arrow._impl(
         arrow_table,
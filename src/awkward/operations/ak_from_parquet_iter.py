@@ -0,0 +1,325 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+from awkward._layout import wrap_layout
+from awkward._regularize import is_integer
+
+__all__ = ("from_parquet_iter",)
+
+
+@high_level_function()
+def from_parquet_iter(
+    path,
+    *,
+    columns=None,
+    row_groups=None,
+    filters=None,
+    step_size=None,
+    read_ahead=1,
+    storage_options=None,
+    max_gap=64_000,
+    max_block=256_000_000,
+    footer_sample_size=1_000_000,
+    generate_bitmasks=False,
+    highlevel=True,
+    behavior=None,
+    attrs=None,
+):
+    """
+    Args:
+        path (str): Local filename or remote URL, passed to fsspec for resolution.
+            May contain glob patterns.
+        columns (None, str, or iterable of (str or iterable of str)): Glob pattern(s)
+            for matching column names, as in #ak.from_parquet.
+        row_groups (None or set of int): Row groups to read; must be non-negative.
+            Order is ignored: the row groups are iterated over in the order
+            specified by Parquet metadata. If None, all row groups are read.
+        filters (None, tuple, list of tuples, or list of lists of tuples): Conditions
+            like `("met", ">", 50)` that are checked against the minimum and maximum
+            values of each row group to skip row groups in which no row can pass,
+            as in #ak.from_parquet.
+        step_size (None or int): If None, each iteration returns one row group;
+            otherwise, each iteration returns `step_size` rows (except the last,
+            which may be shorter), regardless of row group boundaries.
+        read_ahead (int): Number of row groups to read in a background thread
+            while the current one is being processed. If 0, each row group is
+            read in the calling thread, only when it is needed.
+        storage_options: Passed to `fsspec.parquet.open_parquet_file`.
+        max_gap (int): Passed to `fsspec.parquet.open_parquet_file`.
+        max_block (int): Passed to `fsspec.parquet.open_parquet_file`.
+        footer_sample_size (int): Passed to `fsspec.parquet.open_parquet_file`.
+        generate_bitmasks (bool): If enabled and Arrow/Parquet does not have Awkward
+            metadata, `generate_bitmasks=True` creates empty bitmasks for nullable
+            types that don't have bitmasks in the Arrow/Parquet data, so that the
+            Form (BitMaskedForm vs UnmaskedForm) is predictable.
+        highlevel (bool): If True, iterate over #ak.Array; otherwise, iterate
+            over low-level #ak.contents.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+        attrs (None or dict): Custom attributes for the output arrays, if
+            high-level.
+
+    Returns an iterator over successive pieces of a local or remote Parquet file
+    or collection of files, so that a dataset that doesn't fit into memory can be
+    processed one piece at a time. Concatenating all of the pieces would give the
+    same array as #ak.from_parquet.
+
+    The metadata are read only once, when this function is called, and each file
+    is opened only once (for remote filesystems, each row group's byte ranges are
+    fetched separately). At most `read_ahead + 1` row groups are in memory at a
+    time, in addition to the piece that the caller is holding.
+
+    The iterator can be used as a context manager, which stops the background
+    reading (and closes any open file) if the loop is exited early:
+
+        >>> with ak.from_parquet_iter("dataset/*.parquet", columns=["met"]) as pieces:
+        ...     for piece in pieces:
+        ...         if ak.any(piece.met > 1000):
+        ...             break
+
+    See also #ak.from_parquet, #ak.metadata_from_parquet.
+    """
+    return _impl(
+        path,
+        columns,
+        row_groups,
+        filters,
+        step_size,
+        read_ahead,
+        storage_options,
+        max_gap,
+        max_block,
+        footer_sample_size,
+        generate_bitmasks,
+        highlevel,
+        behavior,
+        attrs,
+    )
+
+
+def _impl(
+    path,
+    columns,
+    row_groups,
+    filters,
+    step_size,
+    read_ahead,
+    storage_options,
+    max_gap,
+    max_block,
+    footer_sample_size,
+    generate_bitmasks,
+    highlevel,
+    behavior,
+    attrs,
+):
+    if step_size is not None and not (is_integer(step_size) and step_size > 0):
+        raise ValueError(
+            f"step_size must be None or a positive integer, not {step_size!r}"
+        )
+    if not (is_integer(read_ahead) and read_ahead >= 0):
+        raise ValueError(
+            f"read_ahead must be a non-negative integer, not {read_ahead!r}"
+        )
+
+    parquet_columns, _, actual_paths, fs, subrg, _, metadata = (
+        ak.operations.ak_from_parquet.metadata(
+            path, storage_options, row_groups, columns
+        )
+    )
+    if filters is not None:
+        actual_paths, subrg, _ = ak.operations.ak_from_parquet._filter_row_groups(
+            actual_paths, subrg, metadata, fs, filters
+        )
+
+    reader = _RowGroupReader(
+        fs,
+        parquet_columns if columns is not None else None,
+        max_gap,
+        max_block,
+        footer_sample_size,
+        generate_bitmasks,
+    )
+    return _ParquetIterator(
+        reader,
+        [
+            (path, row_group, file_row_groups)
+            for path, file_row_groups, _ in ak.operations.ak_from_parquet._row_groups_by_file(
+                actual_paths, subrg, metadata, fs
+            )
+            for row_group in file_row_groups
+        ],
+        step_size,
+        read_ahead,
+        highlevel,
+        behavior,
+        attrs,
+    )
+
+
+class _RowGroupReader:
+    """
+    Reads one row group at a time, keeping the current file (and its parsed
+    footer) open until a row group from another file is requested.
+    """
+
+    def __init__(
+        self,
+        fs,
+        parquet_columns,
+        max_gap,
+        max_block,
+        footer_sample_size,
+        generate_bitmasks,
+    ):
+        self._fs = fs
+        self._parquet_columns = parquet_columns
+        self._max_gap = max_gap
+        self._max_block = max_block
+        self._footer_sample_size = footer_sample_size
+        self._generate_bitmasks = generate_bitmasks
+        # Remote files are opened with only the requested byte ranges prefetched,
+        # so to keep the memory bounded, each row group is opened separately.
+        self._per_row_group = getattr(fs, "async_impl", False)
+        self._key = None
+        self._file = None
+        self._parquetfile = None
+
+    def read(self, path, row_group, file_row_groups):
+        if self._per_row_group:
+            key, open_row_groups = (path, row_group), [row_group]
+        else:
+            key, open_row_groups = path, list(file_row_groups)
+
+        if key != self._key:
+            self.close()
+            pyarrow_parquet = ak._connect.pyarrow.import_pyarrow_parquet(
+                "ak.from_parquet_iter"
+            )
+            self._file = ak.operations.ak_from_parquet._open_file(
+                path,
+                self._fs,
+                self._parquet_columns,
+                open_row_groups,
+                self._max_gap,
+                self._max_block,
+                self._footer_sample_size,
+                None,
+            )
+            self._parquetfile = pyarrow_parquet.ParquetFile(self._file)
+            self._key = key
+
+        arrow_table = self._parquetfile.read_row_groups(
+            [row_group], self._parquet_columns
+        )
+        return ak.operations.ak_from_parquet._arrow_table_to_layout(
+            arrow_table, self._generate_bitmasks
+        )
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        self._key = None
+        self._file = None
+        self._parquetfile = None
+
+
+class _ParquetIterator:
+    def __init__(
+        self, reader, tasks, step_size, read_ahead, highlevel, behavior, attrs
+    ):
+        self._reader = reader
+        self._tasks = tasks
+        self._step_size = step_size
+        self._read_ahead = read_ahead
+        self._highlevel = highlevel
+        self._behavior = behavior
+        self._attrs = attrs
+        self._pieces = self._generate_pieces()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return wrap_layout(
+            next(self._pieces),
+            highlevel=self._highlevel,
+            behavior=self._behavior,
+            attrs=self._attrs,
+        )
+
+    def close(self):
+        self._pieces.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def _generate_row_groups(self):
+        if self._read_ahead == 0:
+            try:
+                for task in self._tasks:
+                    yield self._reader.read(*task)
+            finally:
+                self._reader.close()
+            return
+
+        # A single worker reads the row groups in order (sharing the open file)
+        # while the caller processes the ones that are already read.
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        futures = collections.deque()
+        tasks = iter(self._tasks)
+        try:
+            while True:
+                for task in tasks:
+                    futures.append(executor.submit(self._reader.read, *task))
+                    if len(futures) > self._read_ahead:
+                        break
+                if len(futures) == 0:
+                    break
+                yield futures.popleft().result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self._reader.close()
+
+    def _generate_pieces(self):
+        if self._step_size is None:
+            yield from self._generate_row_groups()
+            return
+
+        pending, length = [], 0
+        for layout in self._generate_row_groups():
+            pending.append(layout)
+            length += layout.length
+            while length >= self._step_size:
+                combined = _concatenate(pending)
+                yield combined[: self._step_size]
+                pending = [combined[self._step_size :]]
+                length -= self._step_size
+        if length > 0:
+            yield _concatenate(pending)
+
+
+def _concatenate(layouts):
+    layouts = [x for x in layouts if x.length > 0] or layouts[:1]
+    if len(layouts) == 1:
+        return layouts[0]
+    else:
+        return ak.operations.ak_concatenate._impl(
+            layouts,
+            axis=0,
+            mergebool=True,
+            highlevel=False,
+            behavior=None,
+            attrs=None,
+        )
@@ -0,0 +1,89 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import os
+import sys
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+from awkward._nplikes.numpy import Numpy
+from awkward._nplikes.numpy_like import NumpyMetadata
+
+__all__ = ("from_shared_memory",)
+
+np = NumpyMetadata.instance()
+numpy = Numpy.instance()
+
+
+@high_level_function()
+def from_shared_memory(
+    handle,
+    *,
+    highlevel=True,
+    behavior=None,
+    attrs=None,
+):
+    """
+    Args:
+        handle (#ak.operations.ak_to_shared_memory.SharedMemoryHandle): The
+            handle returned by #ak.to_shared_memory, possibly in another process.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.contents.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+        attrs (None or dict): Custom attributes for the output array, if
+            high-level.
+
+    Views an array that #ak.to_shared_memory put in shared memory. No data are
+    copied: the buffers of the array are NumPy arrays backed by the shared block,
+    which stays mapped in this process as long as the array (or any array that
+    views its buffers) exists.
+
+    The block must not be modified while it is being viewed.
+
+    See also #ak.to_shared_memory, #ak.from_buffers.
+    """
+    return _impl(handle, highlevel, behavior, attrs)
+
+
+def _impl(handle, highlevel, behavior, attrs):
+    if not isinstance(handle, ak.operations.ak_to_shared_memory.SharedMemoryHandle):
+        raise TypeError(
+            f"'handle' must be a SharedMemoryHandle from ak.to_shared_memory, not {type(handle).__name__}"
+        )
+
+    # Only the process that made the block is responsible for unlinking it
+    if sys.version_info >= (3, 13):
+        block = shared_memory.SharedMemory(handle.name, track=False)
+    else:
+        block = shared_memory.SharedMemory(handle.name)
+        if os.name != "nt":
+            # Attaching registered the block with this process's resource
+            # tracker, which would unlink it when this process exits (the
+            # tracker has the POSIX name, with a leading slash)
+            resource_tracker.unregister(f"/{block.name}", "shared_memory")
+
+    data = numpy.frombuffer(block.buf[: handle.size], dtype=np.uint8)
+    # Every view of `data` refers to the same memoryview, which is deleted after
+    # its last view is; only then can the block be closed.
+    weakref.finalize(data.base, block.close).atexit = False
+
+    container = {
+        key: data[offset : offset + nbytes]
+        for key, (offset, nbytes) in handle.buffers.items()
+    }
+    return ak.operations.ak_from_buffers._impl(
+        ak.forms.from_dict(handle.form),
+        handle.length,
+        container,
+        "{form_key}-{attribute}",
+        "cpu",
+        ak._util.native_byteorder,
+        highlevel,
+        behavior,
+        attrs,
+        False,
+    )
@@ -0,0 +1,165 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+from awkward._layout import HighLevelContext, ensure_same_backend
+from awkward._nplikes.numpy_like import NumpyMetadata
+from awkward._regularize import regularize_axis
+
+__all__ = ("iter_cartesian",)
+
+np = NumpyMetadata.instance()
+
+
+@high_level_function()
+def iter_cartesian(
+    arrays,
+    max_bytes,
+    axis=1,
+    *,
+    nested=None,
+    parameters=None,
+    with_name=None,
+    highlevel=True,
+    behavior=None,
+    attrs=None,
+):
+    """
+    Args:
+        arrays (mapping or sequence of arrays): Each value in this mapping or
+            sequence can be any array-like data that #ak.to_layout recognizes.
+        max_bytes (int): The largest number of bytes of the Cartesian product
+            to compute at once.
+        axis (int): The dimension at which this operation is applied. The
+            outermost dimension is `0`, followed by `1`, etc., and negative
+            values count backward from the innermost: `-1` is the innermost
+            dimension, `-2` is the next level up, etc. It can't be `0`.
+        nested (None, True, False, or iterable of str or int): If None or
+            False, all combinations of elements from the `arrays` are
+            produced at the same level of nesting; if True, they are grouped
+            in nested lists by combinations that share a common item from
+            each of the `arrays`; if an iterable of str or int, group common
+            items for a chosen set of keys from the `array` dict or integer
+            slots of the `array` iterable.
+        parameters (None or dict): Parameters for the new
+            #ak.contents.RecordArray node that is created by this operation.
+        with_name (None or str): Assigns a `"__record__"` name to the new
+            #ak.contents.RecordArray node that is created by this operation
+            (overriding `parameters`, if necessary).
+        highlevel (bool): If True, yield #ak.Array objects; otherwise, yield
+            low-level #ak.contents.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+        attrs (None or dict): Custom attributes for the output arrays, if
+            high-level.
+
+    Returns an iterator over the #ak.cartesian products of consecutive ranges of
+    the `arrays` (chunks of their outermost dimension), which are small enough
+    that the product of each range takes at most about `max_bytes`. For example,
+
+        >>> for pairs in ak.iter_cartesian({"e": electrons, "mu": muons}, 10**8):
+        ...     closest.append(ak.min(delta_r(pairs.e, pairs.mu), axis=1))
+        ...
+        >>> closest = ak.concatenate(closest)
+
+    computes a result for each element without making all of the pairs at once,
+    and the concatenation of the chunks of products would be the same as
+    `ak.cartesian({"e": electrons, "mu": muons})`.
+
+    The size of each product of lists is computed up front, and each tuple is
+    counted as the sum of the average number of bytes per item of the lists in
+    each of the `arrays` (with an 8-byte index for each item), so the ranges
+    are only as precise as those averages. A range has at least one element,
+    even if its product is larger than `max_bytes`.
+
+    See also #ak.iter_combinations.
+    """
+    # Dispatch
+    if isinstance(arrays, Mapping):
+        yield arrays.values()
+    else:
+        yield arrays
+
+    # Implementation
+    return _impl(
+        arrays,
+        max_bytes,
+        axis,
+        nested,
+        parameters,
+        with_name,
+        highlevel,
+        behavior,
+        attrs,
+    )
+
+
+def _impl(
+    arrays,
+    max_bytes,
+    axis,
+    nested,
+    parameters,
+    with_name,
+    highlevel,
+    behavior,
+    attrs,
+):
+    with HighLevelContext(behavior=behavior, attrs=attrs) as ctx:
+        if isinstance(arrays, Mapping):
+            fields = list(arrays.keys())
+            layouts = ensure_same_backend(
+                *(
+                    ctx.unwrap(x, allow_record=False, allow_unknown=False)
+                    for x in arrays.values()
+                )
+            )
+        else:
+            fields = None
+            layouts = ensure_same_backend(
+                *(
+                    ctx.unwrap(x, allow_record=False, allow_unknown=False)
+                    for x in arrays
+                )
+            )
+
+    max_bytes = ak.operations.ak_iter_combinations._regularize_max_bytes(max_bytes)
+    axis = regularize_axis(axis, none_allowed=False)
+    if len(layouts) == 0:
+        raise ValueError("at least one array is needed for a Cartesian product")
+    for layout in layouts:
+        ak.operations.ak_iter_combinations._check_axis(layout, axis)
+    if any(layout.length != layouts[0].length for layout in layouts):
+        raise ValueError("all of the arrays must have the same length")
+
+    # Size of the product of each tuple of lists at 'axis'
+    count = 1
+    tuple_nbytes = 0
+    for layout in layouts:
+        lengths = ak.operations.ak_num._impl(layout, axis, True, None, None)
+        count = count * lengths
+        tuple_nbytes += 8 + ak.operations.ak_iter_combinations._item_nbytes(
+            layout, lengths
+        )
+    stops = ak.operations.ak_iter_combinations._chunk_stops(
+        ak.operations.ak_iter_combinations._per_element(count) * tuple_nbytes, max_bytes
+    )
+
+    def cartesian(start, stop):
+        chunks = [ctx.wrap(x[start:stop], highlevel=False) for x in layouts]
+        return ak.operations.ak_cartesian._impl(
+            chunks if fields is None else dict(zip(fields, chunks)),
+            axis,
+            nested,
+            parameters,
+            with_name,
+            highlevel,
+            behavior,
+            ctx.attrs,
+        )
+
+    return ak.operations.ak_iter_combinations._chunks(stops, cartesian)
@@ -0,0 +1,222 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+from awkward._layout import HighLevelContext, maybe_posaxis
+from awkward._nplikes.array_like import ArrayLike
+from awkward._nplikes.numpy import Numpy
+from awkward._nplikes.numpy_like import NumpyMetadata
+from awkward._regularize import is_integer, regularize_axis
+from awkward.errors import AxisError
+
+__all__ = ("iter_combinations",)
+
+np = NumpyMetadata.instance()
+numpy = Numpy.instance()
+
+
+@high_level_function()
+def iter_combinations(
+    array,
+    n,
+    max_bytes,
+    *,
+    replacement=False,
+    axis=1,
+    fields=None,
+    parameters=None,
+    with_name=None,
+    highlevel=True,
+    behavior=None,
+    attrs=None,
+):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        n (int): The number of items to choose in each list: `2` chooses
+            unique pairs, `3` chooses unique triples, etc.
+        max_bytes (int): The largest number of bytes of combinations to
+            compute at once.
+        replacement (bool): If True, combinations that include the same
+            item more than once are allowed; otherwise each item in a
+            combinations is strictly unique.
+        axis (int): The dimension at which this operation is applied. The
+            outermost dimension is `0`, followed by `1`, etc., and negative
+            values count backward from the innermost: `-1` is the innermost
+            dimension, `-2` is the next level up, etc. It can't be `0`.
+        fields (None or list of str): If None, the pairs/triples/etc. are
+            tuples with unnamed fields; otherwise, these `fields` name the
+            fields. The number of `fields` must be equal to `n`.
+        parameters (None or dict): Parameters for the new
+            #ak.contents.RecordArray node that is created by this operation.
+        with_name (None or str): Assigns a `"__record__"` name to the new
+            #ak.contents.RecordArray node that is created by this operation
+            (overriding `parameters`, if necessary).
+        highlevel (bool): If True, yield #ak.Array objects; otherwise, yield
+            low-level #ak.contents.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+        attrs (None or dict): Custom attributes for the output arrays, if
+            high-level.
+
+    Returns an iterator over the #ak.combinations of consecutive ranges of
+    `array` (chunks of its outermost dimension), which are small enough that
+    the combinations of each range take at most about `max_bytes`. For example,
+
+        >>> for pairs in ak.iter_combinations(jets, 2, 100_000_000):
+        ...     masses.append(ak.max(mass(pairs["0"], pairs["1"]), axis=1))
+        ...
+        >>> masses = ak.concatenate(masses)
+
+    computes a result for each element of `jets` without making all of the
+    pairs at once, and the concatenation of the chunks of combinations would be
+    the same as `ak.combinations(jets, 2)`.
+
+    The number of combinations of each list is computed up front, and each of
+    them is counted as `n` times the average number of bytes per item of the
+    lists (with an 8-byte index for each item), so the ranges are only as
+    precise as that average. A range has at least one element of `array`,
+    even if the combinations of that element are larger than `max_bytes`.
+
+    See also #ak.iter_cartesian.
+    """
+    # Dispatch
+    yield (array,)
+
+    # Implementation
+    return _impl(
+        array,
+        n,
+        max_bytes,
+        replacement,
+        axis,
+        fields,
+        parameters,
+        with_name,
+        highlevel,
+        behavior,
+        attrs,
+    )
+
+
+def _impl(
+    array,
+    n,
+    max_bytes,
+    replacement,
+    axis,
+    fields,
+    parameters,
+    with_name,
+    highlevel,
+    behavior,
+    attrs,
+):
+    with HighLevelContext(behavior=behavior, attrs=attrs) as ctx:
+        layout = ctx.unwrap(array, allow_record=False, primitive_policy="error")
+
+    if not (is_integer(n) and n >= 1):
+        raise ValueError(f"'n' must be a positive integer, not {n!r}")
+    max_bytes = _regularize_max_bytes(max_bytes)
+    axis = regularize_axis(axis, none_allowed=False)
+    _check_axis(layout, axis)
+
+    lengths = ak.operations.ak_num._impl(layout, axis, True, None, None)
+    count = _num_combinations(lengths, n, replacement)
+    item_nbytes = _item_nbytes(layout, lengths)
+    stops = _chunk_stops(_per_element(count) * n * (8 + item_nbytes), max_bytes)
+
+    return _chunks(
+        stops,
+        lambda start, stop: ak.operations.ak_combinations._impl(
+            ctx.wrap(layout[start:stop], highlevel=False),
+            n,
+            replacement,
+            axis,
+            fields,
+            parameters,
+            with_name,
+            highlevel,
+            behavior,
+            ctx.attrs,
+        ),
+    )
+
+
+def _regularize_max_bytes(max_bytes):
+    if not (is_integer(max_bytes) and max_bytes > 0):
+        raise ValueError(f"'max_bytes' must be a positive integer, not {max_bytes!r}")
+    return int(max_bytes)
+
+
+def _check_axis(layout, axis):
+    if not layout.backend.nplike.known_data:
+        raise TypeError("arrays without data (typetracers) can't be split into chunks")
+    posaxis = maybe_posaxis(layout, axis, 1)
+    if posaxis is not None and posaxis == 0:
+        raise AxisError(
+            "'axis' can't be 0: the chunks are ranges of the outermost dimension"
+        )
+
+
+def _num_combinations(lengths, n, replacement):
+    """
+    Returns the number of combinations of `n` items of lists with `lengths`, as
+    floating-point numbers: the counts of long lists are too large for int64.
+    """
+    # (updated from the number of combinations of i items to that of i + 1)
+    count = 1.0
+    for i in range(n):
+        if replacement:
+            count = count * (lengths + i) / (i + 1)
+        else:
+            count = count * (lengths - i) / (i + 1)
+    return count
+
+
+def _item_nbytes(layout, lengths) -> float:
+    """
+    Returns the average number of bytes per item of `layout`'s lists whose
+    `lengths` are given.
+    """
+    total = ak.operations.ak_sum._impl(lengths, None, False, None, True, None, None)
+    return layout.nbytes / max(int(total), 1)
+
+
+def _per_element(counts) -> ArrayLike:
+    """
+    Returns the sum of `counts` (an array of the same dimensions as the lists
+    at some axis) in each element of the outermost dimension, as a NumPy array.
+    """
+    # (sums skip missing counts, and missing lists at any level have no sum;
+    # filling them before summing would make unions of numbers and lists)
+    while counts.ndim > 1:
+        counts = ak.operations.ak_sum._impl(counts, -1, False, None, True, None, None)
+    counts = ak.operations.ak_fill_none._impl(counts, 0, None, True, None, None)
+    return ak.operations.ak_to_numpy._impl(counts, False).astype(np.float64)
+
+
+def _chunk_stops(nbytes, max_bytes) -> list[int]:
+    """
+    Returns the stops of consecutive ranges of elements with `nbytes` each, in
+    which the total is at most `max_bytes` (or that have only one element). If
+    there are no elements, there is one empty range.
+    """
+    cumulative = numpy.cumsum(nbytes)
+    stops = []
+    start, before = 0, 0.0
+    while start < len(cumulative):
+        stop = int(numpy.searchsorted(cumulative, before + max_bytes, side="right"))
+        stop = max(stop, start + 1)
+        stops.append(stop)
+        start, before = stop, cumulative[stop - 1]
+    return stops or [0]
+
+
+def _chunks(stops, function):
+    start = 0
+    for stop in stops:
+        yield function(start, stop)
+        start = stop
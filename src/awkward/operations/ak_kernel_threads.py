@@ -0,0 +1,84 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import os
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+from awkward._regularize import is_integer
+
+__all__ = ("kernel_threads",)
+
+
+@high_level_function()
+def kernel_threads(num_threads=None):
+    """
+    Args:
+        num_threads (None or int): Number of threads that CPU kernels may use.
+            If None, use the number of CPUs; if 1, run every kernel in the
+            calling thread (the default).
+
+    Sets the number of threads that the CPU backend may use to run kernels for
+    large arrays, and returns an object that restores the previous number when
+    it is used as a context manager. This can be a global setting,
+
+        >>> ak.kernel_threads(8)
+
+    or limited to a block of code:
+
+        >>> with ak.kernel_threads(8):
+        ...     totals = ak.sum(array, axis=-1)
+
+    The kernels that do the most work (segmented reductions such as #ak.sum and
+    #ak.argmax, #ak.sort and #ak.argsort, broadcasting lists, and some carries)
+    are split into independent calls on ranges of lists, which run on a shared
+    thread pool without holding the GIL. Kernels with fewer than about 65536
+    values per thread, and other kernels, run as usual. The results are the same
+    as with one thread.
+
+    See also #ak.map_partitions, which splits whole computations (not individual
+    kernels) across threads or processes.
+    """
+    return _impl(num_threads)
+
+
+def _impl(num_threads):
+    if num_threads is None:
+        num_threads = os.cpu_count() or 1
+    elif is_integer(num_threads) and num_threads > 0:
+        num_threads = int(num_threads)
+    else:
+        raise ValueError(
+            f"'num_threads' must be None or a positive integer, not {num_threads!r}"
+        )
+    previous = ak._parallel.set_num_threads(num_threads)
+    return KernelThreads(num_threads, previous)
+
+
+class KernelThreads:
+    """
+    The number of threads set by #ak.kernel_threads, which restores the previous
+    number at the end of a `with` block.
+    """
+
+    def __init__(self, num_threads, previous):
+        self._num_threads = num_threads
+        self._previous = previous
+
+    @property
+    def num_threads(self):
+        return self._num_threads
+
+    @property
+    def previous(self):
+        return self._previous
+
+    def __repr__(self):
+        return f"ak.kernel_threads({self._num_threads})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        ak._parallel.set_num_threads(self._previous)
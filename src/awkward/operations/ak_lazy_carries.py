@@ -0,0 +1,121 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import weakref
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+
+__all__ = ("lazy_carries",)
+
+
+@high_level_function()
+def lazy_carries(selectivity=None):
+    """
+    Args:
+        selectivity (None or float): Fraction of the records, from 0 to 1, at or
+            below which a selection of records is compacted. If None, the
+            setting is not changed; if 0, selections are never compacted (the
+            default); if 1, they always are.
+
+    Sets when selections of records are compacted, and returns an object that
+    counts the lazy carries from then on and restores the previous setting when
+    it is used as a context manager.
+
+    Selecting records, as in `events[events.met > 20]`, does not select the
+    values of every field: the records are wrapped in an #ak.contents.IndexedArray
+    and each field is selected only when it is used. Selections from that
+    IndexedArray compose its index, but each use of a field selects its values
+    again, and all of the original records are kept.
+
+    If a selection keeps at most `selectivity` of the records that it selects
+    from, it is compacted instead: the result is an #ak.contents.RecordArray
+    whose fields are selected the first time that they are used, and then kept.
+    Fields that are not used are never selected; compacting them again composes
+    their indexes, rather than chaining the selections. This helps a cut-flow
+    that applies many selections to records with many fields, using a few of
+    them after each selection:
+
+        >>> with ak.lazy_carries(0.9) as carries:
+        ...     for cut in cuts:
+        ...         events = events[cut(events)]
+        ...
+        >>> carries.stats
+        {'lazy': 1, 'composed': 3, 'compacted': 16, 'resolved': 12, 'buffers': 40}
+
+    The `stats` are the number of
+
+    - `"lazy"`: selections that wrapped records in an IndexedArray;
+    - `"composed"`: selections from such an IndexedArray, which composed its index;
+    - `"compacted"`: selections that were compacted;
+    - `"resolved"`: IndexedArrays whose index was applied to their content
+      (for any type of content), which is how lazy carries are resolved;
+    - `"buffers"`: buffers of compacted records that were selected when first used
+
+    from the time that `ak.lazy_carries` was called until the end of the `with`
+    block (or until now, if it has not ended). The counts are not limited to this
+    thread.
+
+    Compacted records have a different #ak.forms.Form than IndexedArrays of
+    records (but the same #ak.types.Type), and arrays without data (typetracers)
+    are never compacted, so do not enable compaction when the forms predicted by
+    typetracers have to match the forms of the data, as in dask-awkward.
+    """
+    return _impl(selectivity)
+
+
+def _impl(selectivity):
+    previous = ak._carry.selectivity
+    if selectivity is not None:
+        if not (
+            isinstance(selectivity, (int, float))
+            and not isinstance(selectivity, bool)
+            and 0 <= selectivity <= 1
+        ):
+            raise ValueError(
+                f"'selectivity' must be None or a number from 0 to 1, not {selectivity!r}"
+            )
+        ak._carry.selectivity = float(selectivity)
+    return LazyCarries(ak._carry.selectivity, previous)
+
+
+class LazyCarries:
+    """
+    The setting of #ak.lazy_carries and the number of lazy carries since it was
+    made, which restores the previous setting at the end of a `with` block.
+    """
+
+    def __init__(self, selectivity, previous):
+        self._selectivity = selectivity
+        self._previous = previous
+        # count lazy carries until the end of the `with` block (or until this
+        # object is deleted)
+        ak._carry.observe(True)
+        self._observing = weakref.finalize(self, ak._carry.observe, False)
+        self._start = dict(ak._carry.counts)
+        self._stop = None
+
+    @property
+    def selectivity(self):
+        return self._selectivity
+
+    @property
+    def previous(self):
+        return self._previous
+
+    @property
+    def stats(self):
+        stop = ak._carry.counts if self._stop is None else self._stop
+        return {name: stop[name] - self._start[name] for name in self._start}
+
+    def __repr__(self):
+        return f"ak.lazy_carries({self._selectivity})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self._stop = dict(ak._carry.counts)
+        self._observing()
+        ak._carry.selectivity = self._previous
@@ -0,0 +1,258 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import concurrent.futures
+import math
+import os
+
+import awkward as ak
+from awkward._backends.numpy import NumpyBackend
+from awkward._dispatch import high_level_function
+from awkward._layout import HighLevelContext
+from awkward._nplikes.numpy import Numpy
+from awkward._nplikes.numpy_like import NumpyMetadata
+from awkward._regularize import is_integer
+
+__all__ = ("map_partitions",)
+
+np = NumpyMetadata.instance()
+numpy = Numpy.instance()
+
+
+@high_level_function()
+def map_partitions(
+    function,
+    array,
+    *,
+    npartitions=None,
+    executor="threads",
+    max_workers=None,
+    concatenate=True,
+    highlevel=True,
+    behavior=None,
+    attrs=None,
+):
+    """
+    Args:
+        function (callable): Function to apply to each partition, which takes an
+            #ak.Array and returns an array (or anything else, if `concatenate=False`).
+        array: Array-like data (anything #ak.to_layout recognizes).
+        npartitions (None or int): Number of partitions to split `array` into
+            (fewer if it has fewer elements). If None, use `max_workers` or the
+            number of CPUs.
+        executor (`"threads"`, `"processes"`, or concurrent.futures.Executor):
+            Where to run `function`: in a new thread pool, in a new process pool,
+            or in an existing executor.
+        max_workers (None or int): Maximum number of workers of the new pool, if
+            `executor` is `"threads"` or `"processes"`.
+        concatenate (bool): If True, concatenate the results along `axis=0` with
+            #ak.concatenate; otherwise, return a list of the results.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.contents.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+        attrs (None or dict): Custom attributes for the output array, if
+            high-level.
+
+    Splits `array` along `axis=0` into contiguous partitions, applies `function` to
+    each partition in parallel, and concatenates the results in order.
+
+    For example,
+
+        >>> array = ak.Array([[1, 2, 3], [], [4, 5], [6], [7, 8, 9, 10]])
+        >>> ak.map_partitions(lambda x: x * 10, array, npartitions=2)
+        <Array [[10, 20, 30], [], ..., [70, 80, 90, 100]] type='5 * var * int64'>
+
+    The partitions are balanced by the number of bytes in them (including the
+    contents of nested lists), not by the number of elements, so that partitions
+    take about the same time to process even if the lengths of lists vary a lot
+    between elements. (Arrays that are not in main memory are split by the number
+    of elements.)
+
+    With `executor="processes"`, the array is put in shared memory once with
+    #ak.to_shared_memory, and each worker process views its partition with
+    #ak.from_shared_memory, so the array is not serialized for each task; only the
+    results are. The `function` must be picklable (e.g. defined at the top level of
+    a module).
+
+    Threads are cheaper to start and share the array directly, but they only run
+    in parallel when `function` spends its time in code that releases the GIL.
+
+    See also #ak.concatenate.
+    """
+    # Dispatch
+    yield (array,)
+
+    # Implementation
+    return _impl(
+        function,
+        array,
+        npartitions,
+        executor,
+        max_workers,
+        concatenate,
+        highlevel,
+        behavior,
+        attrs,
+    )
+
+
+def _impl(
+    function,
+    array,
+    npartitions,
+    executor,
+    max_workers,
+    concatenate,
+    highlevel,
+    behavior,
+    attrs,
+):
+    if not callable(function):
+        raise TypeError(f"'function' must be callable, not {type(function).__name__}")
+    if npartitions is None:
+        npartitions = max_workers or os.cpu_count() or 1
+    elif is_integer(npartitions) and npartitions > 0:
+        npartitions = int(npartitions)
+    else:
+        raise ValueError(
+            f"'npartitions' must be a positive integer, not {npartitions!r}"
+        )
+    if not (
+        executor in ("threads", "processes")
+        or isinstance(executor, concurrent.futures.Executor)
+    ):
+        raise TypeError(
+            f"'executor' must be 'threads', 'processes', or a concurrent.futures.Executor, not {executor!r}"
+        )
+
+    with HighLevelContext(behavior=behavior, attrs=attrs) as ctx:
+        layout = ctx.unwrap(array, allow_record=False, primitive_policy="error")
+
+    stops = _partition_stops(layout, npartitions)
+    starts = [0, *stops[:-1]]
+
+    if executor == "threads":
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+            results = _map(function, layout, starts, stops, pool, ctx)
+    elif executor == "processes":
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as pool:
+            results = _map(function, layout, starts, stops, pool, ctx)
+    else:
+        results = _map(function, layout, starts, stops, executor, ctx)
+
+    if concatenate:
+        return ak.operations.ak_concatenate._impl(
+            results, 0, True, highlevel, ctx.behavior, ctx.attrs
+        )
+    else:
+        return results
+
+
+def _map(function, layout, starts, stops, pool, ctx):
+    if isinstance(pool, concurrent.futures.ProcessPoolExecutor):
+        with ak.operations.ak_to_shared_memory._impl(layout) as handle:
+            futures = [
+                pool.submit(
+                    _apply_shared,
+                    function,
+                    handle,
+                    start,
+                    stop,
+                    ctx.behavior,
+                    ctx.attrs,
+                )
+                for start, stop in zip(starts, stops)
+            ]
+            return [future.result() for future in futures]
+    else:
+        futures = [
+            pool.submit(function, ctx.wrap(layout[start:stop], highlevel=True))
+            for start, stop in zip(starts, stops)
+        ]
+        return [future.result() for future in futures]
+
+
+def _apply_shared(function, handle, start, stop, behavior, attrs):
+    array = ak.operations.ak_from_shared_memory._impl(handle, True, behavior, attrs)
+    return function(array[start:stop])
+
+
+def _partition_stops(layout, npartitions):
+    length = layout.length
+    if isinstance(layout.backend, NumpyBackend):
+        weights = _element_nbytes(layout)
+    else:
+        weights = numpy.ones(length, dtype=np.int64)
+
+    cumulative = numpy.cumsum(weights)
+    total = cumulative[-1] if length > 0 else 0
+    if total == 0:
+        cumulative = numpy.arange(1, length + 1)
+        total = length
+    # The first element at which each partition's share of the total is reached
+    targets = numpy.arange(1, npartitions) * (total / npartitions)
+    stops = numpy.searchsorted(cumulative, targets, side="left") + 1
+    stops = numpy.unique_values(stops[stops < length])
+    return [int(x) for x in stops] + [length]
+
+
+def _element_nbytes(layout):
+    # Number of bytes in each element of `layout`, including the buffers of its
+    # nested lists, records, missing values, and unions. Leaf data do not need to
+    # be read (or generated, if they are virtual): only their dtypes are used.
+    length = layout.length
+    if layout.is_unknown:
+        return numpy.zeros(length, dtype=np.int64)
+
+    elif layout.is_numpy:
+        itemsize = layout.dtype.itemsize * math.prod(layout.inner_shape)
+        return numpy.full(length, itemsize, dtype=np.int64)
+
+    elif layout.is_regular:
+        inner = _element_nbytes(layout.content)[: length * layout.size]
+        return inner.reshape(length, layout.size).sum(axis=1, dtype=np.int64)
+
+    elif layout.is_list:
+        if isinstance(layout, ak.contents.ListOffsetArray):
+            offsets = layout.offsets.raw(numpy)
+            starts, stops = offsets[:-1], offsets[1:]
+            itemsize = layout.offsets.data.dtype.itemsize
+        else:
+            starts = layout.starts.raw(numpy)[:length]
+            stops = layout.stops.raw(numpy)[:length]
+            itemsize = 2 * layout.starts.data.dtype.itemsize
+        inner = numpy.zeros(layout.content.length + 1, dtype=np.int64)
+        numpy.cumsum(_element_nbytes(layout.content), maybe_out=inner[1:])
+        return inner[stops] - inner[starts] + itemsize
+
+    elif layout.is_record:
+        out = numpy.zeros(length, dtype=np.int64)
+        for content in layout.contents:
+            out += _element_nbytes(content)[:length]
+        return out
+
+    elif layout.is_indexed or isinstance(layout, ak.contents.IndexedOptionArray):
+        index = layout.index.raw(numpy)
+        inner = _element_nbytes(layout.content)
+        out = numpy.full(length, layout.index.data.dtype.itemsize, dtype=np.int64)
+        valid = index >= 0
+        out[valid] += inner[index[valid]]
+        return out
+
+    elif layout.is_option:
+        # ByteMaskedArray, BitMaskedArray, and UnmaskedArray
+        return _element_nbytes(layout.content)[:length] + 1
+
+    elif layout.is_union:
+        tags = layout.tags.raw(numpy)
+        index = layout.index.raw(numpy)
+        out = numpy.full(length, 1 + layout.index.data.dtype.itemsize, dtype=np.int64)
+        for tag, content in enumerate(layout.contents):
+            selected = tags == tag
+            out[selected] += _element_nbytes(content)[index[selected]]
+        return out
+
+    else:
+        raise AssertionError(f"unrecognized layout: {type(layout).__name__}")
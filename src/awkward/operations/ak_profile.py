@@ -0,0 +1,300 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+
+__all__ = ("profile",)
+
+
+@high_level_function()
+def profile():
+    """
+    Returns a context manager that records every kernel called and every buffer
+    allocated in its `with` block, in any thread. For example,
+
+        >>> with ak.profile() as prof:
+        ...     result = ak.sum(ak.flatten(array, axis=-1), axis=-1)
+        ...
+        >>> print(prof.summary())
+        kernel                                                calls   total (ms)   mean (us)       %          bytes
+        awkward_ListOffsetArray_flatten_offsets                   1        0.254      254.30    67.4         960024
+        awkward_ListOffsetArray_reduce_local_outoffsets_64        1        0.123      123.25    32.6          80016
+
+    The `calls` are a list of `KernelCall` named tuples, in the order in which
+    the kernels returned, with
+
+    - `name`: the name of the kernel, such as `"awkward_reduce_sum"`;
+    - `dtypes`: the dtypes of its specialization, as strings;
+    - `lengths`: the lengths of the arrays passed to it, in order;
+    - `nbytes`: the number of bytes in those arrays, which are the kernel's
+      inputs and the outputs that were allocated for it;
+    - `start`: the value of `time.perf_counter_ns()` when it was called;
+    - `duration`: its wall time in nanoseconds;
+    - `thread`: the `threading.get_ident()` of the thread that called it;
+    - `operation`: the name of the high-level function, such as `"ak.sum"`, or
+      `"ak.Array.__getitem__"` for a slice, that called it (or None).
+
+    The `allocations` are a list of `Allocation` named tuples, in order, with
+
+    - `function`: the function that allocated the buffer: an array-creation
+      function of the NumPy backend, such as `"empty"` (which allocates the
+      buffers of new #ak.index.Index and #ak.contents.NumpyArray objects) or
+      `"asarray"` (if it copied), or `"NumpyArray._carry"`;
+    - `dtype`, `shape`, and `nbytes` of the buffer;
+    - `start`, `thread`, and `operation`, as for `calls`;
+    - `live`: the number of bytes in all of the recorded buffers that were
+      not yet garbage collected, including this one.
+
+    Only buffers of the CPU backend are recorded. Buffers made in other ways,
+    such as by NumPy functions applied to buffers, are not.
+
+    The `operations` are the calls of high-level functions that allocated
+    buffers, with the number of `buffers`, their total bytes (`allocated`), and
+    the most of those bytes that were live at once (`peak`), which is the
+    transient memory that the operation needed. Only the outermost high-level
+    function is counted, so #ak.cartesian includes the buffers of the functions
+    that it calls. If several threads allocate buffers at the same time, each
+    peak includes the other threads' buffers.
+
+    The `summary` method makes a table of the calls of each kernel (or of each
+    operation), `memory_summary` makes a table of the buffers and peak memory
+    of each operation,
+
+        >>> with ak.profile() as prof:
+        ...     pairs = ak.combinations(array, 2)
+        ...
+        >>> print(prof.memory_summary())
+        operation          calls   buffers      allocated           peak        largest
+        ak.combinations        1         9      316816064      316816064       79200000
+
+    and `to_chrome_trace` writes the calls and the live bytes in the Chrome
+    trace event format, which can be opened in `chrome://tracing` or
+    [Perfetto](https://ui.perfetto.dev).
+
+    Kernels that are split across threads by #ak.kernel_threads are recorded
+    as one call. CUDA kernels are launched asynchronously, so their duration is
+    only the time to launch them. Operations that do not call kernels, such as
+    most operations on typetracers, are not recorded.
+    """
+    return _impl()
+
+
+def _impl():
+    return Profile()
+
+
+class Profile:
+    """
+    The kernels called in the `with` block of an #ak.profile.
+    """
+
+    def __init__(self):
+        self._recorder = ak._profiling.Recorder()
+        self._start = None
+        self._stop = None
+
+    @property
+    def calls(self):
+        return self._recorder.calls
+
+    @property
+    def allocations(self):
+        return self._recorder.allocations
+
+    @property
+    def operations(self):
+        return self._recorder.operations
+
+    @property
+    def duration(self):
+        """
+        The wall time of the `with` block in nanoseconds (until now, if it has
+        not ended), or None if it has not started.
+        """
+        if self._start is None:
+            return None
+        stop = time.perf_counter_ns() if self._stop is None else self._stop
+        return stop - self._start
+
+    def __repr__(self):
+        return f"<ak.profile of {len(self.calls)} kernel calls and {len(self.allocations)} allocations>"
+
+    def __enter__(self):
+        if self._start is not None:
+            raise RuntimeError("an ak.profile can only be used once")
+        self._start = time.perf_counter_ns()
+        ak._profiling.start(self._recorder)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        ak._profiling.stop(self._recorder)
+        self._stop = time.perf_counter_ns()
+
+    def summary(self, by="kernel", limit=None):
+        """
+        Args:
+            by ("kernel", "dtypes", or "operation"): Add up the calls of each
+                kernel, of each kernel with each specialization, or of each
+                high-level operation.
+            limit (None or int): If not None, the maximum number of rows.
+
+        Returns a table of the number of calls, their total and mean wall time,
+        their percentage of the time spent in kernels, and the total bytes of
+        their arrays, as a string, with the most time-consuming rows first.
+        """
+        if by == "kernel":
+            label = "kernel"
+
+            def group(call):
+                return call.name
+
+        elif by == "dtypes":
+            label = "kernel"
+
+            def group(call):
+                return ", ".join((call.name, *call.dtypes))
+
+        elif by == "operation":
+            label = "operation"
+
+            def group(call):
+                return "(none)" if call.operation is None else call.operation
+
+        else:
+            raise ValueError(
+                f"'by' must be 'kernel', 'dtypes', or 'operation', not {by!r}"
+            )
+
+        rows = {}
+        for call in self.calls:
+            row = rows.setdefault(group(call), [0, 0, 0])
+            row[0] += 1
+            row[1] += call.duration
+            row[2] += call.nbytes
+        total = sum(row[1] for row in rows.values())
+        ordered = sorted(rows.items(), key=lambda item: -item[1][1])
+        if limit is not None:
+            ordered = ordered[:limit]
+
+        width = max([len(label)] + [len(name) for name, _ in ordered])
+        lines = [
+            f"{label:{width}s}  {'calls':>7s}  {'total (ms)':>11s}  {'mean (us)':>10s}  {'%':>6s}  {'bytes':>13s}"
+        ]
+        for name, (calls, duration, nbytes) in ordered:
+            percent = 100.0 * duration / total if total > 0 else 0.0
+            lines.append(
+                f"{name:{width}s}  {calls:7d}  {duration / 1e6:11.3f}  "
+                f"{duration / calls / 1e3:10.2f}  {percent:6.1f}  {nbytes:13d}"
+            )
+        return "\n".join(lines)
+
+    def memory_summary(self, limit=None):
+        """
+        Args:
+            limit (None or int): If not None, the maximum number of rows.
+
+        Returns a table of the high-level operations that allocated buffers:
+        the number of calls, the number of buffers and their total bytes, the
+        most bytes allocated by one call that were live at once (its peak
+        transient memory), and the largest buffer, as a string, with the
+        largest peaks first.
+        """
+        rows = {}
+        for operation in self.operations:
+            name = "(none)" if operation.name is None else operation.name
+            row = rows.setdefault(name, [0, 0, 0, 0, 0])
+            row[0] += 1
+            row[1] += operation.buffers
+            row[2] += operation.allocated
+            row[3] = max(row[3], operation.peak)
+        for allocation in self.allocations:
+            name = "(none)" if allocation.operation is None else allocation.operation
+            row = rows.setdefault(name, [0, 0, 0, 0, 0])
+            if allocation.operation is None:
+                row[1] += 1
+                row[2] += allocation.nbytes
+            row[4] = max(row[4], allocation.nbytes)
+        ordered = sorted(rows.items(), key=lambda item: -item[1][3])
+        if limit is not None:
+            ordered = ordered[:limit]
+
+        width = max([len("operation")] + [len(name) for name, _ in ordered])
+        lines = [
+            f"{'operation':{width}s}  {'calls':>7s}  {'buffers':>8s}  {'allocated':>13s}  {'peak':>13s}  {'largest':>13s}"
+        ]
+        for name, (calls, buffers, nbytes, peak, largest) in ordered:
+            lines.append(
+                f"{name:{width}s}  {calls:7d}  {buffers:8d}  {nbytes:13d}  {peak:13d}  {largest:13d}"
+            )
+        return "\n".join(lines)
+
+    def to_chrome_trace(self, file=None):
+        """
+        Args:
+            file (None, str, path-like, or file-like object): If None, return
+                the trace as a string; otherwise, write it to this file.
+
+        Returns (or writes) the calls as JSON in the Chrome trace event format,
+        with one complete (`"X"`) event for each call in the thread that made
+        it, and a counter (`"C"`) event of the live bytes of the tracked buffers
+        after each allocation and free. Times are in microseconds from the start
+        of the `with` block.
+        """
+        start = self._start if self._start is not None else 0
+        pid = os.getpid()
+        threads = {call.thread for call in self.calls}
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread.ident,
+                "args": {"name": thread.name},
+            }
+            for thread in threading.enumerate()
+            if thread.ident in threads
+        ]
+        for call in self.calls:
+            events.append(
+                {
+                    "name": call.name,
+                    "cat": "kernel" if call.operation is None else call.operation,
+                    "ph": "X",
+                    "ts": (call.start - start) / 1e3,
+                    "dur": call.duration / 1e3,
+                    "pid": pid,
+                    "tid": call.thread,
+                    "args": {
+                        "dtypes": list(call.dtypes),
+                        "lengths": list(call.lengths),
+                        "nbytes": call.nbytes,
+                        "operation": call.operation,
+                    },
+                }
+            )
+        for timestamp, live in self._recorder.memory:
+            events.append(
+                {
+                    "name": "live bytes",
+                    "ph": "C",
+                    "ts": (timestamp - start) / 1e3,
+                    "pid": pid,
+                    "args": {"bytes": live},
+                }
+            )
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+
+        if file is None:
+            return json.dumps(trace)
+        elif isinstance(file, (str, bytes, os.PathLike)):
+            with open(file, "w", encoding="utf-8") as f:
+                json.dump(trace, f)
+        else:
+            json.dump(trace, file)
@@ -0,0 +1,175 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+from awkward._layout import HighLevelContext
+from awkward._namedaxis import (
+    _get_named_axis,
+    _keep_named_axis,
+    _named_axis_to_positional_axis,
+    _remove_named_axis,
+)
+from awkward._nplikes.numpy_like import NumpyMetadata
+from awkward._regularize import is_non_string_like_iterable, regularize_axis
+
+__all__ = ("reduce_many",)
+
+np = NumpyMetadata.instance()
+
+# Reducer and whether its results for empty lists are masked by default (as in
+# the corresponding ak.* function)
+_reducers = {
+    "count": (ak._reducers.Count, False),
+    "count_nonzero": (ak._reducers.CountNonzero, False),
+    "sum": (ak._reducers.Sum, False),
+    "sumsq": (ak._reducers.SumOfSquares, False),
+    "prod": (ak._reducers.Prod, False),
+    "any": (ak._reducers.Any, False),
+    "all": (ak._reducers.All, False),
+    "min": (lambda: ak._reducers.Min(None), True),
+    "max": (lambda: ak._reducers.Max(None), True),
+    "argmin": (ak._reducers.ArgMin, True),
+    "argmax": (ak._reducers.ArgMax, True),
+}
+
+
+@high_level_function()
+def reduce_many(
+    array,
+    reducers,
+    axis=None,
+    *,
+    keepdims=False,
+    mask_identity=None,
+    highlevel=True,
+    behavior=None,
+    attrs=None,
+):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        reducers (iterable of str): Names of the reductions to compute, each of
+            which is a field of the output: `"count"`, `"count_nonzero"`, `"sum"`,
+            `"sumsq"` (sum of squares), `"prod"`, `"any"`, `"all"`, `"min"`,
+            `"max"`, `"argmin"`, `"argmax"`.
+        axis (None or int): If None, combine all values from the array into
+            a single scalar result; if an int, group by that axis: `0` is the
+            outermost, `1` is the first level of nested lists, etc., and
+            negative `axis` counts from the innermost: `-1` is the innermost,
+            `-2` is the next level up, etc.
+        keepdims (bool): If False, this reducer decreases the number of
+            dimensions by 1; if True, the reduced values are wrapped in a new
+            length-1 dimension so that the result of this operation may be
+            broadcasted with the original array.
+        mask_identity (None or bool): If True, reducing over empty lists results
+            in None (an option type) for all reductions; if False, it results in
+            each operation's identity. If None, each reduction uses the default of
+            its own function: only `"min"`, `"max"`, `"argmin"`, and `"argmax"` are
+            masked.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.contents.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+        attrs (None or dict): Custom attributes for the output array, if
+            high-level.
+
+    Computes several reductions of `array` in one pass, returning an array of
+    records (or a record, if `axis=None` and `keepdims=False`) with a field for
+    each of the `reducers`. Each field is the same as the result of the
+    corresponding function (#ak.count, #ak.sum, etc.).
+
+    For example,
+
+        >>> array = ak.Array([[1, 2, 3], [], [4, 5]])
+        >>> ak.reduce_many(array, ["count", "sum", "min"], axis=-1).show()
+        [{count: 3, sum: 6, min: 1},
+         {count: 0, sum: 0, min: None},
+         {count: 2, sum: 9, min: 4}]
+
+    The lists and missing values of `array` are traversed (and the indexes that
+    group the values for the reductions are made) only once, rather than once per
+    reduction, as they would be in separate calls to #ak.count, #ak.sum, etc.
+
+    See also #ak.sum, #ak.count, #ak.min, #ak.max, #ak.argmin, #ak.argmax.
+    """
+    # Dispatch
+    yield (array,)
+
+    # Implementation
+    return _impl(
+        array, reducers, axis, keepdims, mask_identity, highlevel, behavior, attrs
+    )
+
+
+def _impl(array, reducers, axis, keepdims, mask_identity, highlevel, behavior, attrs):
+    if isinstance(reducers, str) or not is_non_string_like_iterable(reducers):
+        raise TypeError(
+            f"'reducers' must be an iterable of reducer names, not {reducers!r}"
+        )
+    reducers = list(reducers)
+    if len(reducers) == 0:
+        raise ValueError("at least one reducer is required")
+    for name in reducers:
+        if name not in _reducers:
+            raise ValueError(
+                f"unrecognized reducer {name!r}; must be one of {', '.join(map(repr, _reducers))}"
+            )
+    if len(set(reducers)) != len(reducers):
+        raise ValueError(f"reducers must not be repeated: {reducers!r}")
+
+    with HighLevelContext(behavior=behavior, attrs=attrs) as ctx:
+        layout = ctx.unwrap(array, allow_record=False, primitive_policy="error")
+
+    # Handle named axis
+    named_axis = _get_named_axis(ctx)
+    # Step 1: Normalize named axis to positional axis
+    axis = _named_axis_to_positional_axis(named_axis, axis)
+    # Step 2: propagate named axis from input to output,
+    #   keepdims=True: use strategy "keep all" (see: awkward._namedaxis)
+    #   keepdims=False: use strategy "remove one" (see: awkward._namedaxis)
+    out_named_axis = _keep_named_axis(named_axis, None)
+    if not keepdims:
+        out_named_axis = _remove_named_axis(
+            named_axis=out_named_axis,
+            axis=axis,
+            total=layout.minmax_depth[1],
+        )
+
+    axis = regularize_axis(axis, none_allowed=True)
+
+    reducer = ak._reducers.ReduceMany(
+        {
+            name: (
+                _reducers[name][0](),
+                _reducers[name][1] if mask_identity is None else mask_identity,
+            )
+            for name in reducers
+        }
+    )
+
+    # Each reducer's results are masked by `ReduceMany`, not by the traversal
+    out = ak._do.reduce(
+        layout,
+        reducer,
+        axis=axis,
+        mask=False,
+        keepdims=keepdims,
+        behavior=ctx.behavior,
+    )
+
+    wrapped_out = ctx.wrap(
+        out,
+        highlevel=highlevel,
+        allow_other=True,
+    )
+
+    # propagate named axis to output
+    return ak.operations.ak_with_named_axis._impl(
+        wrapped_out,
+        named_axis=out_named_axis,
+        highlevel=highlevel,
+        behavior=ctx.behavior,
+        attrs=ctx.attrs,
+    )
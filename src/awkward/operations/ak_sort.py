@@ -25,6 +25,7 @@ def sort(
     *,
     ascending=True,
     stable=True,
+    kind=None,
     highlevel=True,
     behavior=None,
     attrs=None,
@@ -41,6 +42,10 @@ def sort(
             is from largest to smallest.
         stable (bool): If True, use a stable sorting algorithm; if False,
             use a sorting algorithm that is not guaranteed to be stable.
+        kind (None or `"radix"`): If `"radix"`, sort lists of integers (including
+            booleans and datetimes) with a radix sort, which is stable and takes
+            time proportional to the number of values, rather than a comparison
+            sort. Other types are sorted as usual.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.contents.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -59,10 +64,13 @@ def sort(
     yield (array,)
 
     # Implementation
-    return _impl(array, axis, ascending, stable, highlevel, behavior, attrs)
+    return _impl(array, axis, ascending, stable, kind, highlevel, behavior, attrs)
 
 
-def _impl(array, axis, ascending, stable, highlevel, behavior, attrs):
+def _impl(array, axis, ascending, stable, kind, highlevel, behavior, attrs):
+    if kind not in (None, "radix"):
+        raise ValueError(f"'kind' must be None or 'radix', not {kind!r}")
+
     with HighLevelContext(behavior=behavior, attrs=attrs) as ctx:
         layout = ctx.unwrap(array, allow_record=False, primitive_policy="error")
 
@@ -73,7 +81,7 @@ def _impl(array, axis, ascending, stable, highlevel, behavior, attrs):
 
     axis = regularize_axis(axis, none_allowed=False)
 
-    out = ak._do.sort(layout, axis, ascending, stable)
+    out = ak._do.sort(layout, axis, ascending, stable, kind)
 
     return ctx.wrap(
         out,
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import awkward as ak
+import awkward._codecs
 from awkward._backends.dispatch import regularize_backend
+from awkward._backends.numpy import NumpyBackend
 from awkward._dispatch import high_level_function
 from awkward._nplikes.numpy_like import NumpyMetadata
 
@@ -22,6 +24,8 @@ def to_buffers(
     id_start=0,
     backend=None,
     byteorder="<",
+    compression=None,
+    compression_level=None,
 ):
     """
     Args:
@@ -55,6 +59,12 @@ def to_buffers(
         byteorder (`"<"`, `">"`): Endianness of buffers written to `container`.
             If the byteorder does not match the current system byteorder, the
             arrays will be copied.
+        compression (None, `"zlib"`, `"lzma"`, `"bz2"`, `"zstd"`, `"lz4"`): If
+            not None, each buffer is compressed with this codec and put into the
+            `container` as a bytes object (see below). The `"zstd"` and `"lz4"`
+            codecs require the `zstandard` and `lz4` packages, respectively.
+        compression_level (None or int): Compression level for the codec, or
+            None for the codec's default.
 
     Decomposes an Awkward Array into a Form and a collection of memory buffers,
     so that data can be losslessly written to file formats and storage devices
@@ -122,16 +132,47 @@ def to_buffers(
     If you intend to use this function for saving data, you may want to pack it
     first with #ak.to_packed.
 
+    With a `compression` codec, the buffers are replaced by bytes objects that
+    record the dtype and how the data were prepared for compression: integer
+    buffers whose values never decrease, such as list offsets, are delta-encoded,
+    and the bytes of multi-byte values are shuffled so that bytes of the same
+    significance are adjacent. Pass the same `compression` to #ak.from_buffers to
+    read them back:
+
+        >>> form, length, container = ak.to_buffers(original, compression="zlib")
+        >>> ak.from_buffers(form, length, container, compression="zlib")
+        <Array [[1, 2, 3], [], [4, 5]] type='3 * var * int64'>
+
     See also #ak.from_buffers and #ak.to_packed.
     """
     # Dispatch
     yield (array,)
 
     # Implementation
-    return _impl(array, container, buffer_key, form_key, id_start, backend, byteorder)
+    return _impl(
+        array,
+        container,
+        buffer_key,
+        form_key,
+        id_start,
+        backend,
+        byteorder,
+        compression,
+        compression_level,
+    )
 
 
-def _impl(array, container, buffer_key, form_key, id_start, backend, byteorder):
+def _impl(
+    array,
+    container,
+    buffer_key,
+    form_key,
+    id_start,
+    backend,
+    byteorder,
+    compression=None,
+    compression_level=None,
+):
     layout = ak.operations.to_layout(
         array, allow_record=False, primitive_policy="error"
     )
@@ -139,6 +180,25 @@ def _impl(array, container, buffer_key, form_key, id_start, backend, byteorder):
     if backend is not None:
         backend = regularize_backend(backend)
 
+    if compression is not None:
+        codec = ak._codecs.get_codec(compression)
+        if (
+            layout.backend if backend is None else backend
+        ) is not NumpyBackend.instance():
+            raise ValueError("compression is only supported for the 'cpu' backend")
+        if container is None:
+            container = {}
+        form, length, _ = ak._do.to_buffers(
+            layout,
+            container=_CompressingContainer(container, codec, compression_level),
+            buffer_key=buffer_key,
+            form_key=form_key,
+            id_start=id_start,
+            backend=backend,
+            byteorder=byteorder,
+        )
+        return form, length, container
+
     return ak._do.to_buffers(
         layout,
         container=container,
@@ -148,3 +208,13 @@ def _impl(array, container, buffer_key, form_key, id_start, backend, byteorder):
         backend=backend,
         byteorder=byteorder,
     )
+
+
+class _CompressingContainer:
+    def __init__(self, container, codec, level):
+        self._container = container
+        self._codec = codec
+        self._level = level
+
+    def __setitem__(self, key, value):
+        self._container[key] = ak._codecs.encode(value, self._codec, self._level)
@@ -0,0 +1,123 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import json
+import struct
+from os import PathLike, fsdecode
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+from awkward._nplikes.numpy_like import NumpyMetadata
+
+__all__ = ("to_buffers_file",)
+
+np = NumpyMetadata.instance()
+
+# File layout: magic, header size (uint64, little-endian), JSON header, and the
+# buffers, each starting at a multiple of _alignment from the start of the data
+_magic = b"awkward\x01"
+_header_size = struct.Struct("<Q")
+_alignment = 64
+
+
+@high_level_function()
+def to_buffers_file(
+    array, destination, *, byteorder="<", compression=None, compression_level=None
+):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        destination (path-like or file-like object): Name of the file to write,
+            or a binary file-like object with a `write` method.
+        byteorder (`"<"`, `">"`): Endianness of the buffers in the file.
+        compression (None, `"zlib"`, `"lzma"`, `"bz2"`, `"zstd"`, `"lz4"`): If
+            not None, each buffer is compressed with this codec, as in
+            #ak.to_buffers.
+        compression_level (None or int): Compression level for the codec, or
+            None for the codec's default.
+
+    Writes an Awkward Array to a single binary file: the Form, the length, and
+    all of the buffers of #ak.to_buffers (after #ak.to_packed), with each buffer
+    aligned to 64 bytes so that #ak.from_buffers_file can memory-map it and use it
+    without copying.
+
+    For example,
+
+        >>> array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+        >>> ak.to_buffers_file(array, "array.akb")
+        >>> ak.from_buffers_file("array.akb")
+        <Array [[1.1, 2.2, 3.3], [], [4.4, 5.5]] type='3 * var * float64'>
+
+    Compressed buffers are decompressed into memory when the file is read, so
+    reading them is not zero-copy.
+
+    This format is meant for fast, local storage of intermediate results; use
+    #ak.to_parquet for archival or interchange.
+
+    See also #ak.from_buffers_file, #ak.to_buffers.
+    """
+    # Dispatch
+    yield (array,)
+
+    # Implementation
+    return _impl(array, destination, byteorder, compression, compression_level)
+
+
+def _impl(array, destination, byteorder, compression, compression_level):
+    # Only write the parts of the buffers that are used
+    packed = ak.operations.ak_to_packed._impl(array, False, None, None)
+    form, length, container = ak.operations.ak_to_buffers._impl(
+        packed,
+        None,
+        "{form_key}-{attribute}",
+        "node{id}",
+        0,
+        "cpu",
+        byteorder,
+        compression,
+        compression_level,
+    )
+
+    views = {key: memoryview(buffer).cast("B") for key, buffer in container.items()}
+    offsets = {}
+    data_size = 0
+    for key, view in views.items():
+        offsets[key] = [data_size, view.nbytes]
+        data_size = _aligned(data_size + view.nbytes)
+
+    header = json.dumps(
+        {
+            "form": form.to_dict(),
+            "length": length,
+            "byteorder": byteorder,
+            "compression": compression,
+            "buffers": offsets,
+        }
+    ).encode("utf-8")
+
+    if isinstance(destination, (str, bytes, PathLike)):
+        with open(fsdecode(destination), "wb") as file:
+            _write(file, header, views)
+    elif hasattr(destination, "write"):
+        _write(destination, header, views)
+    else:
+        raise TypeError(
+            "'destination' must either be a filename string or be a file-like object with a 'write' method"
+        )
+
+
+def _aligned(position):
+    return -(-position // _alignment) * _alignment
+
+
+def _write(file, header, views):
+    file.write(_magic)
+    file.write(_header_size.pack(len(header)))
+    file.write(header)
+    position = len(_magic) + _header_size.size + len(header)
+    file.write(b"\x00" * (_aligned(position) - position))
+
+    for view in views.values():
+        file.write(view)
+        file.write(b"\x00" * (_aligned(view.nbytes) - view.nbytes))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Sized
 from numbers import Number
 from os import PathLike, fsdecode
 from urllib.parse import urlparse
@@ -11,7 +12,8 @@ import fsspec
 from awkward_cpp.lib import _ext
 
 import awkward as ak
-from awkward._behavior import behavior_of
+from awkward._backends.numpy import NumpyBackend
+from awkward._behavior import behavior_of, get_array_class, get_record_class
 from awkward._dispatch import high_level_function
 from awkward._nplikes.numpy import Numpy
 from awkward._nplikes.numpy_like import NumpyMetadata
@@ -78,11 +80,17 @@ def to_json(
     Records) into JSON text. Returns bytes (encoded JSON) if `file` is None;
     otherwise, this function returns nothing and writes to a file.
 
-    This function converts the array into Python objects with #ak.to_list, performs
-    some conversions to make the data JSON serializable (`nan_string`,
-    `posinf_string`, `neginf_string`, `complex_record_fields`, `convert_bytes`,
-    `convert_other`), then uses `json.dumps` to return a string or `json.dump`
-    to write to a file (depending on the value of `file`).
+    Arrays of numbers, booleans, strings, lists, records, missing values, and
+    unions in main memory are written directly from their buffers (offsets,
+    masks, indexes, and characters), a range of elements at a time, without
+    making Python objects for the elements. Otherwise, such as for arrays with
+    raw bytestrings, dates and times, custom behaviors that override
+    `__getitem__`, or `num_indent_spaces`, this function converts the array
+    into Python objects with #ak.to_list, performs some conversions to make the
+    data JSON serializable (`nan_string`, `posinf_string`, `neginf_string`,
+    `complex_record_fields`, `convert_bytes`, `convert_other`), then uses
+    `json.dumps` to return a string or `json.dump` to write to a file
+    (depending on the value of `file`). Both produce the same text.
 
     If `line_delimited` is True or a line-delimiter string like `"\\r\\n"`/`os.linesep`,
     the output is line-delimited JSON, variously referred to as "ldjson", "ndjson", and
@@ -182,15 +190,6 @@ def _impl(
     else:
         raise TypeError(f"unrecognized array type: {array!r}")
 
-    jsondata = out.to_json(
-        nan_string=nan_string,
-        posinf_string=posinf_string,
-        neginf_string=neginf_string,
-        complex_record_fields=complex_record_fields,
-        convert_bytes=convert_bytes,
-        behavior=behavior_of(array),
-    )
-
     if line_delimited and not isinstance(line_delimited, str):
         line_delimited = "\n"
 
@@ -217,6 +216,43 @@ def _impl(
             def opener():
                 return _NoContextManager(file)
 
+    writer = _ColumnarWriter(
+        separators,
+        nan_string,
+        posinf_string,
+        neginf_string,
+        complex_record_fields,
+        behavior_of(array),
+    )
+    if (line_delimited or num_indent_spaces is None) and writer.supports(out):
+        if line_delimited:
+            chunks = writer.lines(out, line_delimited)
+        elif isinstance(array, (ak.highlevel.Record, ak.record.Record)):
+            chunks = writer.lines(out, "")
+        else:
+            chunks = writer.document(out)
+
+        if file is None:
+            return "".join(chunks)
+        else:
+            if not writer.finite(out):
+                # a number that has no replacement string is an error, which
+                # has to be raised before the file is opened (and truncated)
+                chunks = list(chunks)
+            with opener() as openfile:
+                for chunk in chunks:
+                    openfile.write(chunk)
+            return None
+
+    jsondata = out.to_json(
+        nan_string=nan_string,
+        posinf_string=posinf_string,
+        neginf_string=neginf_string,
+        complex_record_fields=complex_record_fields,
+        convert_bytes=convert_bytes,
+        behavior=behavior_of(array),
+    )
+
     try:
         if line_delimited:
             if file is None:
@@ -299,3 +335,475 @@ class _NoContextManager:
 
     def __exit__(self, exception_type, exception_value, exception_traceback):
         pass
+
+
+# Approximate number of bytes of an array to write at a time
+_chunk_nbytes = 2**24
+
+
+class _ColumnarWriter:
+    """
+    Writes JSON from the buffers of a layout, with the same text as `json.dumps`
+    of its #ak.to_list.
+
+    The JSON text of each element of each node is made from the JSON texts of
+    the elements of its contents, like a string array: `data` (bytes as uint8)
+    and `offsets` (int64), such that the text of element `i` is
+    `data[offsets[i]:offsets[i + 1]]`. All of the text is ASCII, as `json.dumps`
+    with `ensure_ascii=True` makes it.
+    """
+
+    def __init__(
+        self,
+        separators,
+        nan_string,
+        posinf_string,
+        neginf_string,
+        complex_record_fields,
+        behavior,
+    ):
+        self.comma = separators[0].encode()
+        self.colon = separators[1].encode()
+        self.nan_string = nan_string
+        self.posinf_string = posinf_string
+        self.neginf_string = neginf_string
+        if (
+            isinstance(complex_record_fields, Sized)
+            and isinstance(complex_record_fields, Iterable)
+            and len(complex_record_fields) == 2
+            and isinstance(complex_record_fields[0], str)
+            and isinstance(complex_record_fields[1], str)
+        ):
+            self.complex_record_fields = tuple(complex_record_fields)
+        else:
+            self.complex_record_fields = None
+        self.behavior = behavior
+
+    def supports(self, layout) -> bool:
+        """
+        Returns True if every node of `layout` can be written from its buffers;
+        otherwise, it has to be converted into Python objects.
+        """
+        return isinstance(layout.backend, NumpyBackend) and self._supports(layout)
+
+    def _supports(self, layout) -> bool:
+        if layout.is_record:
+            getitem = get_record_class(layout, self.behavior).__getitem__
+            if getitem is not ak.highlevel.Record.__getitem__ and not getattr(
+                getitem, "ignore_in_to_list", False
+            ):
+                return False
+        else:
+            getitem = get_array_class(layout, self.behavior).__getitem__
+            if getitem is not ak.highlevel.Array.__getitem__ and not getattr(
+                getitem, "ignore_in_to_list", False
+            ):
+                return False
+
+        if layout.is_unknown:
+            return True
+        elif layout.is_numpy:
+            if layout.parameter("__array__") in ("byte", "char"):
+                return False
+            kind = layout.dtype.kind
+            return (
+                kind in "biu"
+                or (kind == "f" and layout.dtype.itemsize <= 8)
+                or (
+                    kind == "c"
+                    and layout.dtype.itemsize <= 16
+                    and self.complex_record_fields is not None
+                )
+            )
+        elif layout.is_list and layout.parameter("__array__") == "string":
+            return True
+        elif layout.parameter("__array__") == "bytestring":
+            return False
+        elif layout.is_union or layout.is_record:
+            return all(self._supports(x) for x in layout.contents)
+        else:
+            return self._supports(layout.content)
+
+    def finite(self, layout) -> bool:
+        """
+        Returns True if no number in the buffers of `layout` needs a replacement
+        string that isn't given, so that writing it can't fail part-way.
+        """
+        if None not in (self.nan_string, self.posinf_string, self.neginf_string):
+            return True
+        elif layout.is_numpy:
+            data = layout.data
+            return layout.dtype.kind not in "fc" or not bool(
+                numpy.any(numpy.isnan(data) | (data == np.inf) | (data == -np.inf))
+            )
+        elif layout.is_unknown:
+            return True
+        elif layout.is_union or layout.is_record:
+            return all(self.finite(x) for x in layout.contents)
+        else:
+            return self.finite(layout.content)
+
+    def lines(self, layout, delimiter: str):
+        """
+        Yields the text of each element of `layout`, followed by `delimiter`.
+        """
+        delimiter = delimiter.encode()
+        for chunk in self._chunks(layout):
+            data = _text_concatenate([self.texts(chunk), delimiter], chunk.length)[0]
+            yield data.tobytes().decode()
+
+    def document(self, layout):
+        """
+        Yields the text of `layout` as a single JSON list.
+        """
+        yield "["
+        for i, chunk in enumerate(self._chunks(layout)):
+            if i != 0 and chunk.length != 0:
+                yield self.comma.decode()
+            data = _text_join(
+                self.texts(chunk),
+                numpy.asarray([0, chunk.length], dtype=np.int64),
+                b"",
+                self.comma,
+                b"",
+            )[0]
+            yield data.tobytes().decode()
+        yield "]"
+
+    def _chunks(self, layout):
+        length = layout.length
+        step = max(1, int(length * _chunk_nbytes / max(layout.nbytes, 1)))
+        for start in range(0, length, step):
+            yield layout._getitem_range(start, min(start + step, length)).to_packed()
+
+    def texts(self, layout):
+        """
+        Returns the JSON text of each element of `layout` as `(data, offsets)`.
+        """
+        if layout.is_unknown:
+            return _text_fixed(numpy.empty(0, dtype="S1"))
+
+        elif layout.is_numpy:
+            if layout.data.ndim != 1:
+                return self.texts(layout.to_RegularArray())
+            return self._numbers(layout)
+
+        elif layout.is_list:
+            if not isinstance(layout, ak.contents.ListOffsetArray):
+                layout = layout.to_ListOffsetArray64(True)
+            offsets = layout.offsets.data
+            start, stop = int(offsets[0]), int(offsets[-1])
+            content = layout.content._getitem_range(start, stop)
+            if layout.parameter("__array__") == "string":
+                return self._strings(content.data, offsets - start)
+            else:
+                return _text_join(
+                    self.texts(content), offsets - start, b"[", self.comma, b"]"
+                )
+
+        elif layout.is_record:
+            if layout.fields is None or layout.is_tuple:
+                keys = [str(i) for i in range(len(layout.contents))]
+            else:
+                keys = layout.fields
+            pieces = [b"{"]
+            for i, key in enumerate(keys):
+                if i != 0:
+                    pieces.append(self.comma)
+                pieces.append(json.dumps(key).encode() + self.colon)
+                pieces.append(self.texts(layout.content(i)))
+            pieces.append(b"}")
+            return _text_concatenate(pieces, layout.length)
+
+        elif layout.is_union:
+            texts = [self.texts(x) for x in layout.contents]
+            firsts = numpy.cumsum(
+                numpy.asarray([0] + [len(x[1]) - 1 for x in texts], dtype=np.int64)
+            )
+            tags = layout.tags.data
+            index = layout.index.data[: len(tags)]
+            return _text_take(_text_stack(texts), firsts[tags] + index)
+
+        elif layout.is_option:
+            index = layout.to_IndexedOptionArray64().index.data
+            content = self.texts(layout.content)
+            valid = index >= 0
+            nextindex = index[valid]
+            if not numpy.array_equal(
+                nextindex, numpy.arange(len(content[1]) - 1, dtype=np.int64)
+            ):
+                content = _text_take(content, nextindex)
+            return _text_expand(content, valid, b"null")
+
+        elif layout.is_indexed:
+            return _text_take(self.texts(layout.content), layout.index.data)
+
+        else:
+            raise AssertionError(type(layout))
+
+    def _numbers(self, layout):
+        data = layout.data
+        kind = data.dtype.kind
+        if kind == "b":
+            return _text_fixed(numpy.where(data, b"true", b"false"))
+        elif kind in "iu":
+            return _text_integers(data)
+        elif kind == "c":
+            real, imag = self.complex_record_fields
+            record = ak.contents.RecordArray(
+                [
+                    ak.contents.NumpyArray(data.real),
+                    ak.contents.NumpyArray(data.imag),
+                ],
+                [real, imag],
+                len(data),
+            )
+            return self.texts(record)
+
+        data = numpy.astype(data, np.float64, copy=False)
+        out = _text_numbers(data)
+        for mask, replacement in [
+            (numpy.isnan(data), self.nan_string),
+            (data == np.inf, self.posinf_string),
+            (data == -np.inf, self.neginf_string),
+        ]:
+            if numpy.any(mask):
+                if replacement is None:
+                    raise ValueError("Out of range float values are not JSON compliant")
+                # the last text is the replacement
+                texts = _text_stack(
+                    [
+                        out,
+                        _text_fixed(numpy.asarray([json.dumps(replacement).encode()])),
+                    ]
+                )
+                index = numpy.arange(len(data), dtype=np.int64)
+                index[mask] = len(data)
+                out = _text_take(texts, index)
+        return out
+
+    def _strings(self, data, offsets):
+        # Strings of printable ASCII characters other than '"' and '\\' are the
+        # same in JSON; the others (few, usually) are escaped by json.dumps
+        special = (data < 0x20) | (data >= 0x7F) | (data == 0x22) | (data == 0x5C)
+        numspecial = numpy.zeros(len(data) + 1, dtype=np.int64)
+        numpy.cumsum(special, maybe_out=numspecial[1:])
+        escaped = numpy.nonzero(numspecial[offsets[1:]] != numspecial[offsets[:-1]])[0]
+
+        out = _text_concatenate([b'"', (data, offsets), b'"'], len(offsets) - 1)
+        if len(escaped) == 0:
+            return out
+
+        texts = [
+            json.dumps(
+                data[offsets[i] : offsets[i + 1]]
+                .tobytes()
+                .decode(errors="surrogateescape")
+            ).encode()
+            for i in escaped
+        ]
+        index = numpy.arange(len(offsets) - 1, dtype=np.int64)
+        index[escaped] = numpy.arange(len(texts), dtype=np.int64) + len(index)
+        lengths = numpy.asarray([len(x) for x in texts], dtype=np.int64)
+        data = numpy.concat([out[0], numpy.frombuffer(b"".join(texts), dtype=np.uint8)])
+        offsets = numpy.concat([out[1], out[1][-1] + numpy.cumsum(lengths)])
+        return _text_take((data, offsets), index)
+
+
+# Each of the following returns (data, offsets) as described in _ColumnarWriter,
+# and the offsets of each of their text arguments start at 0.
+
+
+def _text_fixed(fixed):
+    """
+    Returns the texts of a NumPy array of bytes (which do not contain zeros).
+    """
+    chars = numpy.ascontiguousarray(fixed).view(np.uint8)
+    chars = chars.reshape(len(fixed), fixed.dtype.itemsize)
+    nonzero = chars != 0
+    offsets = numpy.zeros(len(fixed) + 1, dtype=np.int64)
+    numpy.cumsum(numpy.count_nonzero(nonzero, axis=1), maybe_out=offsets[1:])
+    return chars[nonzero], offsets
+
+
+def _text_integers(data):
+    """
+    Returns the texts of a one-dimensional NumPy array of integers.
+    """
+    negative = data < 0
+    # magnitudes, including that of the most negative int64
+    magnitude = numpy.astype(data, np.uint64)
+    magnitude[negative] = -magnitude[negative]
+    if len(data) != 0 and numpy.max(magnitude) < 2**32:
+        # division is faster with fewer bits
+        magnitude = numpy.astype(magnitude, np.uint32)
+    powers = numpy.asarray([10**i for i in range(1, 20)], dtype=np.uint64)
+    numdigits = numpy.searchsorted(powers, magnitude, side="right") + 1
+    width = (int(numpy.max(numdigits)) if len(data) != 0 else 1) + 1
+
+    # digits from the right, as rows
+    chars = numpy.empty((width, len(data)), dtype=np.uint8)
+    ten = magnitude.dtype.type(10)
+    for i in range(width - 1):
+        quotient = magnitude // ten
+        chars[width - 1 - i] = magnitude - quotient * ten
+        chars[width - 1 - i] += ord("0")
+        magnitude = quotient
+    chars = numpy.ascontiguousarray(chars.T)
+    lengths = numdigits + negative
+    chars[numpy.nonzero(negative)[0], width - lengths[negative]] = ord("-")
+
+    # the last 'lengths' characters of each row
+    pattern = numpy.zeros(2 * len(data), dtype=np.bool_)
+    pattern[1::2] = True
+    repeats = numpy.empty(2 * len(data), dtype=np.int64)
+    repeats[0::2] = width - lengths
+    repeats[1::2] = lengths
+    offsets = numpy.zeros(len(data) + 1, dtype=np.int64)
+    numpy.cumsum(lengths, maybe_out=offsets[1:])
+    return chars.reshape(-1)[numpy.repeat(pattern, repeats)], offsets
+
+
+def _text_numbers(data):
+    """
+    Returns the texts of a one-dimensional NumPy array of floating-point numbers,
+    formatted by Python (as `json.dumps` formats them).
+    """
+    if len(data) == 0:
+        return numpy.empty(0, dtype=np.uint8), numpy.zeros(1, dtype=np.int64)
+    # formatting the list is faster than NumPy's formatting, which is different
+    # for some numbers; it is "[x, y, z]"
+    chars = numpy.frombuffer(str(data.tolist()).encode(), dtype=np.uint8)[1:-1]
+    commas = numpy.nonzero(chars == ord(","))[0]
+    offsets = numpy.empty(len(data) + 1, dtype=np.int64)
+    offsets[0] = 0
+    offsets[1:-1] = commas - 2 * numpy.arange(len(commas), dtype=np.int64)
+    offsets[-1] = len(chars) - 2 * len(commas)
+    keep = numpy.ones(len(chars), dtype=np.bool_)
+    keep[commas] = False
+    keep[commas + 1] = False
+    return chars[keep], offsets
+
+
+def _text_expand(texts, valid, fill: bytes):
+    """
+    Returns the texts of each of `valid`: the next of `texts` where True and
+    `fill` where False.
+    """
+    lengths = numpy.full(len(valid), len(fill), dtype=np.int64)
+    lengths[valid] = texts[1][1:] - texts[1][:-1]
+    outoffsets = numpy.zeros(len(valid) + 1, dtype=np.int64)
+    numpy.cumsum(lengths, maybe_out=outoffsets[1:])
+    out = numpy.empty(outoffsets[-1], dtype=np.uint8)
+    _text_copy(out, outoffsets[:-1][valid], texts)
+    filled = outoffsets[:-1][~valid]
+    for i, byte in enumerate(fill):
+        out[filled + i] = byte
+    return out, outoffsets
+
+
+def _text_take(texts, index):
+    """
+    Returns the texts at `index`, in its order.
+    """
+    data, offsets = texts
+    starts = offsets[:-1][index]
+    lengths = offsets[1:][index] - starts
+    outoffsets = numpy.zeros(len(index) + 1, dtype=np.int64)
+    numpy.cumsum(lengths, maybe_out=outoffsets[1:])
+    positions = numpy.repeat(starts - outoffsets[:-1], lengths)
+    positions += numpy.arange(outoffsets[-1], dtype=np.int64)
+    return data[positions], outoffsets
+
+
+def _text_stack(texts):
+    """
+    Returns all of the texts of each of `texts`, one after another.
+    """
+    datas = [x[0][: x[1][-1]] for x in texts]
+    before = numpy.cumsum(numpy.asarray([0] + [len(x) for x in datas], dtype=np.int64))
+    offsets = [numpy.zeros(1, dtype=np.int64)]
+    offsets.extend(x[1][1:] + y for x, y in zip(texts, before))
+    return numpy.concat(datas), numpy.concat(offsets)
+
+
+def _text_concatenate(pieces, length):
+    """
+    Returns the concatenation of `pieces` for each of `length` elements, in which
+    each piece is a bytes constant or texts of `length` elements.
+    """
+    lengths = numpy.zeros(length, dtype=np.int64)
+    for piece in pieces:
+        if isinstance(piece, bytes):
+            lengths += len(piece)
+        else:
+            lengths += piece[1][1:] - piece[1][:-1]
+    outoffsets = numpy.zeros(length + 1, dtype=np.int64)
+    numpy.cumsum(lengths, maybe_out=outoffsets[1:])
+    out = numpy.empty(outoffsets[-1], dtype=np.uint8)
+
+    cursor = outoffsets[:-1].copy()
+    for piece in pieces:
+        if isinstance(piece, bytes):
+            for i, byte in enumerate(piece):
+                out[cursor + i] = byte
+            cursor += len(piece)
+        else:
+            _text_copy(out, cursor, piece)
+            cursor += piece[1][1:] - piece[1][:-1]
+    return out, outoffsets
+
+
+def _text_join(texts, offsets, opener: bytes, separator: bytes, closer: bytes):
+    """
+    Returns the text of each list of `texts` given by `offsets` (which start at
+    0 and end at the number of `texts`): its texts separated by `separator`,
+    between `opener` and `closer`.
+    """
+    lengths = texts[1][1:] - texts[1][:-1]
+    counts = offsets[1:] - offsets[:-1]
+    # position of each text in its list, without the opener
+    within = numpy.zeros(len(lengths) + 1, dtype=np.int64)
+    numpy.cumsum(lengths + len(separator), maybe_out=within[1:])
+    outoffsets = numpy.zeros(len(counts) + 1, dtype=np.int64)
+    numpy.cumsum(
+        len(opener)
+        + within[offsets[1:]]
+        - within[offsets[:-1]]
+        - len(separator) * (counts > 0)
+        + len(closer),
+        maybe_out=outoffsets[1:],
+    )
+    out = numpy.empty(outoffsets[-1], dtype=np.uint8)
+
+    parents = numpy.repeat(numpy.arange(len(counts), dtype=np.int64), counts)
+    starts = (outoffsets[:-1] + len(opener) - within[offsets[:-1]])[parents]
+    starts += within[:-1]
+    _text_copy(out, starts, texts)
+
+    # each text but the last in its list is followed by a separator
+    notlast = numpy.arange(1, len(lengths) + 1) < offsets[1:][parents]
+    ends = (starts + lengths)[notlast]
+    for i, byte in enumerate(separator):
+        out[ends + i] = byte
+    for i, byte in enumerate(opener):
+        out[outoffsets[:-1] + i] = byte
+    for i, byte in enumerate(closer):
+        out[outoffsets[1:] - len(closer) + i] = byte
+    return out, outoffsets
+
+
+def _text_copy(out, starts, texts):
+    # Copies each of `texts` into `out` at `starts`, which are increasing (so
+    # the texts are in the same order in `out`)
+    data, offsets = texts
+    lengths = offsets[1:] - offsets[:-1]
+    # alternating gaps (False) and texts (True) cover all of `out`
+    pattern = numpy.zeros(2 * len(lengths) + 1, dtype=np.bool_)
+    pattern[1::2] = True
+    repeats = numpy.empty(2 * len(lengths) + 1, dtype=np.int64)
+    repeats[1::2] = lengths
+    repeats[0:-1:2] = starts
+    repeats[2:-1:2] -= starts[:-1] + lengths[:-1]
+    repeats[-1] = len(out) - (starts[-1] + lengths[-1] if len(lengths) else 0)
+    out[numpy.repeat(pattern, repeats)] = data[: offsets[-1]]
@@ -0,0 +1,150 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import awkward as ak
+from awkward._dispatch import high_level_function
+from awkward._nplikes.numpy_like import NumpyMetadata
+
+__all__ = ("to_shared_memory",)
+
+np = NumpyMetadata.instance()
+
+
+@high_level_function()
+def to_shared_memory(array):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+
+    Copies all of the buffers of an array (as #ak.to_buffers, after #ak.to_packed)
+    into a block of shared memory and returns a small, picklable
+    #ak.operations.ak_to_shared_memory.SharedMemoryHandle that other processes
+    can pass to #ak.from_shared_memory to view the array without copying or
+    deserializing it.
+
+    For example, to fan out work to a process pool,
+
+        >>> def analyze(handle):
+        ...     array = ak.from_shared_memory(handle)
+        ...     return ak.sum(array.x)
+        ...
+        >>> with ak.to_shared_memory(array) as handle:
+        ...     with concurrent.futures.ProcessPoolExecutor() as pool:
+        ...         results = list(pool.map(analyze, [handle] * 10))
+
+    Only the handle (the Form, the length, the name of the block, and the positions
+    of the buffers in it) is pickled and sent to each task. The buffers are aligned
+    to 64 bytes within the block.
+
+    The block belongs to the process that called this function: it must be released
+    with `handle.close()` and `handle.unlink()` (or by leaving the `with` block)
+    when no process needs it any more. Arrays made by #ak.from_shared_memory in
+    other processes can outlive the unlinking: the operating system frees the
+    memory when the last of them is deleted.
+
+    See also #ak.from_shared_memory, #ak.to_buffers.
+    """
+    # Dispatch
+    yield (array,)
+
+    # Implementation
+    return _impl(array)
+
+
+class SharedMemoryHandle:
+    """
+    The name, size, and contents (Form, length, and buffer positions) of a block
+    of shared memory made by #ak.to_shared_memory. Only these are pickled, so
+    handles are cheap to send to other processes.
+
+    Handles made by #ak.to_shared_memory also own the block, which they release
+    with #close and #unlink, or when used as a context manager.
+    """
+
+    def __init__(self, name, size, form, length, buffers, block=None):
+        self.name = name
+        self.size = size
+        self.form = form
+        self.length = length
+        self.buffers = buffers
+        self._block = block
+
+    def __getstate__(self):
+        return {
+            "name": self.name,
+            "size": self.size,
+            "form": self.form,
+            "length": self.length,
+            "buffers": self.buffers,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __repr__(self):
+        return f"<SharedMemoryHandle {self.name!r} ({self.size} bytes)>"
+
+    def close(self):
+        """
+        Closes this process's access to the block (if this handle owns it).
+        """
+        if self._block is not None:
+            self._block.close()
+
+    def unlink(self):
+        """
+        Requests that the block be destroyed (if this handle owns it). The memory
+        is released when no process has it open or mapped.
+        """
+        if self._block is not None:
+            if sys.version_info < (3, 13) and os.name != "nt":
+                # A reader that shares this process's resource tracker may have
+                # unregistered the block (see ak.from_shared_memory), and
+                # unlinking unregisters it again
+                resource_tracker.register(f"/{self._block.name}", "shared_memory")
+            self._block.unlink()
+            self._block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        self.unlink()
+
+
+def _impl(array):
+    packed = ak.operations.ak_to_packed._impl(array, False, None, None)
+    # Buffers in the native byteorder are used by ak.from_buffers as they are
+    form, length, container = ak.operations.ak_to_buffers._impl(
+        packed,
+        None,
+        "{form_key}-{attribute}",
+        "node{id}",
+        0,
+        "cpu",
+        ak._util.native_byteorder,
+    )
+
+    aligned = ak.operations.ak_to_buffers_file._aligned
+    views = {key: memoryview(buffer).cast("B") for key, buffer in container.items()}
+    buffers = {}
+    size = 0
+    for key, view in views.items():
+        buffers[key] = (size, view.nbytes)
+        size = aligned(size + view.nbytes)
+
+    # Blocks of zero bytes are not allowed
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for key, view in views.items():
+        offset, nbytes = buffers[key]
+        block.buf[offset : offset + nbytes] = view
+
+    return SharedMemoryHandle(
+        block.name, size, form.to_dict(), length, buffers, block=block
+    )
@@ -0,0 +1,163 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import awkward as ak
+from awkward._backends.numpy import NumpyBackend
+from awkward._dispatch import high_level_function
+from awkward._layout import HighLevelContext, maybe_posaxis
+from awkward._namedaxis import (
+    _get_named_axis,
+    _named_axis_to_positional_axis,
+)
+from awkward._nplikes.numpy_like import NumpyMetadata
+from awkward._nplikes.shape import unknown_length
+from awkward._regularize import is_integer, regularize_axis
+from awkward.errors import AxisError
+
+__all__ = ("top_k",)
+
+np = NumpyMetadata.instance()
+
+cpu = NumpyBackend.instance()
+
+
+@high_level_function()
+def top_k(
+    array,
+    k,
+    axis=-1,
+    *,
+    ascending=False,
+    pad=False,
+    highlevel=True,
+    behavior=None,
+    attrs=None,
+):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        k (int): The number of values to select from each list.
+        axis (int): The dimension at which this operation is applied. The
+            outermost dimension is `0`, followed by `1`, etc., and negative
+            values count backward from the innermost: `-1` is the innermost
+            dimension, `-2` is the next level up, etc.
+        ascending (bool): If True, select the `k` smallest values of each list;
+            if False, select the `k` largest.
+        pad (bool): If True, lists with fewer than `k` values are padded with
+            None, so that the output lists have regular lengths of exactly `k`
+            (as with #ak.pad_none and `clip=True`); otherwise, each output list
+            has at most `k` values.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.contents.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+        attrs (None or dict): Custom attributes for the output array, if
+            high-level.
+
+    Returns the `k` largest (or, if `ascending`, smallest) values of each list,
+    in order. This is the same as
+
+        ak.sort(array, axis=axis, ascending=ascending, stable=True)[..., :k]
+
+    (in which `...` stands for the dimensions up to `axis`), including the
+    position of NaN, which is first in both directions.
+
+    For example,
+
+        >>> array = ak.Array([[7.7, 5.5, 9.9, 1.1], [], [2.2], [8.8, 2.2]])
+        >>> ak.top_k(array, 2)
+        <Array [[9.9, 7.7], [], [2.2], [8.8, 2.2]] type='4 * var * float64'>
+        >>> ak.top_k(array, 2, ascending=True, pad=True)
+        <Array [[1.1, 5.5], [None, None], ..., [2.2, 8.8]] type='4 * 2 * ?float64'>
+
+    Lists of numbers that are long compared with `k` are not sorted: the `k`-th
+    value of each list is found by a partial selection and only the values
+    before it are sorted. Short lists are sorted, as in #ak.sort.
+
+    See also #ak.argtop_k.
+    """
+    # Dispatch
+    yield (array,)
+
+    # Implementation
+    return _impl(array, k, axis, ascending, pad, False, highlevel, behavior, attrs)
+
+
+def _impl(array, k, axis, ascending, pad, argtop, highlevel, behavior, attrs):
+    if not (is_integer(k) and k >= 0):
+        raise ValueError(f"'k' must be a non-negative integer, not {k!r}")
+    k = int(k)
+
+    with HighLevelContext(behavior=behavior, attrs=attrs) as ctx:
+        layout = ctx.unwrap(array, allow_record=False, primitive_policy="error")
+
+    # Handle named axis
+    named_axis = _get_named_axis(ctx)
+    # Step 1: Normalize named axis to positional axis
+    axis = _named_axis_to_positional_axis(named_axis, axis)
+
+    axis = regularize_axis(axis, none_allowed=False)
+
+    if maybe_posaxis(layout, axis, 1) == 0:
+        if layout.length is unknown_length:
+            out = _first_of_sorted(layout, 0, k, ascending, argtop)
+        else:
+            # One list of all of the values
+            out = _top_k_lists(
+                ak.contents.RegularArray(layout, layout.length, 1), k, ascending, argtop
+            )[0]
+
+    else:
+
+        def action(layout, depth, **kwargs):
+            posaxis = maybe_posaxis(layout, axis, depth)
+            if posaxis == depth and layout.is_list:
+                return _top_k_lists(layout, k, ascending, argtop)
+
+            elif layout.is_leaf:
+                raise AxisError(
+                    f"axis={axis} exceeds the depth of this array ({depth})"
+                )
+
+        out = ak._do.recursively_apply(layout, action, numpy_to_regular=True)
+
+    if pad:
+        out = ak._do.pad_none(out, k, axis, clip=True)
+
+    return ctx.wrap(out, highlevel=highlevel)
+
+
+def _top_k_lists(layout, k, ascending, argtop):
+    # The first `k` values (or their indexes) in each of the lists of `layout`
+    content = layout.content
+    if (
+        layout.backend is cpu
+        and isinstance(content, ak.contents.NumpyArray)
+        and content.data.ndim == 1
+        and ak._nplikes.numpy_sorting.is_top_k_selectable(content.dtype)
+        # For short lists, the kernels' sort is faster than a selection
+        and content.length > (4 * k + 8) * layout.length
+    ):
+        starts = layout.starts.data
+        offsets, positions = ak._nplikes.numpy_sorting.top_k_argsort(
+            content.data, starts, layout.stops.data, k, ascending
+        )
+        if argtop:
+            outcontent = ak.contents.NumpyArray(positions)
+        else:
+            positions += cpu.index_nplike.repeat(starts, offsets[1:] - offsets[:-1])
+            outcontent = ak.contents.NumpyArray(content.data[positions])
+        return ak.contents.ListOffsetArray(
+            ak.index.Index64(offsets), outcontent, parameters=layout._parameters
+        )
+    else:
+        return _first_of_sorted(layout, 1, k, ascending, argtop)
+
+
+def _first_of_sorted(layout, axis, k, ascending, argtop):
+    if argtop:
+        out = ak._do.argsort(layout, axis, ascending, True)
+    else:
+        out = ak._do.sort(layout, axis, ascending, True)
+    return out[(slice(None),) * axis + (slice(None, k),)]
@@ -0,0 +1,116 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+import threading
+
+import numpy as np
+import pytest
+
+import awkward as ak
+from awkward._nplikes.virtual import VirtualArray
+from awkward.operations import ak_from_parquet
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("fsspec")
+
+array = ak.Array(
+    [
+        {"x": 1, "y": [1.1, None], "jets": [{"pt": 1.0, "eta": 2.0}], "s": "hi"},
+        {"x": 2, "y": [], "jets": [], "s": "there"},
+        {
+            "x": None,
+            "y": [3.3],
+            "jets": [{"pt": 3.0, "eta": None}, {"pt": 4.0, "eta": 5.0}],
+            "s": None,
+        },
+    ]
+)
+
+
+@pytest.fixture
+def read_columns(monkeypatch):
+    read = []
+    original = ak_from_parquet._load
+
+    def spy(actual_paths, parquet_columns, *args, **kwargs):
+        read.append(parquet_columns)
+        return original(actual_paths, parquet_columns, *args, **kwargs)
+
+    monkeypatch.setattr(ak_from_parquet, "_load", spy)
+    return read
+
+
+@pytest.mark.parametrize("columns", [None, ["x", "s"], ["y"], ["jets.pt"]])
+def test_same_as_eager(tmp_path, columns):
+    ak.to_parquet(array, os.path.join(tmp_path, "one.parquet"))
+    ak.to_parquet(array[1:], os.path.join(tmp_path, "two.parquet"))
+
+    for path in ["one.parquet", "*.parquet"]:
+        eager = ak.from_parquet(os.path.join(tmp_path, path), columns=columns)
+        lazy = ak.from_parquet(os.path.join(tmp_path, path), columns=columns, lazy=True)
+        assert len(lazy) == len(eager)
+        assert lazy.to_list() == eager.to_list()
+
+
+def test_not_records(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+
+    ak.to_parquet(ak.Array([[1, 2, None], [], [3]]), filename)
+    lazy = ak.from_parquet(filename, lazy=True)
+    assert str(lazy.type) == "3 * var * ?int64"
+    assert lazy.to_list() == [[1, 2, None], [], [3]]
+
+    ak.to_parquet(ak.Array([1.5, 2.5]), filename)
+    lazy = ak.from_parquet(filename, lazy=True)
+    assert isinstance(lazy.layout.data, VirtualArray)
+    assert not lazy.layout.data.is_materialized
+    assert lazy.to_list() == [1.5, 2.5]
+
+
+def test_reads_only_what_is_used(tmp_path, read_columns):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    ak.to_parquet(array, filename)
+
+    lazy = ak.from_parquet(filename, lazy=True)
+    # the length of the list of records (jets) comes from its first column
+    assert read_columns == [["jets.list.item.pt"]]
+
+    assert ak.sum(lazy.x) == 3
+    assert read_columns[1:] == [["x"]]
+
+    assert ak.sum(lazy.y, axis=-1).to_list() == pytest.approx([1.1, 0.0, 3.3])
+    assert read_columns[2:] == [["y.list.item"]]
+
+    assert np.asarray(ak.flatten(lazy.jets.pt)).tolist() == [1.0, 3.0, 4.0]
+    assert len(read_columns) == 3
+
+    assert lazy.to_list() == array.to_list()
+    assert sorted(read_columns[3:]) == [["jets.list.item.eta"], ["s"]]
+
+
+def test_threads(tmp_path, read_columns):
+    big = ak.Array({"x": np.arange(100_000), "y": ak.unflatten(np.arange(300_000), 3)})
+    ak.to_parquet(big, os.path.join(tmp_path, "big.parquet"), row_group_size=10_000)
+    path = os.path.join(tmp_path, "big.parquet")
+
+    # several threads touch the same lazy buffers for the first time at once
+    lazy = ak.from_parquet(path, lazy=True)
+    barrier = threading.Barrier(4)
+
+    def total(_):
+        barrier.wait()
+        return ak.sum(lazy.x), ak.sum(lazy.y)
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(total, range(4)))
+    assert results == [(ak.sum(big.x), ak.sum(big.y))] * 4
+    assert sorted(read_columns) == [["x"], ["y.list.item"]]
+
+    lazy = ak.from_parquet(path, lazy=True)
+    sums = ak.map_partitions(
+        lambda part: ak.sum(part.y, axis=1), lazy, npartitions=8, max_workers=4
+    )
+    assert sums.to_list() == ak.sum(big.y, axis=1).to_list()
@@ -0,0 +1,78 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import awkward as ak
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("fsspec")
+
+array = ak.Array([{"x": i, "y": list(range(i % 4))} for i in range(100)])
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    ak.to_parquet(array, os.path.join(tmp_path, "a.parquet"), row_group_size=30)
+    ak.to_parquet(array[:45], os.path.join(tmp_path, "b.parquet"), row_group_size=20)
+    return os.path.join(tmp_path, "*.parquet")
+
+
+@pytest.mark.parametrize("read_ahead", [0, 1, 3])
+def test_row_groups(dataset, read_ahead):
+    pieces = list(ak.from_parquet_iter(dataset, read_ahead=read_ahead))
+    assert [len(x) for x in pieces] == [30, 30, 30, 10, 20, 20, 5]
+    assert ak.concatenate(pieces).to_list() == ak.from_parquet(dataset).to_list()
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+@pytest.mark.parametrize("step_size", [7, 100, 1000])
+def test_step_size(dataset, read_ahead, step_size):
+    pieces = list(
+        ak.from_parquet_iter(dataset, step_size=step_size, read_ahead=read_ahead)
+    )
+    assert all(len(x) == step_size for x in pieces[:-1])
+    assert 0 < len(pieces[-1]) <= step_size
+    assert ak.concatenate(pieces).to_list() == ak.from_parquet(dataset).to_list()
+
+
+def test_columns_and_row_groups(dataset):
+    pieces = list(ak.from_parquet_iter(dataset, columns=["y"], row_groups={1, 2, 4}))
+    assert [len(x) for x in pieces] == [30, 30, 20]
+    assert (
+        ak.concatenate(pieces).to_list()
+        == ak.from_parquet(dataset, columns=["y"], row_groups={1, 2, 4}).to_list()
+    )
+
+
+def test_early_exit(dataset):
+    with ak.from_parquet_iter(dataset, read_ahead=2) as pieces:
+        for piece in pieces:
+            assert piece.x.to_list() == list(range(30))
+            break
+
+    with pytest.raises(StopIteration):
+        next(pieces)
+
+
+def test_bad_arguments(dataset):
+    with pytest.raises(ValueError, match="step_size"):
+        ak.from_parquet_iter(dataset, step_size=0)
+    with pytest.raises(ValueError, match="read_ahead"):
+        ak.from_parquet_iter(dataset, read_ahead=-1)
+
+
+def test_overlapping_file_names(tmp_path):
+    # each name ends the names after it, and the nested file has the same name
+    for name, length in [("a", 100), ("ba", 20), ("cba", 50), ("d/a", 30)]:
+        os.makedirs(os.path.dirname(os.path.join(tmp_path, name)), exist_ok=True)
+        ak.to_parquet(
+            array[:length], os.path.join(tmp_path, f"{name}.parquet"), row_group_size=10
+        )
+    expected = ak.from_parquet(str(tmp_path))
+    pieces = list(ak.from_parquet_iter(str(tmp_path)))
+    assert sum(len(x) for x in pieces) == len(expected) == 200
+    assert ak.concatenate(pieces).to_list() == expected.to_list()
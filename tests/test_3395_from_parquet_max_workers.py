@@ -0,0 +1,108 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import awkward as ak
+from awkward.operations import ak_from_parquet
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("fsspec")
+
+array = ak.Array(
+    [{"x": i, "y": list(range(i % 4)), "z": None if i % 3 else 1.5} for i in range(100)]
+)
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    for i in range(5):
+        ak.to_parquet(
+            array[i * 7 :], os.path.join(tmp_path, f"f{i}.parquet"), row_group_size=13
+        )
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("row_groups", [None, {1, 2, 9}])
+def test_same_as_sequential(dataset, lazy, row_groups):
+    expected = ak.from_parquet(dataset, row_groups=row_groups).to_list()
+    for max_workers in [1, 2, 8]:
+        result = ak.from_parquet(
+            dataset, row_groups=row_groups, max_workers=max_workers, lazy=lazy
+        )
+        assert result.to_list() == expected
+
+
+def test_split_into_row_groups(dataset, monkeypatch):
+    read = []
+    original = ak_from_parquet._read_parquet_file
+
+    def spy(path, **kwargs):
+        read.append((os.path.basename(path), kwargs["row_groups"]))
+        return original(path, **kwargs)
+
+    monkeypatch.setattr(ak_from_parquet, "_read_parquet_file", spy)
+
+    ak.from_parquet(dataset, max_workers=4)
+    num_row_groups = ak.metadata_from_parquet(dataset)["num_row_groups"]
+    assert len(read) == num_row_groups
+    assert sorted(read) == [
+        (f"f{i}.parquet", [j]) for i in range(5) for j in range(-(-(100 - i * 7) // 13))
+    ]
+
+
+def test_bad_max_workers(dataset):
+    with pytest.raises(ValueError, match="max_workers"):
+        ak.from_parquet(dataset, max_workers=0)
+
+
+@pytest.fixture
+def overlapping(tmp_path):
+    # each name ends the names after it, and the nested files have the same names
+    for name, length in [("a", 100), ("ba", 20), ("cba", 50)]:
+        ak.to_parquet(
+            array[:length], os.path.join(tmp_path, f"{name}.parquet"), row_group_size=10
+        )
+    for directory, length in [("d1", 30), ("d2", 40)]:
+        os.mkdir(os.path.join(tmp_path, directory))
+        ak.to_parquet(
+            array[:length],
+            os.path.join(tmp_path, directory, "a.parquet"),
+            row_group_size=10,
+        )
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_overlapping_file_names(overlapping, lazy):
+    expected = ak.from_parquet(overlapping)
+    assert len(expected) == 240
+    for row_groups in [None, {0, 10, 12, 17, 21}]:
+        expected = ak.from_parquet(overlapping, row_groups=row_groups).to_list()
+        result = ak.from_parquet(
+            overlapping, row_groups=row_groups, max_workers=4, lazy=lazy
+        )
+        assert len(result) == len(expected)
+        assert result.to_list() == expected
+
+
+def test_metadata_file(tmp_path):
+    # the _metadata file refers to each file by its path
+    numbers = ak.Array({"x": list(range(100))})
+    for name in ["a", "ba", os.path.join("d", "a")]:
+        os.makedirs(os.path.dirname(os.path.join(tmp_path, name)), exist_ok=True)
+        ak.to_parquet(
+            numbers[: 10 * len(name)],
+            os.path.join(tmp_path, f"{name}.parquet"),
+            row_group_size=7,
+        )
+    ak.to_parquet_dataset(tmp_path)
+    result = ak.from_parquet(str(tmp_path), max_workers=4)
+    assert sorted(result.x.to_list()) == sorted(
+        list(range(10)) + list(range(20)) + list(range(30))
+    )
+    assert result.to_list() == ak.from_parquet(str(tmp_path)).to_list()
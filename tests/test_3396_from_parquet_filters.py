@@ -0,0 +1,110 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import awkward as ak
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("fsspec")
+
+array = ak.Array(
+    [
+        {
+            "met": float(i),
+            "n": i if i < 50 else None,
+            "s": str(i),
+            "r": {"a": i},
+            "j": [i],
+        }
+        for i in range(100)
+    ]
+)
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    # row groups: 0-29, 30-59, 60-89, 90-99 and 99-70, 69-40, 39-10, 9-0
+    ak.to_parquet(array, os.path.join(tmp_path, "a.parquet"), row_group_size=30)
+    ak.to_parquet(array[::-1], os.path.join(tmp_path, "b.parquet"), row_group_size=30)
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize(
+    ("filters", "length"),
+    [
+        (("met", ">", 50), 130),
+        (("met", ">=", 99), 40),
+        ([("met", ">", 50), ("met", "<", 65)], 90),
+        ([[("met", "<", 5)], [("met", ">", 95)]], 80),
+        (("met", "==", 30), 60),
+        (("met", "!=", 30), 200),
+        (("r.a", "in", [0, 99]), 80),
+        (("r.a", "not in", [0, 99]), 200),
+        (("s", "==", "7"), 70),
+        (("n", ">=", 60), 0),
+        (("met", ">", 1000), 0),
+    ],
+)
+def test_row_groups_skipped(dataset, filters, length):
+    result = ak.from_parquet(dataset, filters=filters)
+    assert len(result) == length
+    assert result.fields == ["met", "n", "s", "r", "j"]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_nothing_passes(dataset, lazy, max_workers):
+    result = ak.from_parquet(
+        dataset, filters=("met", ">", 1000), lazy=lazy, max_workers=max_workers
+    )
+    assert len(result) == 0
+    assert result.fields == ["met", "n", "s", "r", "j"]
+    assert result.to_list() == []
+
+
+def test_rows_that_pass_are_kept(dataset):
+    result = ak.from_parquet(dataset, filters=[("met", ">", 50), ("met", "<", 65)])
+    cut = (result.met > 50) & (result.met < 65)
+    assert sorted(result.met[cut].to_list()) == sorted(
+        [float(i) for i in range(51, 65)] * 2
+    )
+
+
+def test_with_row_groups(dataset):
+    result = ak.from_parquet(dataset, row_groups={0, 1, 4}, filters=("met", ">", 50))
+    assert result.met.to_list() == [float(i) for i in range(30, 60)] + [
+        float(i) for i in range(99, 69, -1)
+    ]
+
+
+def test_lazy_and_iter(dataset):
+    eager = ak.from_parquet(dataset, filters=("met", "<", 20))
+    lazy = ak.from_parquet(dataset, filters=("met", "<", 20), lazy=True)
+    assert lazy.to_list() == eager.to_list()
+
+    pieces = list(ak.from_parquet_iter(dataset, filters=("met", "<", 20)))
+    assert [len(x) for x in pieces] == [30, 30, 10]
+    assert ak.concatenate(pieces).to_list() == eager.to_list()
+
+
+def test_bad_filters(dataset):
+    with pytest.raises(ValueError, match="not in lists"):
+        ak.from_parquet(dataset, filters=("j", ">", 3))
+    with pytest.raises(ValueError, match="operator"):
+        ak.from_parquet(dataset, filters=("met", "~", 3))
+    with pytest.raises(TypeError, match="tuples"):
+        ak.from_parquet(dataset, filters=[["met > 3"]])
+
+
+def test_overlapping_file_names(tmp_path):
+    # the statistics of b.parquet must not be used for ab.parquet
+    ak.to_parquet(array, os.path.join(tmp_path, "ab.parquet"), row_group_size=30)
+    ak.to_parquet(array[::-1], os.path.join(tmp_path, "b.parquet"), row_group_size=30)
+    result = ak.from_parquet(str(tmp_path), filters=("met", ">=", 90))
+    assert sorted(result.met.to_list()) == sorted(
+        [float(i) for i in range(90, 100)] + [float(i) for i in range(70, 100)]
+    )
@@ -0,0 +1,72 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import io
+import os
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+array = ak.Array(
+    [
+        {"x": [1.1, 2.2], "y": None, "s": "hi", "z": (1, 2.5)},
+        {"x": [], "y": 3, "s": "there", "z": (2, 3.5)},
+        {"x": [3.3], "y": 4, "s": "", "z": (3, 4.5)},
+    ]
+    * 5
+)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("byteorder", ["<", ">"])
+def test_round_trip(tmp_path, mmap, byteorder):
+    filename = os.path.join(tmp_path, "array.akb")
+    ak.to_buffers_file(array, filename, byteorder=byteorder)
+    result = ak.from_buffers_file(filename, mmap=mmap)
+    assert result.type == array.type
+    assert result.to_list() == array.to_list()
+
+
+def test_sliced_and_empty(tmp_path):
+    filename = os.path.join(tmp_path, "array.akb")
+
+    ak.to_buffers_file(array[7:9], filename)
+    assert ak.from_buffers_file(filename).to_list() == array[7:9].to_list()
+    # only the used part of the buffers is written
+    assert os.path.getsize(filename) < 4096
+
+    ak.to_buffers_file(array[:0], filename)
+    assert ak.from_buffers_file(filename).to_list() == []
+
+
+def test_zero_copy(tmp_path):
+    filename = os.path.join(tmp_path, "array.akb")
+    ak.to_buffers_file(ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]]), filename)
+
+    layout = ak.from_buffers_file(filename, highlevel=False)
+    data = layout.content.data
+    assert isinstance(data.base, memoryview)
+    assert not data.flags.writeable
+    assert data.ctypes.data % 64 == layout.offsets.data.ctypes.data % 64 == 0
+    assert np.asarray(data).tolist() == [1.1, 2.2, 3.3, 4.4, 5.5]
+
+
+def test_file_like(tmp_path):
+    file = io.BytesIO()
+    ak.to_buffers_file(array, file)
+
+    filename = os.path.join(tmp_path, "array.akb")
+    with open(filename, "wb") as f:
+        f.write(file.getvalue())
+    assert ak.from_buffers_file(filename).to_list() == array.to_list()
+
+
+def test_not_a_buffers_file(tmp_path):
+    filename = os.path.join(tmp_path, "array.akb")
+    with open(filename, "wb") as f:
+        f.write(b"PAR1" + b"\x00" * 100)
+    with pytest.raises(ValueError, match="to_buffers_file"):
+        ak.from_buffers_file(filename)
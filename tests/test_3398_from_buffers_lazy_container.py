@@ -0,0 +1,118 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+import awkward as ak
+from awkward._nplikes.virtual import LRUBufferCache, VirtualArray
+
+original = ak.Array(
+    {
+        "x": np.arange(1000, dtype=np.float64),
+        "y": [[1, 2, 3]] * 1000,
+        "z": np.ones(1000),
+        "w": [None if i % 7 == 0 else {"a": [i]} for i in range(1000)],
+    }
+)
+form, length, container = ak.to_buffers(original)
+
+
+class Loader:
+    def __init__(self):
+        self.calls = []
+
+    def __getitem__(self, key):
+        def load():
+            self.calls.append(key)
+            return container[key]
+
+        return load
+
+
+def test_callables():
+    loader = Loader()
+    array = ak.from_buffers(form, length, loader)
+    assert isinstance(array.layout.content("x").data, VirtualArray)
+    # only the buffers that determine the lengths of nested nodes
+    at_construction = sorted(loader.calls)
+    assert all(
+        not key.startswith(("node1-", "node2-", "node4-")) for key in at_construction
+    )
+
+    assert ak.sum(array.x) == 499500
+    assert sorted(loader.calls) == sorted([*at_construction, "node1-data"])
+
+    assert ak.sum(array.x) == 499500
+    assert loader.calls.count("node1-data") == 1
+
+    assert array.to_list() == original.to_list()
+    assert pickle.loads(pickle.dumps(array)).to_list() == original.to_list()
+
+
+def test_plain_dict_of_callables():
+    array = ak.from_buffers(
+        form, length, {key: (lambda v=v: v) for key, v in container.items()}
+    )
+    assert ak.sum(array.y, axis=1).to_list() == [6] * 1000
+    assert array.w[7:9].to_list() == [None, {"a": [8]}]
+
+
+def test_bounded_cache():
+    loader = Loader()
+    array = ak.from_buffers(form, length, loader, cache=10_000)
+
+    assert ak.sum(array.x) == 499500
+    assert ak.sum(array.z) == 1000
+    # x (8000 bytes) was evicted by z (8000 bytes), so it is loaded again
+    assert ak.sum(array.x) == 499500
+    assert loader.calls.count("node1-data") == 2
+    assert loader.calls.count("node4-data") == 1
+
+    assert array.to_list() == original.to_list()
+
+
+def test_shared_cache():
+    cache = LRUBufferCache(1_000_000)
+    loader = Loader()
+
+    first = ak.from_buffers(form, length, loader, cache=cache)
+    assert ak.sum(first.x) == 499500
+    assert "node1-data" in cache
+
+    second = ak.from_buffers(form, length, loader, cache=cache)
+    assert ak.sum(second.x) == 499500
+    assert loader.calls.count("node1-data") == 1
+
+
+def test_lru_buffer_cache():
+    cache = LRUBufferCache(100)
+    cache["a"] = np.zeros(5)
+    cache["b"] = np.zeros(5)
+    assert list(cache) == ["a", "b"]
+    assert cache.nbytes == 80
+
+    cache["a"]
+    cache["c"] = np.zeros(5)
+    assert list(cache) == ["a", "c"]
+    assert cache.nbytes == 80
+
+    cache["d"] = np.zeros(100)
+    assert list(cache) == ["d"]
+
+    del cache["d"]
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_wrong_buffer():
+    array = ak.from_buffers(
+        form,
+        length,
+        {**container, "node1-data": lambda: np.arange(10, dtype=np.float64)},
+    )
+    with pytest.raises(TypeError, match="size of array"):
+        ak.sum(array.x)
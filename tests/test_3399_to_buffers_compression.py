@@ -0,0 +1,105 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import os
+import pickle
+import zlib
+
+import numpy as np
+import pytest
+
+import awkward as ak
+from awkward._codecs import _magic, decode, encode, get_codec
+
+array = ak.Array(
+    {
+        "x": np.arange(10000) * 1.5,
+        "y": [[1, 2, 3], [], [4]] * 3333 + [[5]],
+        "s": ["hello", "", "there"] * 3333 + ["!"],
+        "o": [None, 1] * 5000,
+        "b": [True, False] * 5000,
+    }
+)
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma", "bz2"])
+@pytest.mark.parametrize("byteorder", ["<", ">"])
+def test_round_trip(codec, byteorder):
+    form, length, container = ak.to_buffers(
+        array, compression=codec, byteorder=byteorder
+    )
+    assert all(isinstance(x, bytes) for x in container.values())
+
+    result = ak.from_buffers(
+        form, length, container, byteorder=byteorder, compression=codec
+    )
+    assert result.to_list() == array.to_list()
+
+
+def test_smaller():
+    _, _, raw = ak.to_buffers(array)
+    _, _, compressed = ak.to_buffers(array, compression="zlib", compression_level=9)
+    assert sum(len(x) for x in compressed.values()) * 20 < sum(
+        x.nbytes for x in raw.values()
+    )
+
+    # offsets are delta-encoded and shuffled before compression
+    assert len(compressed["node2-offsets"]) * 10 < len(
+        zlib.compress(raw["node2-offsets"].tobytes(), 9)
+    )
+
+
+def test_lazy_and_file(tmp_path):
+    form, length, container = ak.to_buffers(array, compression="zlib")
+    lazy = ak.from_buffers(
+        form,
+        length,
+        {key: (lambda v=v: v) for key, v in container.items()},
+        compression="zlib",
+    )
+    assert lazy.to_list() == array.to_list()
+
+    filename = os.path.join(tmp_path, "array.akb")
+    ak.to_buffers_file(array, filename, compression="lzma")
+    assert ak.from_buffers_file(filename).to_list() == array.to_list()
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([], dtype=np.int64),
+        np.array([5], dtype=np.int32),
+        np.array([0, 3, 3, 10], dtype=np.int64),
+        np.array([-(2**63), 0, 2**63 - 1], dtype=np.int64),
+        np.array([0, 2**64 - 1], dtype=np.uint64),
+        np.array([3, 1, 2], dtype=np.int16),
+        np.array([1.5, np.nan, -np.inf], dtype=">f8"),
+        np.array([1, 2, 3], dtype=np.uint8),
+    ],
+)
+def test_encode_decode(values):
+    encoded = encode(values, get_codec("zlib"))
+    decoded = np.frombuffer(decode(encoded, get_codec("zlib")), dtype=values.dtype)
+    assert decoded.tobytes() == values.tobytes()
+
+
+def test_not_encoded():
+    # uncompressed data that happen to start like a compressed buffer
+    values = np.frombuffer(_magic + b"\x01\x02\x03", dtype=np.uint8)
+    like_encoded = ak.Array(ak.contents.NumpyArray(values))
+    assert ak.from_buffers(*ak.to_buffers(like_encoded)).to_list() == values.tolist()
+    assert pickle.loads(pickle.dumps(like_encoded)).to_list() == values.tolist()
+
+    form, length, container = ak.to_buffers(np.arange(10, dtype=np.uint8))
+    with pytest.raises(ValueError, match="not compressed"):
+        ak.from_buffers(form, length, container, compression="zlib")
+
+    form, length, container = ak.to_buffers(like_encoded, compression="zlib")
+    with pytest.raises(ValueError, match="compressed with 'zlib'"):
+        ak.from_buffers(form, length, container, compression="lzma")
+
+
+def test_bad_codec():
+    with pytest.raises(ValueError, match="codec"):
+        ak.to_buffers(array, compression="snappy")
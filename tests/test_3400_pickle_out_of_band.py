@@ -0,0 +1,88 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+array = ak.Array(
+    {
+        "x": np.arange(100, dtype=np.float64),
+        "y": [[1, 2, 3], [], [4, 5]] * 33 + [[6]],
+        "s": ["one", "two", "three", "four"] * 25,
+    }
+)
+
+
+def dumps_out_of_band(obj):
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    return data, buffers
+
+
+def test_buffers_are_not_copied():
+    data, buffers = dumps_out_of_band(array)
+    assert len(buffers) == 5
+    # the stream only contains the form, not the data
+    assert len(data) < sum(buffer.raw().nbytes for buffer in buffers)
+
+    layout = array.layout
+    originals = [
+        layout.content("x").data,
+        layout.content("y").offsets.data,
+        layout.content("y").content.data,
+        layout.content("s").offsets.data,
+        layout.content("s").content.data,
+    ]
+    for original in originals:
+        assert any(
+            np.shares_memory(original, np.asarray(buffer.raw())) for buffer in buffers
+        )
+
+    result = pickle.loads(data, buffers=buffers)
+    assert result.to_list() == array.to_list()
+    assert result.type == array.type
+
+
+def test_sliced():
+    sliced = array[10:20]
+    data, buffers = dumps_out_of_band(sliced)
+    # only the part of each buffer that is used is transferred
+    _, all_buffers = dumps_out_of_band(array)
+    assert sum(buffer.raw().nbytes for buffer in buffers) * 5 < sum(
+        buffer.raw().nbytes for buffer in all_buffers
+    )
+    assert pickle.loads(data, buffers=buffers).to_list() == sliced.to_list()
+
+
+def test_record():
+    record = array[5]
+    data, buffers = dumps_out_of_band(record)
+    assert any(
+        np.shares_memory(array.layout.content("x").data, np.asarray(buffer.raw()))
+        for buffer in buffers
+    )
+    result = pickle.loads(data, buffers=buffers)
+    assert isinstance(result, ak.Record)
+    assert result.to_list() == record.to_list()
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_in_band(protocol):
+    result = pickle.loads(pickle.dumps(array, protocol=protocol))
+    assert result.to_list() == array.to_list()
+
+
+def test_packed_offsets_are_kept():
+    layout = ak.to_layout([[1, 2, 3], [], [4, 5]])
+    assert layout.to_packed().offsets.data is layout.offsets.data
+
+    # offsets that do not start at zero are still rewritten
+    sliced = layout[1:]
+    packed = sliced.to_packed()
+    assert packed.offsets.data.tolist() == [0, 0, 2]
+    assert packed.to_list() == [[], [4, 5]]
@@ -0,0 +1,98 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import gc
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+if sys.platform.startswith("emscripten"):
+    pytestmark = pytest.mark.skip
+else:
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+array = ak.Array(
+    {
+        "x": np.arange(1000, dtype=np.float64),
+        "y": [[1, 2, 3], [], [4, 5]] * 333 + [[6]],
+        "o": [None, {"a": "hello"}] * 500,
+    }
+)
+
+
+def _sum_x(handle):
+    result = ak.from_shared_memory(handle)
+    return float(ak.sum(result.x)), result[-3:].to_list()
+
+
+def test_round_trip():
+    with ak.to_shared_memory(array) as handle:
+        result = ak.from_shared_memory(pickle.loads(pickle.dumps(handle)))
+        assert result.type == array.type
+        assert result.to_list() == array.to_list()
+
+        # the buffers are views of the block
+        data = result.layout.content("x").data
+        assert not data.flags.owndata
+        assert data.ctypes.data % 64 == 0
+
+        del result, data
+        gc.collect()
+
+
+def test_handle_is_small():
+    with ak.to_shared_memory(array) as handle:
+        assert len(pickle.dumps(handle)) < 2000
+        assert handle.size >= array.layout.nbytes - 8000
+
+
+def test_array_outlives_unlink():
+    handle = ak.to_shared_memory(array[10:20])
+    result = ak.from_shared_memory(handle)
+    handle.close()
+    handle.unlink()
+    assert result.to_list() == array[10:20].to_list()
+
+
+def test_empty():
+    with ak.to_shared_memory(array[:0]) as handle:
+        assert ak.from_shared_memory(handle).to_list() == []
+
+
+def test_process_pool():
+    with ak.to_shared_memory(array) as handle:
+        with ProcessPoolExecutor(
+            2, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = list(executor.map(_sum_x, [handle] * 3))
+    assert results == [(499500.0, array[-3:].to_list())] * 3
+
+
+def test_reader_process_exits():
+    # A process that is not a child of this one has its own resource tracker
+    with ak.to_shared_memory(array) as handle:
+        reader = f"""
+import pickle, awkward as ak
+result = ak.from_shared_memory(pickle.loads({pickle.dumps(handle)!r}))
+assert float(ak.sum(result.x)) == 499500.0
+"""
+        process = subprocess.run(
+            [sys.executable, "-c", reader], check=False, capture_output=True, text=True
+        )
+        assert process.returncode == 0, process.stderr
+        assert "leaked" not in process.stderr
+
+        # the block outlived the reader
+        assert ak.from_shared_memory(handle).to_list() == array.to_list()
+
+
+def test_not_a_handle():
+    with pytest.raises(TypeError, match="SharedMemoryHandle"):
+        ak.from_shared_memory("psm_12345")
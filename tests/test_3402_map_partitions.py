@@ -0,0 +1,100 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import awkward as ak
+from awkward.operations.ak_map_partitions import _element_nbytes, _partition_stops
+
+if sys.platform.startswith("emscripten"):
+    pytestmark = pytest.mark.skip
+else:
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+array = ak.Array(
+    {
+        "x": np.arange(100),
+        "y": [list(range(i % 10)) for i in range(100)],
+    }
+)
+
+
+def _select(events):
+    return events[ak.num(events.y) > 5].x
+
+
+def test_threads():
+    result = ak.map_partitions(_select, array, npartitions=4)
+    assert result.to_list() == _select(array).to_list()
+
+
+def test_existing_executor():
+    with ThreadPoolExecutor(2) as executor:
+        result = ak.map_partitions(
+            lambda x: x.y * 2, array, npartitions=3, executor=executor
+        )
+    assert result.to_list() == (array.y * 2).to_list()
+
+
+def test_processes():
+    with ProcessPoolExecutor(
+        2, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        result = ak.map_partitions(_select, array, npartitions=3, executor=executor)
+    assert result.to_list() == _select(array).to_list()
+
+
+def test_not_concatenated():
+    results = ak.map_partitions(
+        lambda x: len(x), array, npartitions=100, concatenate=False
+    )
+    # elements with more bytes than a partition's share are not split
+    assert 1 < len(results) <= 100
+    assert sum(results) == 100
+
+
+def test_balanced_by_bytes():
+    skewed = ak.Array([list(range(1000))] + [[1]] * 999)
+    # the first element has as many bytes as the next ~500 together
+    assert _partition_stops(skewed.layout, 4) == [1, 251, 626, 1000]
+    assert _partition_stops(skewed.layout, 1) == [1000]
+    assert _partition_stops(ak.Array([1, 2]).layout, 5) == [1, 2]
+    assert _partition_stops(ak.Array([]).layout, 3) == [0]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [[1.1, 2.2], None, [], [3.3]],
+        [{"x": 1, "y": "hello"}, {"x": 2, "y": ""}],
+        [[1, 2], "hi", 3.3, None],
+        np.arange(24).reshape(4, 3, 2),
+    ],
+)
+def test_element_nbytes(data):
+    layout = ak.to_layout(data)
+    weights = _element_nbytes(layout)
+    assert len(weights) == layout.length
+    assert (weights > 0).all()
+    assert weights.sum() <= layout.nbytes
+
+    regular = ak.to_regular(ak.Array([[1, 2, 3], [4, 5, 6]]), axis=1)
+    assert _element_nbytes(regular.layout).tolist() == [24, 24]
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError, match="npartitions"):
+        ak.map_partitions(len, array, npartitions=0)
+    with pytest.raises(ValueError, match="npartitions"):
+        ak.map_partitions(len, array, npartitions=True)
+    results = ak.map_partitions(len, array, npartitions=np.int64(2), concatenate=False)
+    assert len(results) == 2
+    assert sum(results) == 100
+    with pytest.raises(TypeError, match="executor"):
+        ak.map_partitions(len, array, executor="gpus")
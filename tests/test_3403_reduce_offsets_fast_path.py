@@ -0,0 +1,139 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+rng = np.random.default_rng(12345)
+counts = rng.poisson(3, 200)
+counts[::7] = 0
+offsets = np.concatenate([[0], np.cumsum(counts)])
+
+
+def values_of(dtype):
+    if dtype == np.bool_:
+        return rng.integers(0, 2, offsets[-1]).astype(np.bool_)
+    elif np.dtype(dtype).kind == "c":
+        return (
+            rng.normal(size=offsets[-1]) + 1j * rng.normal(size=offsets[-1])
+        ).astype(dtype)
+    elif np.dtype(dtype).kind == "f":
+        values = rng.normal(size=offsets[-1]).astype(dtype)
+        values[::11] = np.nan
+        return values
+    else:
+        return rng.integers(-50, 50, offsets[-1]).astype(dtype)
+
+
+def pair(values):
+    # The same lists, with the values directly in a ListOffsetArray (fast path)
+    # or behind an IndexedArray (general path with `parents`)
+    fast = ak.contents.ListOffsetArray(
+        ak.index.Index64(offsets), ak.contents.NumpyArray(values)
+    )
+    general = ak.contents.ListOffsetArray(
+        ak.index.Index64(offsets),
+        ak.contents.IndexedArray(
+            ak.index.Index64(np.arange(len(values))), ak.contents.NumpyArray(values)
+        ),
+    )
+    return ak.Array(fast), ak.Array(general)
+
+
+def same(x, y, exact=True):
+    assert x.type == y.type
+    if exact:
+        assert ak.array_equal(x, y, equal_nan=True)
+    else:
+        # reduceat sums floating-point numbers pairwise, not one after another
+        x, y = ak.nan_to_num(ak.fill_none(x, 0)), ak.nan_to_num(ak.fill_none(y, 0))
+        assert ak.almost_equal(x, y, rtol=1e-5, atol=1e-5)
+
+
+reducers = [
+    ak.sum,
+    ak.prod,
+    ak.min,
+    ak.max,
+    ak.any,
+    ak.all,
+    ak.count,
+    ak.count_nonzero,
+    ak.argmin,
+    ak.argmax,
+]
+dtypes = [np.bool_, np.int8, np.int32, np.uint16, np.int64, np.float32, np.float64]
+
+
+@pytest.mark.parametrize("reducer", reducers)
+@pytest.mark.parametrize("dtype", dtypes)
+@pytest.mark.parametrize("keepdims", [False, True])
+@pytest.mark.parametrize("mask_identity", [False, True])
+def test_same_as_parents(reducer, dtype, keepdims, mask_identity):
+    fast, general = pair(values_of(dtype))
+    if reducer in (ak.prod,):
+        fast, general = fast[:, :3], general[:, :3]
+    same(
+        reducer(fast, axis=-1, keepdims=keepdims, mask_identity=mask_identity),
+        reducer(general, axis=-1, keepdims=keepdims, mask_identity=mask_identity),
+        exact=not (reducer is ak.sum and np.dtype(dtype).kind == "f"),
+    )
+
+
+@pytest.mark.parametrize("reducer", [ak.sum, ak.prod, ak.any, ak.argmax])
+def test_complex(reducer):
+    fast, general = pair(values_of(np.complex128))
+    same(reducer(fast, axis=1), reducer(general, axis=1), exact=reducer is not ak.sum)
+
+
+@pytest.mark.parametrize("reducer", [ak.min, ak.max])
+def test_initial(reducer):
+    fast, general = pair(values_of(np.float64))
+    same(reducer(fast, axis=1, initial=0.5), reducer(general, axis=1, initial=0.5))
+    fast, general = pair(values_of(np.int32))
+    same(reducer(fast, axis=1, initial=3), reducer(general, axis=1, initial=3))
+
+
+@pytest.mark.parametrize("reducer", reducers)
+def test_blocks(monkeypatch, reducer):
+    fast, general = pair(values_of(np.float64))
+    expected = reducer(general, axis=-1)
+
+    monkeypatch.setattr(ak._reducers.KernelReducer, "offsets_block_size", 5)
+    # Reducers that use reduceat are not affected; the others use several blocks
+    same(reducer(fast, axis=-1), expected, exact=reducer is not ak.sum)
+    same(
+        reducer(fast[50:], axis=-1),
+        reducer(general[50:], axis=-1),
+        exact=reducer is not ak.sum,
+    )
+
+
+def test_nested_and_sliced():
+    array = ak.Array([[[1, 2, 3], [], [4]], [], [[5, 6]]] * 10)
+    assert ak.sum(array, axis=-1).to_list() == [[6, 0, 4], [], [11]] * 10
+    assert ak.sum(array[5:, 1:], axis=-1).to_list() == [
+        [sum(x) for x in row[1:]] for row in array[5:].to_list()
+    ]
+    assert ak.max(array[:, :, 1:], axis=-1).to_list() == [[3, None, None], [], [6]] * 10
+
+
+def test_scratch_space():
+    lengths = np.full(1000, 2000)
+    array = ak.unflatten(np.ones(lengths.sum()), lengths)
+
+    tracemalloc.start()
+    try:
+        result = ak.sum(array, axis=-1)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result.to_list() == [2000.0] * 1000
+    # 2,000,000 values: a `parents` index for them would take 16 MB
+    assert peak < 1_000_000
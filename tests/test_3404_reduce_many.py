@@ -0,0 +1,116 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+functions = {
+    "count": ak.count,
+    "count_nonzero": ak.count_nonzero,
+    "sum": ak.sum,
+    "prod": ak.prod,
+    "any": ak.any,
+    "all": ak.all,
+    "min": ak.min,
+    "max": ak.max,
+    "argmin": ak.argmin,
+    "argmax": ak.argmax,
+}
+
+arrays = [
+    ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6], [0.0, -1.1]]),
+    ak.Array([[[1, 2], [], [3]], [], [[4, 0, 5], [6]], [[7]]]),
+    ak.Array([[1, None, 3], None, [], [4, 5]]),
+    ak.Array([[True, False], [], [True, True]]),
+]
+
+
+@pytest.mark.parametrize("array", arrays)
+@pytest.mark.parametrize("axis", [None, 0, 1, -1])
+@pytest.mark.parametrize("keepdims", [False, True])
+@pytest.mark.parametrize("mask_identity", [None, False, True])
+def test_same_as_separate(array, axis, keepdims, mask_identity):
+    result = ak.reduce_many(
+        array,
+        list(functions),
+        axis=axis,
+        keepdims=keepdims,
+        mask_identity=mask_identity,
+    )
+    assert ak.fields(result) == list(functions)
+    for name, function in functions.items():
+        if mask_identity is None:
+            expected = function(array, axis=axis, keepdims=keepdims)
+        else:
+            expected = function(
+                array, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+            )
+        if axis is None and not keepdims:
+            assert result[name] == expected
+        else:
+            assert result[name].type == expected.type
+            assert result[name].to_list() == expected.to_list()
+
+
+def test_sumsq():
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    assert ak.reduce_many(array, ["sumsq"], axis=1).sumsq.to_list() == [14, 0, 41]
+    assert ak.reduce_many(array, ["sumsq"]).sumsq == 55
+
+    array = ak.Array([[1.5, -2.0], [], [0.5]])
+    assert ak.reduce_many(array, ["sumsq"], axis=-1).sumsq.to_list() == [6.25, 0, 0.25]
+    assert ak.reduce_many(array, ["sumsq"], axis=0).sumsq.to_list() == [2.5, 4.0]
+
+
+def test_record_of_results():
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    result = ak.reduce_many(array, ["count", "sum", "min"], axis=-1)
+    assert result.to_list() == [
+        {"count": 3, "sum": 6, "min": 1},
+        {"count": 0, "sum": 0, "min": None},
+        {"count": 2, "sum": 9, "min": 4},
+    ]
+    assert str(result.type) == "3 * {count: int64, sum: int64, min: ?int64}"
+
+    result = ak.reduce_many(array, ["count", "max"])
+    assert isinstance(result, ak.Record)
+    assert result.to_list() == {"count": 5, "max": 5}
+
+
+def test_general_path():
+    # content behind an IndexedArray is not reduced over the offsets directly
+    layout = ak.contents.ListOffsetArray(
+        ak.index.Index64(np.array([0, 3, 3, 5])),
+        ak.contents.IndexedArray(
+            ak.index.Index64(np.array([4, 3, 2, 1, 0])),
+            ak.contents.NumpyArray(np.array([1.0, 2.0, 3.0, 4.0, 5.0])),
+        ),
+    )
+    result = ak.reduce_many(layout, ["count", "sum", "sumsq", "argmax"], axis=1)
+    assert result.to_list() == [
+        {"count": 3, "sum": 12.0, "sumsq": 50.0, "argmax": 0},
+        {"count": 0, "sum": 0.0, "sumsq": 0.0, "argmax": None},
+        {"count": 2, "sum": 3.0, "sumsq": 5.0, "argmax": 0},
+    ]
+
+
+def test_named_axis():
+    array = ak.with_named_axis(ak.Array([[1, 2], [3]]), ("events", "jets"))
+    result = ak.reduce_many(array, ["sum", "count"], axis="jets")
+    assert result.sum.to_list() == [3, 3]
+    assert result.named_axis == {"events": 0}
+
+
+def test_bad_reducers():
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    with pytest.raises(ValueError, match="unrecognized reducer"):
+        ak.reduce_many(array, ["sum", "median"], axis=1)
+    with pytest.raises(ValueError, match="repeated"):
+        ak.reduce_many(array, ["sum", "sum"], axis=1)
+    with pytest.raises(ValueError, match="at least one"):
+        ak.reduce_many(array, [], axis=1)
+    with pytest.raises(TypeError, match="iterable"):
+        ak.reduce_many(array, "sum", axis=1)
@@ -0,0 +1,188 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+rng = np.random.default_rng(12345)
+counts = rng.poisson(4, 1000)
+counts[::9] = 0
+values = rng.normal(size=counts.sum())
+values[::13] = np.nan
+
+
+def general(array):
+    # values behind an IndexedArray are reduced with `parents`, by the kernels
+    layout = array.layout
+    return ak.Array(
+        ak.contents.ListOffsetArray(
+            layout.offsets,
+            ak.contents.IndexedArray(
+                ak.index.Index64(np.arange(layout.content.length)), layout.content
+            ),
+        )
+    )
+
+
+@pytest.fixture
+def split_calls(monkeypatch):
+    # split calls into small chunks, and count them
+    monkeypatch.setattr(ak._parallel, "min_chunk_length", 100)
+    calls = []
+    split = ak._parallel.split
+
+    def counting_split(name, args):
+        tasks = split(name, args)
+        if tasks is not None:
+            calls.append((name, len(tasks)))
+        return tasks
+
+    monkeypatch.setattr(ak._parallel, "split", counting_split)
+    with ak.kernel_threads(4):
+        yield calls
+
+
+def check(function, *args, **kwargs):
+    expected = function(*args, **kwargs)
+    with ak.kernel_threads(4):
+        result = function(*args, **kwargs)
+    assert result.type == expected.type
+    assert ak.array_equal(result, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        ak.sum,
+        ak.prod,
+        ak.min,
+        ak.max,
+        ak.argmin,
+        ak.argmax,
+        ak.count,
+        ak.count_nonzero,
+        ak.any,
+        ak.all,
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.float64, np.int32, np.bool_])
+def test_reducers(split_calls, function, dtype):
+    array = general(
+        ak.unflatten(ak.values_astype(np.nan_to_num(values), dtype), counts)
+    )
+    expected = function(array, axis=-1)
+    with ak.kernel_threads(1):
+        assert ak.array_equal(function(array, axis=-1), expected)
+    split_calls.clear()
+    result = function(array, axis=-1)
+    assert split_calls[0][0].startswith("awkward_reduce")
+    assert split_calls[0][1] == 4
+    if function in (ak.sum, ak.prod) and dtype == np.float64:
+        assert ak.almost_equal(result, expected)
+    else:
+        assert ak.array_equal(result, expected)
+
+    # not at the last axis
+    nested = ak.unflatten(array, [3, 7] * 100)
+    with ak.kernel_threads(1):
+        expected = function(nested, axis=1)
+    assert ak.almost_equal(function(nested, axis=1), expected)
+
+
+def test_offsets_fast_path(monkeypatch, split_calls):
+    # lists of values directly in a NumpyArray are reduced with ufunc.reduceat
+    array = ak.unflatten(np.nan_to_num(values), counts)
+    ranges = []
+    map_tasks = ak._parallel.map_tasks
+
+    def counting_map_tasks(function, tasks):
+        ranges.append(len(tasks))
+        return map_tasks(function, tasks)
+
+    monkeypatch.setattr(ak._parallel, "map_tasks", counting_map_tasks)
+    for function in (ak.sum, ak.max, ak.any, ak.count_nonzero):
+        with ak.kernel_threads(1):
+            expected = function(array, axis=-1)
+        ranges.clear()
+        result = function(array, axis=-1)
+        assert ranges == [4]
+        assert ak.almost_equal(result, expected)
+    assert split_calls == []
+
+
+@pytest.mark.parametrize("function", [ak.sort, ak.argsort])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_sort(split_calls, function, ascending):
+    array = general(ak.unflatten(values, counts))
+    with ak.kernel_threads(1):
+        expected = function(array, axis=-1, ascending=ascending, stable=True)
+    result = function(array, axis=-1, ascending=ascending, stable=True)
+    assert any(name.endswith("sort") for name, _ in split_calls)
+    assert ak.array_equal(result, expected, equal_nan=True)
+
+
+def test_broadcast_and_carry(split_calls):
+    array = ak.unflatten(values, counts)
+    # the same lists, starting one value later in their content
+    offsets = array.layout.offsets.data
+    shifted = ak.Array(
+        ak.contents.ListArray(
+            ak.index.Index64(offsets[:-1] + 1),
+            ak.index.Index64(offsets[1:] + 1),
+            ak.contents.NumpyArray(np.concatenate([[0.0], values])),
+        )
+    )
+    with ak.kernel_threads(1):
+        expected = shifted + array
+    result = shifted + array
+    assert ("awkward_ListArray_broadcast_tooffsets", 4) in split_calls
+    assert ak.array_equal(result, expected, equal_nan=True)
+
+    regular = ak.to_regular(ak.unflatten(values[:1200], 4), axis=1)
+    index = rng.integers(0, 300, 500)
+    check(lambda: regular[index])
+
+
+def test_errors(split_calls):
+    # the lists in the last chunk do not match
+    one = ak.Array(
+        ak.contents.ListArray(
+            ak.index.Index64(np.arange(0, 3000, 3)),
+            ak.index.Index64(np.arange(3, 3001, 3)),
+            ak.contents.NumpyArray(np.arange(3000)),
+        )
+    )
+    two = ak.unflatten(np.arange(3000), [3] * 998 + [2, 4])
+    with pytest.raises(ValueError, match="cannot broadcast nested list"):
+        one + two
+    assert ("awkward_ListArray_broadcast_tooffsets", 4) in split_calls
+
+
+def test_setting():
+    assert ak._parallel.get_num_threads() == 1
+    with ak.kernel_threads(3) as setting:
+        assert setting.num_threads == 3
+        assert ak._parallel.get_num_threads() == 3
+        with ak.kernel_threads(None):
+            assert ak._parallel.get_num_threads() >= 1
+        assert ak._parallel.get_num_threads() == 3
+    assert ak._parallel.get_num_threads() == 1
+
+    setting = ak.kernel_threads(2)
+    try:
+        assert ak._parallel.get_num_threads() == 2
+    finally:
+        ak.kernel_threads(setting.previous)
+    assert ak._parallel.get_num_threads() == 1
+
+    with pytest.raises(ValueError, match="num_threads"):
+        ak.kernel_threads(0)
+    with pytest.raises(ValueError, match="num_threads"):
+        ak.kernel_threads(True)
+    with ak.kernel_threads(np.int64(2)):
+        assert ak._parallel.get_num_threads() == 2
+        assert type(ak._parallel.get_num_threads()) is int
+    assert ak._parallel.get_num_threads() == 1
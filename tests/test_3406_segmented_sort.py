@@ -0,0 +1,153 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+rng = np.random.default_rng(12345)
+counts = rng.poisson(4, 500)
+counts[::7] = 0
+counts[3] = 300
+offsets = np.concatenate([[0], np.cumsum(counts)])
+
+
+def values_of(dtype):
+    if dtype == np.bool_:
+        return rng.integers(0, 2, offsets[-1]).astype(np.bool_)
+    elif np.dtype(dtype).kind == "f":
+        values = rng.integers(-5, 5, offsets[-1]).astype(dtype)
+        values[::11] = np.nan
+        values[::17] = np.inf
+        return values
+    elif np.dtype(dtype).kind == "M":
+        return rng.integers(0, 10, offsets[-1]).astype(dtype)
+    else:
+        info = np.iinfo(dtype)
+        # few distinct values, so that stability matters, and the extremes
+        values = rng.integers(0, 10, offsets[-1]).astype(dtype)
+        values[::13] = info.min
+        values[::19] = info.max
+        return values
+
+
+def pair(values, start=0):
+    # The same lists, with the values directly in a ListOffsetArray (offsets) or
+    # behind an IndexedArray (`parents` and the kernels)
+    fast = ak.contents.ListOffsetArray(
+        ak.index.Index64(offsets + start),
+        ak.contents.NumpyArray(np.concatenate([values[:start], values])),
+    )
+    general = ak.contents.ListOffsetArray(
+        ak.index.Index64(offsets),
+        ak.contents.IndexedArray(
+            ak.index.Index64(np.arange(len(values))), ak.contents.NumpyArray(values)
+        ),
+    )
+    return ak.Array(fast), ak.Array(general)
+
+
+dtypes = [
+    np.bool_,
+    np.int8,
+    np.uint8,
+    np.int16,
+    np.int32,
+    np.uint32,
+    np.int64,
+    np.uint64,
+    np.float32,
+    np.float64,
+    "datetime64[s]",
+]
+
+
+@pytest.mark.parametrize("dtype", dtypes)
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("kind", [None, "radix"])
+def test_argsort(dtype, ascending, kind):
+    fast, general = pair(values_of(dtype), start=3)
+    expected = ak.argsort(general, axis=-1, ascending=ascending, stable=True)
+    for array in (fast, general):
+        result = ak.argsort(array, axis=-1, ascending=ascending, stable=True, kind=kind)
+        assert result.type == expected.type
+        assert ak.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("dtype", dtypes)
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("stable", [True, False])
+@pytest.mark.parametrize("kind", [None, "radix"])
+def test_sort(dtype, ascending, stable, kind):
+    fast, general = pair(values_of(dtype))
+    expected = ak.sort(general, axis=-1, ascending=ascending, stable=stable)
+    for array in (fast, general):
+        result = ak.sort(array, axis=-1, ascending=ascending, stable=stable, kind=kind)
+        assert result.type == expected.type
+        assert ak.array_equal(result, expected, equal_nan=True)
+
+
+def test_unstable_argsort():
+    fast, general = pair(values_of(np.float64))
+    result = ak.argsort(fast, axis=-1, stable=False)
+    assert ak.array_equal(fast[result], ak.sort(general, axis=-1), equal_nan=True)
+
+
+def test_nan_first():
+    array = ak.Array([[3.0, np.nan, 1.0, np.nan, 2.0], [], [np.nan], [2.0, 1.0]])
+    assert ak.argsort(array).to_list() == [[1, 3, 2, 4, 0], [], [0], [1, 0]]
+    assert ak.argsort(array, ascending=False).to_list() == [
+        [1, 3, 0, 4, 2],
+        [],
+        [0],
+        [0, 1],
+    ]
+
+
+def test_nested():
+    array = ak.Array([[[3, 1, 2], [], [5, 4]], [], [[0, -1]]] * 3)
+    for kind in (None, "radix"):
+        assert (
+            ak.sort(array, axis=-1, kind=kind).to_list()
+            == [
+                [[1, 2, 3], [], [4, 5]],
+                [],
+                [[-1, 0]],
+            ]
+            * 3
+        )
+        assert ak.argsort(array[1:, ::-1], axis=-1, kind=kind).to_list() == [
+            [sorted(range(len(x)), key=x.__getitem__) for x in row]
+            for row in array[1:, ::-1].to_list()
+        ]
+    # not the innermost axis
+    assert (
+        ak.sort(array, axis=1, kind="radix").to_list()
+        == ak.sort(array, axis=1).to_list()
+    )
+
+
+def test_radix_long_lists():
+    values = rng.integers(0, 256, 300_000).astype(np.uint8)
+    array = ak.unflatten(values, [100_000, 0, 150_000, 50_000])
+    for ascending in (True, False):
+        expected = ak.argsort(array, ascending=ascending, stable=True)
+        result = ak.argsort(array, ascending=ascending, stable=True, kind="radix")
+        assert ak.array_equal(result, expected)
+        assert ak.array_equal(
+            ak.sort(array, ascending=ascending, kind="radix"),
+            ak.sort(array, ascending=ascending),
+        )
+
+
+def test_parameters():
+    array = ak.with_parameter(ak.Array([[3, 1, 2], [5, 4]]), "name", "value")
+    assert ak.sort(array).to_list() == [[1, 2, 3], [4, 5]]
+    assert ak.parameters(ak.sort(array)) == {"name": "value"}
+
+
+def test_bad_kind():
+    with pytest.raises(ValueError, match="kind"):
+        ak.sort(ak.Array([[1, 2]]), kind="quicksort")
@@ -0,0 +1,144 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+rng = np.random.default_rng(12345)
+counts = rng.poisson(30, 200)
+counts[::7] = 0
+counts[::9] = 2
+counts[5] = 500
+
+
+def values_of(dtype):
+    n = counts.sum()
+    if dtype == np.bool_:
+        return rng.integers(0, 2, n).astype(np.bool_)
+    elif np.dtype(dtype).kind == "f":
+        # few distinct values, so that the order of equal values matters
+        values = rng.integers(-5, 5, n).astype(dtype)
+        values[::11] = np.nan
+        values[::17] = np.inf
+        values[::23] = -np.inf
+        return values
+    elif np.dtype(dtype).kind == "M":
+        return rng.integers(0, 10, n).astype(dtype)
+    else:
+        info = np.iinfo(dtype)
+        values = rng.integers(0, 10, n).astype(dtype)
+        values[::13] = info.min
+        values[::19] = info.max
+        return values
+
+
+dtypes = [
+    np.bool_,
+    np.int8,
+    np.uint8,
+    np.int32,
+    np.int64,
+    np.uint64,
+    np.float32,
+    np.float64,
+    "datetime64[s]",
+]
+
+
+@pytest.mark.parametrize("dtype", dtypes)
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("k", [0, 1, 3, 40])
+def test_same_as_argsort(dtype, ascending, k):
+    array = ak.unflatten(values_of(dtype), counts)
+    expected = ak.argsort(array, ascending=ascending, stable=True)[:, :k]
+    result = ak.argtop_k(array, k, ascending=ascending)
+    assert result.type == expected.type
+    assert result.to_list() == expected.to_list()
+
+    expected = ak.sort(array, ascending=ascending, stable=True)[:, :k]
+    result = ak.top_k(array, k, ascending=ascending)
+    assert result.type == expected.type
+    assert ak.array_equal(result, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float64])
+def test_blocks(monkeypatch, dtype):
+    # lists of the same length are selected a few rows at a time
+    monkeypatch.setattr(ak._nplikes.numpy_sorting, "_top_k_block_size", 64)
+    array = ak.unflatten(values_of(dtype), counts)
+    for ascending in (True, False):
+        expected = ak.argsort(array, ascending=ascending, stable=True)[:, :3]
+        result = ak.argtop_k(array, 3, ascending=ascending)
+        assert result.to_list() == expected.to_list()
+
+
+def test_all_nan():
+    array = ak.Array([[np.nan] * 50 + [1.0, np.inf, np.nan, -np.inf] * 10])
+    for ascending in (True, False):
+        assert (
+            ak.argtop_k(array, 55, ascending=ascending).to_list()
+            == ak.argsort(array, ascending=ascending, stable=True)[:, :55].to_list()
+        )
+
+
+def test_list_types():
+    values = values_of(np.float64)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    listoffsetarray = ak.unflatten(values, counts)
+    listarray = ak.Array(
+        ak.contents.ListArray(
+            ak.index.Index64(offsets[:-1][::-1]),
+            ak.index.Index64(offsets[1:][::-1]),
+            ak.contents.NumpyArray(values),
+        )
+    )
+    regulararray = ak.to_regular(ak.Array(values[:5000].reshape(100, 50)))
+    for array in (listoffsetarray, listarray, regulararray, listarray[10:]):
+        assert ak.array_equal(
+            ak.top_k(array, 3), ak.sort(array, ascending=False)[:, :3], equal_nan=True
+        )
+
+
+def test_pad():
+    array = ak.Array([[7.7, 5.5, 9.9, 1.1], [], [2.2], [8.8, 2.2]])
+    assert ak.argtop_k(array, 2, pad=True).to_list() == [
+        [2, 0],
+        [None, None],
+        [0, None],
+        [0, 1],
+    ]
+    assert str(ak.top_k(array, 2, pad=True).type) == "4 * 2 * ?float64"
+
+
+def test_axis():
+    array = ak.Array([[[3, 1, 2], [5]], [], [[0, 4]]])
+    assert ak.top_k(array, 2).to_list() == [[[3, 2], [5]], [], [[4, 0]]]
+    assert (
+        ak.top_k(array, 1, axis=1).to_list()
+        == ak.sort(array, axis=1, ascending=False)[:, :1].to_list()
+    )
+    assert ak.top_k(ak.Array([3, 1, 2, 5]), 2).to_list() == [5, 3]
+    assert ak.argtop_k(ak.Array([3, 1, 2, 5]), 2, axis=0).to_list() == [3, 0]
+    with pytest.raises(np.exceptions.AxisError):
+        ak.top_k(array, 1, axis=3)
+
+
+def test_not_numbers():
+    array = ak.Array([[3, None, 1], [], [None, 2]])
+    assert ak.top_k(array, 2).to_list() == [[3, 1], [], [2, None]]
+
+
+def test_typetracer():
+    array = ak.unflatten(values_of(np.float64), counts)
+    tt = ak.Array(array.layout.to_typetracer(forget_length=True))
+    assert ak.top_k(tt, 3).type.content == ak.top_k(array, 3).type.content
+
+
+def test_bad_k():
+    with pytest.raises(ValueError, match="'k'"):
+        ak.top_k(ak.Array([[1, 2]]), -1)
+    with pytest.raises(ValueError, match="'k'"):
+        ak.argtop_k(ak.Array([[1, 2]]), 1.5)
@@ -0,0 +1,139 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+rng = np.random.default_rng(12345)
+
+
+def events(n=1000):
+    return ak.zip(
+        {
+            "met": rng.exponential(20, n),
+            "run": rng.integers(0, 10, n),
+            "jets": ak.unflatten(rng.normal(size=3 * n), np.full(n, 3)),
+            "muon": ak.zip({"pt": rng.exponential(10, n), "q": rng.integers(0, 2, n)}),
+        },
+        depth_limit=1,
+    )
+
+
+def cutflow(array):
+    for i in range(5):
+        array = array[array.met > 2 * i]
+        array = array[array.run != i]
+    return array
+
+
+def test_default():
+    assert ak.lazy_carries().selectivity == 0
+    array = events()
+    with ak.lazy_carries() as carries:
+        out = cutflow(array)
+    assert isinstance(out.layout, ak.contents.IndexedArray)
+    assert carries.stats["lazy"] == 1
+    assert carries.stats["composed"] == 9
+    assert carries.stats["compacted"] == 0
+
+
+@pytest.mark.parametrize("selectivity", [0.5, 0.9, 1])
+def test_same_values(selectivity):
+    array = events()
+    expected = cutflow(array)
+    with ak.lazy_carries(selectivity) as carries:
+        result = cutflow(array)
+    assert carries.stats["compacted"] > 0
+    assert result.type == expected.type
+    assert result.to_list() == expected.to_list()
+    assert ak.array_equal(result.jets[:, 1:], expected.jets[:, 1:])
+    assert ak.lazy_carries().selectivity == 0
+
+
+def test_fields_selected_once():
+    array = events()
+    with ak.lazy_carries(1) as carries:
+        out = array[array.met > 10]
+        out = out[out.run > 2]
+        out = out[out.muon.q == 1]
+        assert carries.stats["buffers"] == 2  # run and muon.q
+        for _ in range(3):
+            ak.sum(out.met)
+        assert carries.stats["buffers"] == 3
+        assert carries.stats["resolved"] == 0
+
+        # muon.pt was never used: it is selected once, by the composed index
+        ak.sum(out.muon.pt)
+    assert carries.stats["buffers"] == 4
+    assert carries.stats["compacted"] == 3
+    assert isinstance(out.layout, ak.contents.RecordArray)
+
+    expected = array[(array.met > 10) & (array.run > 2) & (array.muon.q == 1)]
+    assert out.to_list() == expected.to_list()
+
+
+def test_threshold():
+    array = events()
+    with ak.lazy_carries(0.5) as carries:
+        half = array[: len(array) // 2 + 1][array.met[: len(array) // 2 + 1] > -1]
+        assert isinstance(half.layout, ak.contents.IndexedArray)
+        quarter = array[np.arange(0, len(array), 4)]
+        assert isinstance(quarter.layout, ak.contents.RecordArray)
+    assert carries.stats["compacted"] == 1
+
+
+def test_stats_frozen():
+    with ak.lazy_carries(1) as carries:
+        array = events()
+        array[array.met > 5]
+    stats = carries.stats
+    array[array.met > 5]
+    assert carries.stats == stats
+
+
+def test_not_counted_unless_observed():
+    array = events()
+    before = dict(ak._carry.counts)
+    cutflow(array)
+    assert ak._carry.counts == before
+    assert ak._carry._observers == 0
+
+
+def test_threads():
+    # threads that use the same compacted fields for the first time at once
+    array = events(10_000)
+    with ak.lazy_carries(1):
+        out = cutflow(array)
+    expected = cutflow(array)
+    barrier = threading.Barrier(4)
+
+    def use(_):
+        barrier.wait()
+        return ak.sum(out.met), ak.sum(out.jets), ak.sum(out.muon.pt)
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(use, range(4)))
+    sums = ak.sum(expected.met), ak.sum(expected.jets), ak.sum(expected.muon.pt)
+    assert results == [sums] * 4
+
+
+def test_typetracer():
+    array = events()
+    tt = ak.Array(array.layout.to_typetracer(forget_length=True))
+    with ak.lazy_carries(1) as carries:
+        out = tt[tt.met > 5]
+    assert out.type.content == array.type.content
+    assert carries.stats["compacted"] == 0
+
+
+def test_bad_selectivity():
+    with pytest.raises(ValueError, match="selectivity"):
+        ak.lazy_carries(1.5)
+    with pytest.raises(ValueError, match="selectivity"):
+        ak.lazy_carries(True)
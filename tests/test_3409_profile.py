@@ -0,0 +1,117 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+
+def jagged(n=1000):
+    return ak.unflatten(np.arange(10 * n, dtype=np.float64), np.full(n, 10))
+
+
+def test_calls():
+    array = jagged()
+    with ak.profile() as prof:
+        ak.sort(array, ascending=False)
+        array[array > 5]
+    assert not ak._profiling.recorders
+
+    names = [call.name for call in prof.calls]
+    assert "awkward_sort" in names
+    (sort,) = [call for call in prof.calls if call.name == "awkward_sort"]
+    assert sort.dtypes == ("float64", "float64", "int64")
+    assert 10000 in sort.lengths
+    assert sort.nbytes >= 2 * 10000 * 8
+    assert sort.duration > 0
+    assert sort.operation == "ak.sort"
+    assert {call.operation for call in prof.calls} == {
+        "ak.sort",
+        "ak.Array.__getitem__",
+    }
+    assert all(call.start >= prof._start for call in prof.calls)
+    assert prof.duration >= sum(call.duration for call in prof.calls)
+
+
+def test_only_in_block():
+    array = jagged()
+    prof = ak.profile()
+    ak.sort(array)
+    with prof:
+        pass
+    ak.sort(array)
+    assert prof.calls == []
+    with pytest.raises(RuntimeError):
+        with prof:
+            pass
+
+
+def test_nested():
+    array = jagged()
+    with ak.profile() as outer:
+        ak.sort(array)
+        with ak.profile() as inner:
+            ak.argsort(array)
+    assert len(inner.calls) > 0
+    assert outer.calls[-len(inner.calls) :] == inner.calls
+    assert len(outer.calls) > len(inner.calls)
+
+
+def test_summary():
+    array = jagged()
+    with ak.profile() as prof:
+        ak.sort(array)
+        ak.sort(array)
+        ak.num(array[array > 3])
+
+    lines = prof.summary().split("\n")
+    assert lines[0].split() == [
+        "kernel",
+        "calls",
+        "total",
+        "(ms)",
+        "mean",
+        "(us)",
+        "%",
+        "bytes",
+    ]
+    rows = {line.split()[0]: line.split() for line in lines[1:]}
+    assert rows["awkward_sort"][1] == "2"
+    assert sum(float(row[4]) for row in rows.values()) == pytest.approx(100, abs=1)
+
+    assert len(prof.summary(limit=1).split("\n")) == 2
+    assert "awkward_sort, float64, float64, int64" in prof.summary(by="dtypes")
+    operations = prof.summary(by="operation")
+    assert "ak.sort" in operations
+    assert "ak.Array.__getitem__" in operations
+    with pytest.raises(ValueError, match="'by'"):
+        prof.summary(by="thread")
+
+
+def test_chrome_trace(tmp_path):
+    array = jagged()
+    with ak.profile() as prof, ak.kernel_threads(2):
+        ak.sum(array, axis=-1)
+
+    trace = json.loads(prof.to_chrome_trace())
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in complete] == [call.name for call in prof.calls]
+    assert all(event["ts"] >= 0 and event["dur"] >= 0 for event in complete)
+    assert complete[0]["args"]["lengths"] == list(prof.calls[0].lengths)
+    assert any(event["ph"] == "M" for event in trace["traceEvents"])
+
+    path = tmp_path / "trace.json"
+    prof.to_chrome_trace(path)
+    with open(path) as file:
+        assert json.load(file) == trace
+
+
+def test_typetracer():
+    tt = ak.Array(jagged().layout.to_typetracer(forget_length=True))
+    with ak.profile() as prof:
+        ak.sort(tt)
+    assert prof.calls == []
@@ -0,0 +1,102 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import gc
+import json
+
+import numpy as np
+
+import awkward as ak
+
+
+def jagged(n=1000, m=20):
+    return ak.unflatten(np.arange(n * m, dtype=np.float64), np.full(n, m))
+
+
+def test_combinations():
+    array = jagged()
+    with ak.profile() as prof:
+        assert ak._nplikes.numpy.on_allocation is ak._profiling.allocated
+        pairs = ak.combinations(array, 2)
+    assert not ak._profiling.recorders
+    assert ak._nplikes.numpy.on_allocation is None
+
+    (operation,) = prof.operations
+    assert operation.name == "ak.combinations"
+    assert operation.buffers == len(prof.allocations)
+    assert operation.allocated == sum(x.nbytes for x in prof.allocations)
+    assert 0 < operation.peak <= operation.allocated
+    assert {x.operation for x in prof.allocations} == {"ak.combinations"}
+
+    # the carried values of the pairs are among the allocations
+    npairs = 1000 * 20 * 19 // 2
+    carries = [x for x in prof.allocations if x.function == "NumpyArray._carry"]
+    assert sorted(x.shape for x in carries) == [(npairs,), (npairs,)]
+    assert all(x.dtype == "float64" for x in carries)
+    assert len(pairs) == 1000
+
+
+def test_peak():
+    array = jagged()
+    with ak.profile() as prof:
+        ak.cartesian([array, array], nested=True)
+        gc.collect()
+        ak.sort(array)
+    first, second = prof.operations
+    assert first.name == "ak.cartesian"
+    # the output of ak.cartesian was freed before ak.sort
+    assert second.baseline < first.baseline + first.peak
+    assert prof.allocations[-1].live <= max(x.live for x in prof.allocations)
+
+
+def test_nested_operations():
+    array = jagged()
+    with ak.profile() as prof:
+        ak.argtop_k(array, 3)
+    assert [x.name for x in prof.operations] == ["ak.argtop_k"]
+
+
+def test_memory_summary():
+    array = jagged()
+    with ak.profile() as prof:
+        ak.combinations(array, 2)
+        ak.combinations(array[:10], 2)
+        ak.sort(array)
+    lines = prof.memory_summary().split("\n")
+    assert lines[0].split() == [
+        "operation",
+        "calls",
+        "buffers",
+        "allocated",
+        "peak",
+        "largest",
+    ]
+    rows = {line.split()[0]: line.split() for line in lines[1:]}
+    assert rows["ak.combinations"][1] == "2"
+    assert int(rows["ak.combinations"][4]) == max(
+        x.peak for x in prof.operations if x.name == "ak.combinations"
+    )
+    assert lines[1].split()[0] == "ak.combinations"
+    assert len(prof.memory_summary(limit=1).split("\n")) == 2
+
+
+def test_untracked():
+    array = np.arange(100)
+    with ak.profile() as prof:
+        # no copy: not an allocation
+        ak.contents.NumpyArray(array)
+        ak.index.Index64(array)
+    assert prof.allocations == []
+    assert prof.operations == []
+
+
+def test_chrome_trace():
+    array = jagged()
+    with ak.profile() as prof:
+        ak.combinations(array, 2)
+        gc.collect()
+    events = json.loads(prof.to_chrome_trace())["traceEvents"]
+    counters = [x["args"]["bytes"] for x in events if x["ph"] == "C"]
+    assert len(counters) >= len(prof.allocations)
+    assert max(counters) == max(x.live for x in prof.allocations)
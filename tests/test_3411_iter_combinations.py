@@ -0,0 +1,127 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+rng = np.random.default_rng(12345)
+counts = rng.poisson(8, 1000)
+counts[10] = 60
+jets = ak.unflatten(rng.normal(size=counts.sum()), counts)
+muons = ak.zip(
+    {
+        "pt": ak.unflatten(rng.exponential(10, counts.sum()), counts),
+        "q": ak.unflatten(rng.integers(0, 2, counts.sum()), counts),
+    }
+)
+
+
+@pytest.mark.parametrize("replacement", [False, True])
+@pytest.mark.parametrize("n", [1, 2, 3])
+def test_combinations(n, replacement):
+    expected = ak.combinations(jets, n, replacement=replacement)
+    chunks = list(ak.iter_combinations(jets, n, 100_000, replacement=replacement))
+    assert len(chunks) > 1
+    assert all(chunk.type.content == expected.type.content for chunk in chunks)
+    assert ak.array_equal(ak.concatenate(chunks), expected)
+
+
+def test_budget():
+    chunks = list(ak.iter_combinations(muons, 3, 50_000, fields=["a", "b", "c"]))
+    assert sum(len(chunk) for chunk in chunks) == len(muons)
+    # the chunks are no larger than the budget, except for a chunk of one element
+    for chunk in chunks:
+        assert len(chunk) == 1 or ak.to_packed(chunk).layout.nbytes <= 50_000
+    # element 10 has C(60, 3) = 34220 triples, so it is alone
+    start = 0
+    for chunk in chunks:
+        if start <= 10 < start + len(chunk):
+            assert len(chunk) == 1
+        start += len(chunk)
+    assert ak.array_equal(
+        ak.concatenate(chunks), ak.combinations(muons, 3, fields=["a", "b", "c"])
+    )
+
+
+def test_one_chunk():
+    (chunk,) = ak.iter_combinations(jets, 2, 10**12, with_name="pair")
+    assert ak.array_equal(chunk, ak.combinations(jets, 2, with_name="pair"))
+    (chunk,) = ak.iter_combinations(jets[:0], 2, 1000)
+    assert len(chunk) == 0
+
+
+def test_deeper_axis():
+    array = ak.Array([[[1, 2, 3], [4]], [], [[5, 6]], [[7, 8, 9, 10]]])
+    chunks = list(ak.iter_combinations(array, 2, 100, axis=2))
+    assert (
+        ak.concatenate(chunks).to_list() == ak.combinations(array, 2, axis=2).to_list()
+    )
+    # 16 bytes per item (values and offsets), so 48 bytes per pair: 3 pairs,
+    # 0 + 1 pairs, and 6 pairs
+    assert [len(chunk) for chunk in chunks] == [1, 2, 1]
+
+
+def test_missing_lists():
+    array = ak.Array([[[1, 2, 3]], None, [[4, 5], None, [6]], [None]] * 10)
+    chunks = list(ak.iter_combinations(array, 2, 200, axis=2))
+    assert len(chunks) > 1
+    assert (
+        ak.concatenate(chunks).to_list() == ak.combinations(array, 2, axis=2).to_list()
+    )
+    chunks = list(ak.iter_cartesian([array, array], 500, axis=2))
+    assert len(chunks) > 1
+    assert (
+        ak.concatenate(chunks).to_list()
+        == ak.cartesian([array, array], axis=2).to_list()
+    )
+
+
+@pytest.mark.parametrize("nested", [None, True])
+def test_cartesian(nested):
+    expected = ak.cartesian({"jet": jets, "muon": muons}, nested=nested)
+    chunks = list(
+        ak.iter_cartesian({"jet": jets, "muon": muons}, 100_000, nested=nested)
+    )
+    assert len(chunks) > 1
+    assert ak.array_equal(ak.concatenate(chunks), expected)
+
+    chunks = list(ak.iter_cartesian([jets, jets, jets], 100_000))
+    assert ak.array_equal(ak.concatenate(chunks), ak.cartesian([jets, jets, jets]))
+
+
+def test_long_lists():
+    # the numbers of combinations of these lists are too large for int64
+    from awkward.operations.ak_iter_combinations import _num_combinations
+
+    lengths = ak.Array([3, 100_000, 10**7])
+    for n, replacement in [(4, False), (4, True), (3, False)]:
+        count = _num_combinations(lengths, n, replacement)
+        expected = [
+            math.comb(x + n - 1, n) if replacement else math.comb(x, n)
+            for x in lengths.to_list()
+        ]
+        assert count.to_list() == pytest.approx(expected, rel=1e-12)
+
+    # so the long list is alone in its chunk
+    array = ak.Array([[1, 2, 3, 4], list(range(100_000))])
+    chunks = ak.iter_combinations(array, 4, 10**6)
+    assert next(chunks).to_list() == [[(1, 2, 3, 4)]]
+
+
+def test_errors():
+    with pytest.raises(np.exceptions.AxisError):
+        next(ak.iter_combinations(jets, 2, 1000, axis=0))
+    with pytest.raises(ValueError, match="max_bytes"):
+        ak.iter_combinations(jets, 2, 0)
+    with pytest.raises(ValueError, match="'n'"):
+        ak.iter_combinations(jets, 0, 1000)
+    with pytest.raises(ValueError, match="same length"):
+        ak.iter_cartesian([jets, jets[1:]], 1000)
+    tt = ak.Array(jets.layout.to_typetracer(forget_length=True))
+    with pytest.raises(TypeError, match="typetracer"):
+        ak.iter_cartesian([tt, tt], 1000)
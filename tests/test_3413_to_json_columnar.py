@@ -0,0 +1,142 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+to_json = ak.operations.ak_to_json
+
+rng = np.random.default_rng(12345)
+counts = rng.poisson(3, 500)
+values = rng.normal(size=counts.sum()) * 10.0 ** rng.integers(-20, 20, counts.sum())
+values[::37] = np.nan
+values[::41] = np.inf
+values[::43] = -np.inf
+words = np.array(["a", "bé", 'q"u\\o', "tab\t", "", "日本", "x\x7f", "plain"])
+
+array = ak.zip(
+    {
+        "f64": ak.unflatten(values, counts),
+        "f32": ak.unflatten(values.astype(np.float32), counts),
+        "i64": ak.unflatten(rng.integers(-(2**63), 2**63 - 1, counts.sum()), counts),
+        "u8": ak.unflatten(rng.integers(0, 256, counts.sum()).astype(np.uint8), counts),
+        "bool": ak.unflatten(rng.integers(0, 2, counts.sum()).astype(np.bool_), counts),
+        "str": ak.unflatten(words[rng.integers(0, len(words), counts.sum())], counts),
+        "option": ak.mask(np.arange(500), rng.random(500) < 0.7),
+        "union": ak.Array([1, "two", [3.5], None, {"k": (1, False)}] * 100),
+        "regular": ak.to_regular(ak.Array(rng.integers(0, 9, (500, 3)))),
+        "complex": np.arange(500) + 0.5j,
+        "empty": ak.Array([[]] * 500),
+    },
+    depth_limit=1,
+)
+
+conversions = {
+    "nan_string": "nan",
+    "posinf_string": "inf",
+    "neginf_string": "-inf",
+    "complex_record_fields": ("re", "im"),
+}
+
+
+def expected(array, separators=(",", ":")):
+    return json.dumps(ak.to_layout(array).to_json(**conversions), separators=separators)
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [slice(None), slice(5, 300), np.arange(500)[::-3], rng.random(500) < 0.5],
+)
+def test_same_text(selection):
+    selected = array[selection]
+    assert ak.to_json(selected, **conversions) == expected(selected)
+    assert ak.to_json(selected, num_readability_spaces=1, **conversions) == expected(
+        selected, (", ", ": ")
+    )
+    assert ak.to_json(selected, line_delimited="\r\n", **conversions) == "".join(
+        json.dumps(x, separators=(",", ":")) + "\r\n"
+        for x in ak.to_layout(selected).to_json(**conversions)
+    )
+
+
+def test_fields():
+    for field in array.fields:
+        assert ak.to_json(array[field], **conversions) == expected(array[field])
+    assert ak.to_json(array[0], **conversions) == json.dumps(
+        ak.to_layout(array[0:1]).to_json(**conversions)[0], separators=(",", ":")
+    )
+    assert ak.to_json(array[:0]) == "[]"
+    assert ak.to_json(np.array([[1, 2], [3, 4]])) == "[[1,2],[3,4]]"
+
+
+def test_chunks(monkeypatch):
+    monkeypatch.setattr(to_json, "_chunk_nbytes", 1000)
+    assert ak.to_json(array, **conversions) == expected(array)
+    lines = ak.to_json(array, line_delimited=True, **conversions).split("\n")
+    assert len(lines) == len(array) + 1
+    assert lines[-1] == ""
+
+
+def test_files(tmp_path):
+    ak.to_json(array, tmp_path / "out.json", **conversions)
+    assert (tmp_path / "out.json").read_text() == expected(array)
+    file = io.StringIO()
+    ak.to_json(array, file, line_delimited=True, **conversions)
+    assert file.getvalue() == ak.to_json(array, line_delimited=True, **conversions)
+    assert not file.closed
+
+
+def test_nonfinite():
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        ak.to_json(array.f64)
+    assert ak.to_json(ak.Array([1.5, np.nan]), nan_string="NaN") == '[1.5,"NaN"]'
+
+
+def test_nonfinite_file(monkeypatch, tmp_path):
+    # the error is in a later chunk, and the file is left as it was
+    monkeypatch.setattr(to_json, "_chunk_nbytes", 1000)
+    values = ak.Array({"x": np.append(np.arange(1000.0), np.inf)})
+    (tmp_path / "out.json").write_text("before")
+    for line_delimited in (False, True):
+        with pytest.raises(ValueError, match="not JSON compliant"):
+            ak.to_json(values, tmp_path / "out.json", line_delimited=line_delimited)
+        assert (tmp_path / "out.json").read_text() == "before"
+
+    # non-finite numbers that aren't in the array are not an error
+    ak.to_json(values[:-1], tmp_path / "out.json")
+    assert (tmp_path / "out.json").read_text() == ak.to_json(values[:-1])
+
+
+def test_python_objects():
+    # these arrays are converted to Python objects, as before
+    writer = to_json._ColumnarWriter((",", ":"), None, None, None, None, None)
+    bytestrings = ak.Array([b"one", b"two"])
+    assert not writer.supports(bytestrings.layout)
+    assert ak.to_json(bytestrings, convert_bytes=bytes.decode) == '["one","two"]'
+
+    dates = ak.Array(np.array(["2024-01-01"], dtype="datetime64[D]"))
+    assert not writer.supports(dates.layout)
+    assert ak.to_json(dates, convert_other=str) == '["2024-01-01"]'
+
+    assert not writer.supports(array.complex.layout)
+
+    class Point(ak.Record):
+        def __getitem__(self, where):
+            return 123
+
+    behavior = {"point": Point}
+    points = ak.Array([{"x": 1}], with_name="point", behavior=behavior)
+    writer = to_json._ColumnarWriter((",", ":"), None, None, None, None, behavior)
+    assert not writer.supports(points.layout)
+    assert ak.to_json(points) == '[{"x":123}]'
+    assert writer.supports(ak.with_name(points, "other").layout)
+
+    assert (
+        ak.to_json(ak.Array([[1, 2]]), num_indent_spaces=1) == "[\n [\n  1,\n  2\n ]\n]"
+    )
@@ -0,0 +1,121 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+from_json = ak.operations.ak_from_json
+
+rng = np.random.default_rng(12345)
+lines = [
+    json.dumps(
+        {
+            "x": i,
+            "y": rng.normal(size=rng.poisson(3)).tolist(),
+            "z": None if i % 7 == 0 else "z" * (i % 5),
+        }
+    )
+    for i in range(1000)
+]
+text = "\n".join(lines)
+
+schema = {
+    "type": "object",
+    "properties": {
+        "x": {"type": "integer"},
+        "y": {"type": "array", "items": {"type": "number"}},
+        "z": {"type": ["string", "null"]},
+    },
+    "required": ["x", "y", "z"],
+}
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(from_json, "_min_chunk_nbytes", 1000)
+
+
+@pytest.mark.parametrize("schema", [None, schema])
+def test_same_result(small_chunks, schema):
+    expected = ak.from_json(text, line_delimited=True, schema=schema)
+    for source in [text, text.encode(), text + "\n", text + "\r\n"]:
+        result = ak.from_json(source, line_delimited=True, schema=schema, max_workers=3)
+        assert result.to_list() == expected.to_list()
+        assert result.type == expected.type
+
+
+def test_different_keys(small_chunks):
+    # records in different chunks have different keys, at the top and nested
+    text = "\n".join(
+        [json.dumps({"a": i, "c": [{"p": i}]}) for i in range(300)]
+        + [json.dumps({"b": 2.5, "a": i, "c": [{"q": True}]}) for i in range(300)]
+    )
+    expected = ak.from_json(text, line_delimited=True)
+    result = ak.from_json(text, line_delimited=True, max_workers=4)
+    assert (
+        str(result.type)
+        == "600 * {a: int64, c: var * {p: ?int64, q: ?bool}, b: ?float64}"
+    )
+    assert result.type == expected.type
+    assert result.to_list() == expected.to_list()
+
+
+def test_sources(small_chunks, tmp_path):
+    expected = ak.from_json(text, line_delimited=True)
+    (tmp_path / "data.jsonl").write_text(text)
+    assert ak.array_equal(
+        ak.from_json(tmp_path / "data.jsonl", line_delimited=True, max_workers=4),
+        expected,
+    )
+    file = io.BytesIO(text.encode())
+    assert ak.array_equal(
+        ak.from_json(file, line_delimited=True, max_workers=4), expected
+    )
+    assert not file.closed
+
+    (tmp_path / "empty.jsonl").write_text("")
+    assert (
+        len(ak.from_json(tmp_path / "empty.jsonl", line_delimited=True, max_workers=4))
+        == 0
+    )
+    assert len(ak.from_json("", line_delimited=True, max_workers=4)) == 0
+
+
+def test_chunks(small_chunks):
+    # each line is its own chunk, or there are fewer chunks than lines
+    assert ak.from_json(
+        "1\n2.5\n[3]", line_delimited=True, max_workers=8
+    ).to_list() == [
+        1,
+        2.5,
+        [3],
+    ]
+    assert (
+        ak.from_json("1\n" * 5000, line_delimited=True, max_workers=4).to_list()
+        == [1] * 5000
+    )
+    # the complex numbers are made after the chunks are concatenated
+    assert (
+        ak.from_json(
+            '{"r": 1, "i": 2}\n' * 1000,
+            line_delimited=True,
+            complex_record_fields=("r", "i"),
+            max_workers=2,
+        ).to_list()
+        == [1 + 2j] * 1000
+    )
+
+
+def test_errors(small_chunks):
+    with pytest.raises(ValueError, match="max_workers"):
+        ak.from_json(text, line_delimited=True, max_workers=0)
+    with pytest.raises(ValueError):
+        ak.from_json(text + "\n{", line_delimited=True, max_workers=4)
+    # without line_delimited, max_workers has no effect
+    assert ak.from_json("[1, 2]", max_workers=4).to_list() == [1, 2]
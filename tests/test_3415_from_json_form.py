@@ -0,0 +1,128 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+array = ak.Array(
+    [
+        {
+            "a": [[1, 2], [3]],
+            "b": None,
+            "s": "hé",
+            "t": (1, 2.5),
+            "r": [[1, 2]],
+            "o": None,
+            "e": [],
+        },
+        {
+            "a": [],
+            "b": 3.5,
+            "s": None,
+            "t": (2, 3.0),
+            "r": [[3, 4], [5, 6]],
+            "o": {"q": True},
+            "e": [],
+        },
+    ]
+)
+array = ak.with_field(array, ak.to_regular(array.r, axis=2), "r")
+array = ak.with_field(array, ak.values_astype(array.t, np.float32), "t")
+array = ak.with_parameter(array, "p", 1)
+
+
+@pytest.mark.parametrize("line_delimited", [False, True])
+def test_round_trip(line_delimited):
+    text = ak.to_json(array, line_delimited=line_delimited)
+    for form in [
+        array.layout.form,
+        array.layout.form.to_dict(),
+        array.layout.form.to_json(),
+    ]:
+        result = ak.from_json(text, line_delimited=line_delimited, form=form)
+        assert result.type == array.type
+        assert result.to_list() == array.to_list()
+
+
+def test_same_as_without_form():
+    before = ak.from_json('[{"x": 1.1, "y": [1]}, {"x": 2.2, "y": [1, 2]}]')
+    text = '[{"x": 3.3, "y": []}, {"z": 5, "y": [3], "x": 4}]'
+    result = ak.from_json(text, form=before.layout.form)
+    assert result.type.content == before.type.content
+    # keys that aren't in the form are ignored
+    assert result.to_list() == [{"x": 3.3, "y": []}, {"x": 4.0, "y": [3]}]
+    assert result.to_list() == ak.from_json(text)[["x", "y"]].to_list()
+
+
+def test_numbers():
+    assert ak.from_json("[1, 2]", form="int32").type == ak.types.ArrayType(
+        ak.types.NumpyType("int32"), 2
+    )
+    assert ak.from_json(
+        '[1, 2.5, "inf"]', form="float32", posinf_string="inf"
+    ).to_list() == [
+        1,
+        2.5,
+        np.inf,
+    ]
+    assert ak.from_json("[true, false]", form="bool").to_list() == [True, False]
+    numbers = ak.Array(np.arange(12, dtype=np.int16).reshape(2, 3, 2))
+    result = ak.from_json(ak.to_json(numbers), form=numbers.layout.form)
+    assert result.type == numbers.type
+    assert result.to_list() == numbers.to_list()
+    with pytest.raises(ValueError):
+        ak.from_json("[1.5]", form="int64")
+    assert ak.from_json("[127, -128]", form="int8").to_list() == [127, -128]
+    assert ak.from_json("[0, 255]", form="uint8").to_list() == [0, 255]
+    with pytest.raises(ValueError, match="300 is out of range for int8"):
+        ak.from_json("[100, 300]", form="int8")
+    with pytest.raises(ValueError, match="-1 is out of range for uint64"):
+        ak.from_json("[-1, 5]", form="uint64")
+    complex_form = ak.forms.RecordForm([ak.forms.NumpyForm("float64")] * 2, ["r", "i"])
+    assert ak.from_json(
+        '[{"r": 1, "i": 2}]', form=complex_form, complex_record_fields=("r", "i")
+    ).to_list() == [1 + 2j]
+
+
+def test_options_and_lists():
+    form = ak.Array([[1, None], None]).layout.form
+    result = ak.from_json("[[1, null], null, []]", form=form)
+    assert result.type.content == ak.Array([[1, None], None]).type.content
+    assert result.to_list() == [[1, None], None, []]
+
+    assert ak.from_json("[[], []]", form=ak.Array([[]]).layout.form).to_list() == [
+        [],
+        [],
+    ]
+    with pytest.raises(ValueError, match="EmptyForm"):
+        ak.from_json("[[1]]", form=ak.Array([[]]).layout.form)
+
+    categorical = ak.contents.IndexedArray(
+        ak.index.Index64(np.array([0, 0])), ak.to_layout(["x"])
+    )
+    assert ak.from_json('["a", "b"]', form=categorical.form).to_list() == ["a", "b"]
+
+    assert ak.from_json(
+        "[[1, 2], [3, 4]]\n[[5, 6]]",
+        form=ak.to_regular([[[1, 2]]], axis=2).layout.form,
+        line_delimited=True,
+        max_workers=2,
+    ).to_list() == [[[1, 2], [3, 4]], [[5, 6]]]
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="only one"):
+        ak.from_json(
+            "[]", schema={"type": "array", "items": {"type": "integer"}}, form="int64"
+        )
+    with pytest.raises(TypeError, match="'form' argument"):
+        ak.from_json("[]", form=3)
+    with pytest.raises(NotImplementedError):
+        ak.from_json("[]", form=ak.Array([1, "two"]).layout.form)
+    with pytest.raises(TypeError, match="cannot read JSON"):
+        ak.from_json("[]", form="complex128")
+    with pytest.raises(TypeError, match="cannot read JSON"):
+        ak.from_json("[]", form="datetime64[s]")
@@ -0,0 +1,120 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import gc
+
+import numpy as np
+
+import awkward as ak
+
+
+def test_strings():
+    strings = ["one", "", "twö", "日本"]
+    array = ak.Array(strings)
+    assert array.to_list() == strings
+    assert array[[0, 1, 3]].to_list() == ["one", "", "日本"]
+    assert array[:2].to_list() == ["one", ""]
+    # invalid UTF-8 is decoded with surrogate escapes
+    invalid = ak.contents.ListOffsetArray(
+        ak.index.Index64(np.array([0, 1, 3])),
+        ak.contents.NumpyArray(
+            np.frombuffer(b"ax\xff", np.uint8), parameters={"__array__": "char"}
+        ),
+        parameters={"__array__": "string"},
+    )
+    assert invalid.to_list() == ["a", "x\udcff"]
+    assert ak.to_regular(ak.Array(["ab", "cd"]), axis=1).to_list() == ["ab", "cd"]
+
+    bytestrings = ak.Array([b"one", b"", b"\xff\x00"])
+    assert bytestrings.to_list() == [b"one", b"", b"\xff\x00"]
+    assert bytestrings.layout.to_json(convert_bytes=bytes.hex) == ["6f6e65", "", "ff00"]
+    regular = ak.to_regular(ak.Array([b"ab", b"cd"]), axis=1)
+    assert regular.to_list() == [b"ab", b"cd"]
+    assert regular.layout.to_json(convert_bytes=bytes.decode) == ["ab", "cd"]
+
+
+def test_lists():
+    array = ak.Array([[1.1, 2.2], [], [3.3]])
+    assert array.to_list() == [[1.1, 2.2], [], [3.3]]
+    assert array[::-1].to_list() == [[3.3], [], [1.1, 2.2]]
+    assert ak.to_regular(ak.Array(np.arange(6).reshape(3, 2)), axis=1).to_list() == [
+        [0, 1],
+        [2, 3],
+        [4, 5],
+    ]
+    assert ak.to_regular(ak.Array([[], []]), axis=1).to_list() == [[], []]
+
+
+def test_options():
+    index = ak.contents.IndexedOptionArray(
+        ak.index.Index64(np.array([2, -1, -1, 0, 1, -1])),
+        ak.contents.NumpyArray(np.array([1, 2, 3])),
+    )
+    assert index.to_list() == [3, None, None, 1, 2, None]
+    bytemasked = ak.contents.ByteMaskedArray(
+        ak.index.Index8(np.array([1, 0, 1], np.int8)),
+        ak.contents.NumpyArray(np.array([1, 2, 3])),
+        valid_when=False,
+    )
+    assert bytemasked.to_list() == [None, 2, None]
+    bitmasked = ak.contents.BitMaskedArray(
+        ak.index.IndexU8(np.array([0b101], np.uint8)),
+        ak.contents.NumpyArray(np.array([1, 2, 3, 4])),
+        valid_when=True,
+        length=3,
+        lsb_order=True,
+    )
+    assert bitmasked.to_list() == [1, None, 3]
+
+
+def test_records():
+    array = ak.Array([{"x": 1, "y": [1]}, {"x": 2, "y": []}])
+    assert array.to_list() == [{"x": 1, "y": [1]}, {"x": 2, "y": []}]
+    assert array[1].to_list() == {"x": 2, "y": []}
+    assert ak.Array([(1, "a"), (2, "b")]).to_list() == [(1, "a"), (2, "b")]
+    assert ak.Array([(1, "a")]).layout.to_json() == [{"0": 1, "1": "a"}]
+    # records without fields still have a length
+    assert ak.contents.RecordArray([], [], length=3).to_list() == [{}, {}, {}]
+    assert ak.contents.RecordArray([], None, length=2).to_list() == [(), ()]
+    # contents that are longer than the records
+    record = ak.contents.RecordArray(
+        [ak.contents.NumpyArray(np.arange(5))], ["x"], length=2
+    )
+    assert record._to_list(None, None) == [{"x": 0}, {"x": 1}]
+
+
+def test_garbage_collector():
+    array = ak.Array([[1, 2], [3]])
+    assert gc.isenabled()
+    array.to_list()
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        array.to_list()
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_garbage_collector_in_user_code():
+    # the collector is not paused while an overloaded __getitem__ runs
+    enabled = []
+
+    class Point(ak.Record):
+        def __getitem__(self, where):
+            enabled.append(gc.isenabled())
+            return super().__getitem__(where)
+
+    behavior = {"point": Point}
+    array = ak.Array(
+        [[{"x": 1, "y": 2}], [], [{"x": 3, "y": 4}]],
+        with_name="point",
+        behavior=behavior,
+    )
+    expected = [[{"x": 1, "y": 2}], [], [{"x": 3, "y": 4}]]
+    assert array.to_list() == expected
+    assert array[0, 0].to_list() == expected[0][0]
+    assert ak.to_json(array) == '[[{"x":1,"y":2}],[],[{"x":3,"y":4}]]'
+    assert enabled and all(enabled)
+    assert gc.isenabled()
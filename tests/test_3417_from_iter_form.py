@@ -0,0 +1,111 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward/blob/main/LICENSE
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import awkward as ak
+
+data = [
+    {"x": 1.1, "y": [1, 2], "s": "one", "o": None, "t": (1, b"a"), "r": {"z": [[1]]}},
+    {"x": 2.2, "y": [], "s": "twö", "o": 3, "t": (2, b""), "r": None},
+    {"x": 3.3, "y": [3], "s": "", "o": None, "t": (3, b"c"), "r": {"z": []}},
+]
+
+
+def test_same_as_without_form():
+    expected = ak.from_iter(data)
+    for form in [
+        expected.layout.form,
+        expected.layout.form.to_dict(),
+        expected.layout.form.to_json(),
+    ]:
+        result = ak.from_iter(data, form=form)
+        assert result.type == expected.type
+        assert result.to_list() == expected.to_list()
+    assert ak.from_iter(iter(data), form=expected.layout.form).to_list() == data
+    assert ak.from_iter([], form=expected.layout.form).to_list() == []
+    record = ak.from_iter(data[0], form=expected.layout.form)
+    assert isinstance(record, ak.Record)
+    assert record.to_list() == data[0]
+
+
+def test_types():
+    form = ak.forms.from_type(
+        ak.types.from_datashape(
+            '{x: float32, y: 2 * int16, z: ?string, w: 3 * ?bool, v: [bytes, parameters={"p": 1}]}',
+            highlevel=False,
+        )
+    )
+    items = [
+        {"x": 1.5, "y": [1, 2], "z": "a", "w": [True, None, False], "v": b"x"},
+        {"x": 2, "y": (3, 4), "z": None, "w": [None] * 3, "v": b"", "extra": 1},
+    ]
+    result = ak.from_iter(items, form=form)
+    assert result.type == ak.types.ArrayType(form.type, 2)
+    assert result.to_list() == [
+        {"x": 1.5, "y": [1, 2], "z": "a", "w": [True, None, False], "v": b"x"},
+        {"x": 2.0, "y": [3, 4], "z": None, "w": [None] * 3, "v": b""},
+    ]
+
+    numbers = ak.from_iter(
+        np.arange(6).reshape(3, 2), form=ak.forms.NumpyForm("int8", (2,))
+    )
+    assert str(numbers.type) == "3 * 2 * int8"
+    assert numbers.to_list() == [[0, 1], [2, 3], [4, 5]]
+    assert ak.from_iter([1 + 1j], form="complex128").to_list() == [1 + 1j]
+    assert ak.from_iter([[], []], form=ak.Array([[]]).layout.form).to_list() == [[], []]
+    # conversions that keep the values are allowed
+    assert ak.from_iter([0, 255], form="uint8").to_list() == [0, 255]
+    assert ak.from_iter([1, 2.5], form="float32").to_list() == [1.0, 2.5]
+    assert ak.from_iter([True, 2], form="int64").to_list() == [1, 2]
+
+
+def test_errors():
+    form = ak.Array([{"x": 1, "y": [1.1]}]).layout.form
+    with pytest.raises(ValueError, match="field 'y'"):
+        ak.from_iter([{"x": 1}], form=form)
+    with pytest.raises(ValueError, match="None"):
+        ak.from_iter([{"x": None, "y": []}], form=form)
+    with pytest.raises(TypeError, match="sized"):
+        ak.from_iter([{"x": 1, "y": 1.1}], form=form)
+    with pytest.raises(ValueError, match="field 'x'"):
+        ak.from_iter([{"x": 1, "y": []}, 5], form=form)
+    with pytest.raises(ValueError, match="field 'x'"):
+        ak.from_iter([[1, 2]], form=form)
+    lists = ak.Array([[1]]).layout.form
+    with pytest.raises(TypeError, match="can't be str"):
+        ak.from_iter(["12", "3"], form=lists)
+    with pytest.raises(TypeError, match="can't be bytes"):
+        ak.from_iter([b"12"], form=lists)
+    with pytest.raises(TypeError, match="can't be dict"):
+        ak.from_iter([{1: 2}], form=lists)
+    with pytest.raises(ValueError, match="length 2"):
+        ak.from_iter([[1, 2, 3]], form=ak.to_regular([[1, 2]]).layout.form)
+    with pytest.raises(ValueError, match="shape"):
+        ak.from_iter([[1, 2, 3]], form=ak.forms.NumpyForm("int64", (2,)))
+    with pytest.raises(TypeError, match="must be str"):
+        ak.from_iter([1], form=ak.Array(["a"]).layout.form)
+    with pytest.raises(TypeError, match="must be bytes"):
+        ak.from_iter(["a"], form=ak.Array([b"a"]).layout.form)
+    with pytest.raises(ValueError, match="not float64"):
+        ak.from_iter([1.7, 2.2], form="int64")
+    with pytest.raises(ValueError, match="must be numbers"):
+        ak.from_iter(["12", "3"], form="int64")
+    with pytest.raises(ValueError, match="not int64"):
+        ak.from_iter([2, 0], form="bool")
+    with pytest.raises(ValueError, match="300 is out of range"):
+        ak.from_iter([1, 300], form="int8")
+    with pytest.raises(ValueError, match="-1 is out of range"):
+        ak.from_iter([-1], form="uint64")
+    with pytest.raises(ValueError, match="must be numbers"):
+        ak.from_iter([{"x": 1}], form="float64")
+    with pytest.raises(ValueError, match="must be numbers"):
+        ak.from_iter([2**70], form="int64")
+    with pytest.raises(ValueError, match="unknown type"):
+        ak.from_iter([[1]], form=ak.Array([[]]).layout.form)
+    with pytest.raises(NotImplementedError):
+        ak.from_iter([1, "a"], form=ak.Array([1, "a"]).layout.form)
+    with pytest.raises(TypeError, match="'form' argument"):
+        ak.from_iter([1], form=1)